@@ -0,0 +1,260 @@
+"""
+Scaling benchmarks for bumplot.
+
+Times each stage of a bump chart separately (ranking, Bézier geometry,
+artist creation from a precomputed geometry) plus end-to-end `savefig()` to
+PNG and SVG, on synthetic data over a grid of series and period counts, for
+the pandas and Polars backends.
+
+Two peak memory figures are recorded for each measurement:
+
+- `peak_mib`: as seen by `tracemalloc`, i.e. allocations made through Python
+  and NumPy only. Buffers allocated natively (e.g. by Polars, in Rust) are
+  missing, so it isn't comparable between backends.
+- `peak_rss_mib`: growth of the peak resident set size, measured in a fresh
+  process, which includes every allocation. It is `null` on platforms other
+  than Linux.
+
+Usage:
+
+    uv run python benchmarks/bench.py --output results.json
+    uv run python benchmarks/bench.py --compare old.json new.json
+
+Results are stored as JSON (one record per stage, backend and size) with
+the bumplot version and environment, so runs from different releases can
+be compared with `--compare`.
+"""
+
+import argparse
+import io
+import json
+import multiprocessing
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+import numpy as np  # noqa: E402
+
+import bumplot  # noqa: E402
+from bumplot._utils import _encode_x, _rank_matrix  # noqa: E402
+from bumplot.bezier import bezier_curves, sample_curves  # noqa: E402
+
+SERIES = [10, 100, 1_000]
+PERIODS = [10, 100, 500]
+BACKENDS = ["pandas", "polars"]
+
+
+def make_data(backend: str, n_series: int, n_periods: int, seed: int = 0) -> Any:
+    """Wide frame with an `x` column and `n_series` random float columns."""
+    rng = np.random.default_rng(seed)
+    data = {"x": np.arange(n_periods)}
+    data.update(
+        {f"s{i}": rng.random(n_periods) for i in range(n_series)},
+    )
+    if backend == "pandas":
+        import pandas as pd
+
+        return pd.DataFrame(data)
+    import polars as pl
+
+    return pl.DataFrame(data)
+
+
+def measure(func: Callable[[], Any], repeat: int) -> dict[str, float]:
+    """Best and median wall time over `repeat` runs, plus peak memory of one."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "best_s": min(times),
+        "median_s": statistics.median(times),
+        "peak_mib": peak / 2**20,
+    }
+
+
+def peak_rss(backend: str, n_series: int, n_periods: int, stage: str) -> float | None:
+    """
+    Growth of the peak resident set size while running `stage` once, in MiB.
+
+    The stage runs in a fresh process, since memory freed by earlier runs
+    stays resident and would hide the growth. The peak is reset through
+    `/proc` once the data is ready, so this is `None` on platforms other than
+    Linux.
+    """
+    if not os.path.exists("/proc/self/clear_refs"):
+        return None
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        return executor.submit(
+            _peak_rss_child, backend, n_series, n_periods, stage
+        ).result()
+
+
+def _peak_rss_child(backend: str, n_series: int, n_periods: int, stage: str) -> float:
+    df = make_data(backend, n_series, n_periods)
+    func = stages(df, [f"s{i}" for i in range(n_series)])[stage]
+    with open("/proc/self/clear_refs", "w") as f:
+        f.write("5")
+    before = _status_kib("VmHWM")
+    func()
+    return max(_status_kib("VmHWM") - before, 0) / 2**10
+
+
+def _status_kib(field: str) -> int:
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith(f"{field}:"):
+                return int(line.split()[1])
+    raise KeyError(field)
+
+
+def stages(df: Any, names: list[str]) -> dict[str, Callable[[], Any]]:
+    """The benchmarked stages, each as a zero-argument callable."""
+    x_raw, ranks = _rank_matrix(df, "x", names)
+    x_values, _ = _encode_x(x_raw)
+    vertices, _ = bezier_curves(x_values, ranks, force=1)
+    geometry = bumplot.compute_bump_geometry("x", names, df)
+
+    def render() -> None:
+        # Artist creation alone: ranking and geometry are already done
+        fig, ax = plt.subplots()
+        bumplot.render_geometry(ax, geometry)
+        plt.close(fig)
+
+    def savefig(fmt: str) -> Callable[[], None]:
+        def run() -> None:
+            fig, ax = plt.subplots()
+            bumplot.bumplot("x", names, df, ax=ax)
+            fig.savefig(io.BytesIO(), format=fmt)
+            plt.close(fig)
+
+        return run
+
+    return {
+        "rank_numpy": lambda: _rank_matrix(df, "x", names, engine="numpy"),
+        "rank_narwhals": lambda: _rank_matrix(df, "x", names, engine="narwhals"),
+        "rank_chunked": lambda: _rank_matrix(
+            df, "x", names, chunk_size=max(len(x_raw) // 8, 1)
+        ),
+        "geometry": lambda: bezier_curves(x_values, ranks, force=1),
+        "sample": lambda: sample_curves(vertices),
+        "render": render,
+        "savefig_png": savefig("png"),
+        "savefig_svg": savefig("svg"),
+    }
+
+
+def run(
+    series: list[int], periods: list[int], backends: list[str], repeat: int
+) -> dict[str, Any]:
+    records = []
+    for backend in backends:
+        for n_series in series:
+            for n_periods in periods:
+                df = make_data(backend, n_series, n_periods)
+                names = [f"s{i}" for i in range(n_series)]
+                for stage, func in stages(df, names).items():
+                    record = {
+                        "stage": stage,
+                        "backend": backend,
+                        "n_series": n_series,
+                        "n_periods": n_periods,
+                        **measure(func, repeat),
+                        "peak_rss_mib": peak_rss(backend, n_series, n_periods, stage),
+                    }
+                    records.append(record)
+                    print(_format(record), file=sys.stderr)
+
+    return {
+        "bumplot": bumplot.__version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "matplotlib": matplotlib.__version__,
+        "numpy": np.__version__,
+        "records": records,
+    }
+
+
+def compare(old_path: str, new_path: str, threshold: float = 1.1) -> int:
+    """Print the time ratio of each record, return 1 if any regressed."""
+    with open(old_path) as f:
+        old = json.load(f)
+    with open(new_path) as f:
+        new = json.load(f)
+
+    def key(record: dict[str, Any]) -> tuple:
+        return (
+            record["stage"],
+            record["backend"],
+            record["n_series"],
+            record["n_periods"],
+        )
+
+    old_records = {key(r): r for r in old["records"]}
+    regressed = False
+    print(f"{old['bumplot']} -> {new['bumplot']}")
+    for record in new["records"]:
+        previous = old_records.get(key(record))
+        if previous is None:
+            continue
+        ratio = record["best_s"] / previous["best_s"]
+        flag = " REGRESSION" if ratio > threshold else ""
+        regressed |= ratio > threshold
+        print(f"{_format(record)}  x{ratio:.2f}{flag}")
+    return int(regressed)
+
+
+def _format(record: dict[str, Any]) -> str:
+    return (
+        f"{record['stage']:<14} {record['backend']:<7} "
+        f"{record['n_series']:>6} series {record['n_periods']:>5} periods  "
+        f"{record['best_s'] * 1e3:10.2f} ms  {record['peak_mib']:8.2f} MiB"
+        f"  {_mib(record.get('peak_rss_mib'))} MiB RSS"
+    )
+
+
+def _mib(value: float | None) -> str:
+    return "     n/a" if value is None else f"{value:8.2f}"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--series", type=int, nargs="+", default=SERIES)
+    parser.add_argument("--periods", type=int, nargs="+", default=PERIODS)
+    parser.add_argument("--backends", nargs="+", default=BACKENDS)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="JSON file to write the results to")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"))
+    args = parser.parse_args()
+
+    if args.compare:
+        return compare(*args.compare)
+
+    results = run(args.series, args.periods, args.backends, args.repeat)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,68 @@
-from .main import bumplot
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+# Lightweight, and `opts` must shadow the `bumplot.opts` submodule
 from .opts import opts, opts_from_color
+from .profiling import profile
+
+if TYPE_CHECKING:
+    from .main import bumplot
+    from .long import bumplot_long
+    from .incremental import BumpPlot
+    from .animation import animate
+    from .cache import BumpCache
+    from .render import render_many
+    from .facets import facet
+    from .geometry import BumpGeometry, compute_bump_geometry, render_geometry
+    from .svg import to_json, to_svg
+    from .interact import BumpIndex
 
 __version__ = "0.2.1"
-__all__ = ["bumplot", "opts", "opts_from_color"]
+__all__ = [
+    "bumplot",
+    "bumplot_long",
+    "BumpPlot",
+    "animate",
+    "BumpCache",
+    "render_many",
+    "facet",
+    "BumpGeometry",
+    "compute_bump_geometry",
+    "render_geometry",
+    "to_svg",
+    "to_json",
+    "BumpIndex",
+    "opts",
+    "opts_from_color",
+    "profile",
+]
+
+# Public names are imported on first access, so that `import bumplot` (or
+# `bumplot.bezier`) doesn't pay for matplotlib.pyplot and narwhals upfront
+_submodules = {
+    "bumplot": ".main",
+    "bumplot_long": ".long",
+    "BumpPlot": ".incremental",
+    "animate": ".animation",
+    "BumpCache": ".cache",
+    "render_many": ".render",
+    "facet": ".facets",
+    "BumpGeometry": ".geometry",
+    "compute_bump_geometry": ".geometry",
+    "render_geometry": ".geometry",
+    "to_svg": ".svg",
+    "to_json": ".svg",
+    "BumpIndex": ".interact",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _submodules:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_submodules[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
@@ -1,16 +1,83 @@
+from concurrent.futures import ThreadPoolExecutor
+import contextvars
+from importlib.util import find_spec
+import os
+import threading
+from typing import Any, Literal
+
 import narwhals as nw
-from narwhals.typing import IntoDataFrame
+from narwhals.typing import IntoFrame
+import numpy as np
+
+from .profiling import _stage
+
+RankEngine = Literal["numpy", "narwhals"]
+
+
+def _collect(frame: nw.DataFrame | nw.LazyFrame) -> nw.DataFrame:
+    """
+    Collect a narwhals frame if it is lazy, return it unchanged otherwise.
+
+    Lazy backends such as DuckDB collect into PyArrow tables by default, which
+    support neither `pivot()` nor `rank().over()`: they are collected into
+    Polars (or pandas) instead, when installed.
+    """
+    if not isinstance(frame, nw.LazyFrame):
+        return frame
+    implementation = frame.implementation
+    if implementation.is_polars() or implementation.is_dask():
+        return frame.collect()
+    return frame.collect(backend=_eager_backend())
+
+
+def _eager_backend() -> Literal["polars", "pandas"] | None:
+    """The first installed eager backend supporting every ranking operation."""
+    for backend in ("polars", "pandas"):
+        if find_spec(backend) is not None:
+            return backend
+    return None
+
+
+def _decimals_to_float(frame: nw.DataFrame, columns: list[str]) -> nw.DataFrame:
+    """
+    Cast the Decimal columns among `columns` to Float64, so that they can be
+    ranked with NumPy rather than as Python objects.
+    """
+    schema = frame.schema
+    decimals = [c for c in columns if schema[c] == nw.Decimal]
+    if not decimals:
+        return frame
+    return frame.with_columns(nw.col(decimals).cast(nw.Float64))
 
 
-def _ranked_df(df: IntoDataFrame, x: str, y_columns: list[str]):
+def _rank_expr(
+    frame: nw.DataFrame | nw.LazyFrame, column: str, over: str | list[str]
+) -> nw.Expr:
+    """
+    Descending ordinal ranks of `column` within each group of `over`. NaN
+    values are missing, like nulls, as they are for `_rank_periods()`.
+    """
+    value = nw.col(column)
+    if frame.collect_schema()[column].is_float():
+        value = value.fill_nan(None)
+    return value.rank("ordinal", descending=True).over(over)
+
+
+def _ranked_df(df: IntoFrame, x: str | list[str], y_columns: list[str]):
     """
     Convert a dataframe to a ranked version of it.
+
+    `x` can also be a list of columns (e.g. `[group, x]`), in which case the
+    ranking is done over each combination of their values.
+
+    Lazy frames are projected and ranked lazily, and collected only once
+    before the final pivot.
     """
     df_native = nw.from_native(df).select(nw.col(x), nw.col(y_columns))
+    unpivoted = df_native.unpivot(on=y_columns, index=x)
 
     df_native_ranked = (
-        df_native.unpivot(on=y_columns, index=x)
-        .with_columns(nw.col("value").rank("ordinal", descending=True).over(x))
+        _collect(unpivoted.with_columns(_rank_expr(unpivoted, "value", over=x)))
         .pivot(on="variable", index=x, values="value")
         .select(nw.col(x), nw.col(y_columns))
     )
@@ -18,6 +85,415 @@ def _ranked_df(df: IntoDataFrame, x: str, y_columns: list[str]):
     return df_native_ranked
 
 
+def _to_matrix(df: nw.DataFrame, columns: list[str]) -> np.ndarray:
+    """
+    Extract `columns` as one C-contiguous `(n_columns, n_rows)` block, so that
+    each column is a contiguous row view into it.
+
+    Backends hand out column-major (Fortran-ordered) arrays, often without
+    copying (e.g. a consolidated pandas block), in which case this is
+    zero-copy. Otherwise the data is copied exactly once.
+    """
+    return np.ascontiguousarray(df.select(columns).to_numpy().T)
+
+
+def _value_matrix(df: nw.DataFrame, y_columns: list[str]) -> np.ndarray:
+    """
+    `_to_matrix()` of the y columns. If they come out as Python objects,
+    Decimal columns are cast to Float64 and the block is extracted again,
+    so the schema (slow on wide pandas frames) is only read then.
+    """
+    values = _to_matrix(df, y_columns)
+    if values.dtype.kind == "O":
+        cast = _decimals_to_float(df, y_columns)
+        if cast is not df:
+            values = _to_matrix(cast, y_columns)
+    return values
+
+
+def _rank_periods(values: np.ndarray) -> np.ndarray:
+    """
+    Ordinal, descending ranks (starting at 1) of each column of a
+    `(n_series, n_periods)` array, i.e. of the series at each period.
+
+    Ties are broken by series order, like `rank("ordinal")` does with the
+    order of appearance of the unpivoted values. NaN values are missing:
+    they are ranked after every present value and get a NaN rank, so the
+    ranks are floats when there are any.
+    """
+    n_series, n_periods = values.shape
+    order = np.argsort(-values, axis=0, kind="stable")
+    missing = np.isnan(values) if values.dtype.kind == "f" else None
+    dtype = float if missing is not None and missing.any() else np.int64
+    ranks = np.empty((n_series, n_periods), dtype=dtype)
+    np.put_along_axis(
+        ranks,
+        order,
+        np.broadcast_to(np.arange(1, n_series + 1)[:, np.newaxis], order.shape),
+        axis=0,
+    )
+    if dtype is float:
+        ranks[missing] = np.nan
+    return ranks
+
+
+def _rankable(values: np.ndarray) -> bool:
+    """Whether `_rank_periods()` can rank `values` exactly."""
+    # Negating unsigned integers wraps around, and 64-bit ones can't be safely
+    # upcast to a signed type
+    return values.dtype.kind in "fi" or (
+        values.dtype.kind == "u" and values.dtype.itemsize < 8
+    )
+
+
+def _rank_matrix(
+    df: IntoFrame,
+    x: str,
+    y_columns: list[str],
+    engine: RankEngine = "numpy",
+    chunk_size: int | None = None,
+    workers: int | None = None,
+    values: np.ndarray | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Rank the `y_columns` of a dataframe at each value of `x`.
+
+    Eager and lazy frames are both accepted. Lazy frames are collected
+    exactly once, after selecting only `x` and `y_columns`.
+
+    With the `"numpy"` engine, the y columns are pulled once as a 2D array
+    and each period is ranked with a stable argsort. Missing values (nulls
+    and NaN) get a NaN rank, see `_rank_periods()`. Columns that can't be
+    ranked exactly this way (e.g. non-numeric ones) fall back to the
+    `"narwhals"` engine.
+
+    Without a `chunk_size`, the `"numpy"` engine can also be given the y
+    columns as `values`, already extracted from `df` with `_value_matrix()`
+    (e.g. to fingerprint them), so that they aren't extracted twice.
+
+    With a `chunk_size`, periods are ranked in blocks of that many rows
+    instead, see `_rank_chunked()`.
+
+    Whatever the engine, periods are then ordered by `_sort_periods()`.
+
+    Returns:
+        x_values: The x values, shape `(n_periods,)`.
+        ranks: The C-contiguous rank matrix, shape `(n_series, n_periods)`.
+    """
+    if chunk_size is not None:
+        x_values, ranks = _rank_chunked(df, x, y_columns, engine, chunk_size, workers)
+    else:
+        index, ranks = _rank_frame(df, [x], y_columns, engine, values)
+        x_values = index.get_column(x).to_numpy()
+    return _sort_periods(x_values, ranks, x)
+
+
+def _sort_periods(
+    x_values: np.ndarray, ranks: np.ndarray, x: str
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Order periods by x for numeric and temporal x values, like
+    `_rank_long()`, and keep their order otherwise. The rank matrix is only
+    copied when the periods aren't sorted yet.
+
+    Raises:
+        ValueError: If an x value appears more than once, since each period
+            must be a single row.
+    """
+    if x_values.dtype.kind in "iufmM":
+        if len(x_values) > 1 and not (x_values[1:] >= x_values[:-1]).all():
+            order = np.argsort(x_values, kind="stable")
+            x_values, ranks = x_values[order], np.take(ranks, order, axis=1)
+        duplicated = bool((x_values[1:] == x_values[:-1]).any())
+    else:
+        try:
+            duplicated = len(np.unique(x_values)) != len(x_values)
+        except TypeError:
+            # Values that can't be sorted together, e.g. strings and None
+            duplicated = len(set(x_values.tolist())) != len(x_values)
+    if duplicated:
+        raise ValueError(f"Each value of {x!r} must appear at most once in the data.")
+    return x_values, ranks
+
+
+def _rank_chunked(
+    df: IntoFrame,
+    x: str,
+    y_columns: list[str],
+    engine: RankEngine,
+    chunk_size: int,
+    workers: int | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Rank blocks of `chunk_size` periods (rows) concurrently on a thread pool,
+    writing each block into a preallocated rank matrix.
+
+    Only one block per worker is converted and ranked at a time, so the
+    memory used on top of the data is bounded by `chunk_size`, not by the
+    number of periods. Each period must be a single row, as in wide data.
+
+    Returns:
+        Same as `_rank_matrix()`, with periods in the order of the blocks
+        (and, with the `"narwhals"` engine, in the order the backend returns
+        within each block) until `_rank_matrix()` sorts them.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1.")
+
+    with _stage("collect"):
+        frame = _collect(nw.from_native(df).select(x, *y_columns))
+    n_periods = len(frame)
+    # Blocks holding missing values are ranked as floats: the matrix is then
+    # upcast once, under the lock every block is written with
+    ranks = {"matrix": np.empty((len(y_columns), n_periods), dtype=np.int64)}
+    lock = threading.Lock()
+
+    def rank_block(start: int) -> np.ndarray:
+        index, block = _rank_frame(
+            frame[start : start + chunk_size], [x], y_columns, engine
+        )
+        with lock:
+            if block.dtype.kind == "f" and ranks["matrix"].dtype.kind != "f":
+                ranks["matrix"] = ranks["matrix"].astype(float)
+            ranks["matrix"][:, start : start + block.shape[1]] = block
+        return index.get_column(x).to_numpy()
+
+    with _stage("rank_chunks") as stage:
+        # Each block runs in a copy of this context, so that an active
+        # `profile()` also records the stages of every block
+        context = contextvars.copy_context()
+        with ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 1) as pool:
+            x_blocks = list(
+                pool.map(
+                    lambda start: context.copy().run(rank_block, start),
+                    range(0, n_periods, chunk_size),
+                )
+            )
+        stage.size = ranks["matrix"].size
+
+    if not x_blocks:
+        return frame.get_column(x).to_numpy(), ranks["matrix"]
+    return np.concatenate(x_blocks), ranks["matrix"]
+
+
+def _rank_groups(
+    df: IntoFrame,
+    x: str,
+    y_columns: list[str],
+    by: str,
+    engine: RankEngine = "numpy",
+) -> list[tuple[Any, np.ndarray, np.ndarray]]:
+    """
+    Rank the `y_columns` of a dataframe at each value of `x`, within each
+    group of `by`, in a single pass over the whole frame.
+
+    Returns:
+        One `(group, x_values, ranks)` tuple per group, in order of first
+        appearance, like `_rank_matrix()` would return for that group alone
+        (periods are ordered by `_sort_periods()` within each group).
+    """
+    index, ranks = _rank_frame(df, [by, x], y_columns, engine)
+    groups = index.get_column(by).to_numpy()
+    x_values = index.get_column(x).to_numpy()
+
+    uniques, first, codes = np.unique(groups, return_index=True, return_inverse=True)
+    order = np.argsort(codes, kind="stable")
+    bounds = np.cumsum(np.bincount(codes, minlength=len(uniques)))[:-1]
+    rows_by_group = np.split(order, bounds)
+    return [
+        (
+            uniques[g],
+            *_sort_periods(x_values[rows_by_group[g]], ranks[:, rows_by_group[g]], x),
+        )
+        for g in np.argsort(first, kind="stable")
+    ]
+
+
+def _rank_frame(
+    df: IntoFrame,
+    index: list[str],
+    y_columns: list[str],
+    engine: RankEngine,
+    values: np.ndarray | None = None,
+) -> tuple[nw.DataFrame, np.ndarray]:
+    """
+    Rank the `y_columns` over each combination of the `index` columns, see
+    `_rank_matrix()` for `values`.
+
+    Returns:
+        index: An eager frame with the `index` columns, one row per period.
+        ranks: The C-contiguous rank matrix, shape `(n_series, n_periods)`.
+    """
+    if engine not in ("numpy", "narwhals"):
+        raise ValueError(
+            f"engine must be either 'numpy' or 'narwhals', not {engine!r}."
+        )
+
+    if engine == "numpy":
+        # Only the projection is collected, so lazy backends can push it down
+        # to the scan. A fallback then ranks this collected frame. Selecting
+        # by name is much faster than with expressions on wide pandas frames.
+        with _stage("collect"):
+            df = _collect(nw.from_native(df).select(*index, *y_columns))
+        if values is None:
+            with _stage("to_numpy") as stage:
+                values = _value_matrix(df, y_columns)
+                stage.size = values.size
+        if _rankable(values):
+            with _stage("rank") as stage:
+                ranks = _rank_periods(values)
+                stage.size = ranks.size
+            return df.select(index), ranks
+
+    with _stage("rank"):
+        ranked = _ranked_df(df, x=index, y_columns=y_columns)
+    with _stage("to_numpy") as stage:
+        ranks = _to_matrix(ranked, y_columns)
+        stage.size = ranks.size
+    return ranked.select(index), ranks
+
+
+def _factorize(values: np.ndarray, sort: bool = False) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Encode values as integer codes, without any Python-level loop.
+
+    Args:
+        values: The values to encode.
+        sort: Whether codes follow the sorted order of the values rather than
+            their order of first appearance.
+
+    Returns:
+        uniques: The distinct values, in code order.
+        codes: The code of each value, such that `uniques[codes] == values`.
+    """
+    uniques, first, inverse = np.unique(values, return_index=True, return_inverse=True)
+    if sort:
+        return uniques, inverse.ravel()
+    order = np.argsort(first, kind="stable")
+    remap = np.empty_like(order)
+    remap[order] = np.arange(len(order))
+    return uniques[order], remap[inverse.ravel()]
+
+
+def _rank_long(
+    df: IntoFrame,
+    x: str,
+    entity: str,
+    value: str,
+    entities: list[str] | None = None,
+    engine: RankEngine = "numpy",
+) -> tuple[np.ndarray, list[Any], np.ndarray]:
+    """
+    Rank a long (tidy) dataframe with one row per `(x, entity)` pair, ranking
+    `value` across entities at each `x`, without ever building a wide frame.
+
+    The `(n_entities, n_periods)` rank matrix is filled with a single scatter
+    into a preallocated array. Periods follow the sorted order of `x` for
+    numeric and temporal values, and their order of first appearance
+    otherwise. Cells for entities missing at some period are NaN.
+
+    Args:
+        df: A dataframe, eager or lazy.
+        x: colname of the periods.
+        entity: colname of the series identifiers.
+        value: colname of the values to rank.
+        entities: If given, only these entities are ranked (in this order).
+            Otherwise all entities are, in order of first appearance.
+        engine: `"numpy"` ranks with a stable lexsort, `"narwhals"` with
+            `rank("ordinal").over(x)` in the backend.
+
+    Returns:
+        x_values: The periods, shape `(n_periods,)`.
+        entities: The entities, one per row of the rank matrix.
+        ranks: The rank matrix, shape `(n_entities, n_periods)`.
+    """
+    if engine not in ("numpy", "narwhals"):
+        raise ValueError(
+            f"engine must be either 'numpy' or 'narwhals', not {engine!r}."
+        )
+
+    frame = nw.from_native(df).select(nw.col(x), nw.col(entity), nw.col(value))
+    rank = _rank_expr(frame, value, over=x)
+    if entities is not None:
+        frame = frame.filter(nw.col(entity).is_in(entities))
+    if engine == "narwhals":
+        frame = frame.with_columns(rank)
+    frame = _decimals_to_float(_collect(frame), [value])
+
+    x_raw = frame.get_column(x).to_numpy()
+    x_values, x_codes = _factorize(x_raw, sort=x_raw.dtype.kind in "iufmM")
+    entity_values, entity_codes = _factorize(frame.get_column(entity).to_numpy())
+    if entities is None:
+        entities = entity_values.tolist()
+    else:
+        lookup = {name: i for i, name in enumerate(entities)}
+        positions = np.array([lookup[name] for name in entity_values.tolist()])
+        entity_codes = positions[entity_codes].astype(int)
+
+    cells = x_codes * len(entities) + entity_codes
+    if len(np.unique(cells)) != len(cells):
+        raise ValueError(
+            f"Each ({x!r}, {entity!r}) pair must appear at most once in the data."
+        )
+
+    values = frame.get_column(value).to_numpy()
+    if engine == "numpy" and _rankable(values):
+        # Sort by period, then by descending value: the position of a row
+        # within its period is its ordinal rank
+        order = np.lexsort((-values, x_codes))
+        starts = np.concatenate([[0], np.cumsum(np.bincount(x_codes))[:-1]])
+        ranks = np.empty(len(values), dtype=float)
+        ranks[order] = np.arange(len(order)) - starts[x_codes[order]] + 1
+        if values.dtype.kind == "f":
+            # NaN values sort last within their period, and are missing
+            ranks[np.isnan(values)] = np.nan
+    elif engine == "numpy":
+        ranks = frame.select(rank).get_column(value).to_numpy()
+    else:
+        ranks = values
+
+    matrix = np.full((len(entities), len(x_values)), np.nan)
+    matrix[entity_codes, x_codes] = np.asarray(ranks, dtype=float)
+    return x_values, entities, matrix
+
+
+def _encode_x(
+    x_values_raw: np.ndarray, categories: dict[Any, int] | None = None
+) -> tuple[np.ndarray, dict[Any, int] | None]:
+    """
+    Convert x values to numeric positions.
+
+    Numeric x values are used as is and `None` is returned as categories.
+    Otherwise (strings, dates, datetimes...) each distinct value gets the
+    next integer position, in order of first appearance. Passing the
+    `categories` of a previous call extends them (in place) with the new
+    values.
+
+    Values are factorized with NumPy, so Python only loops over the distinct
+    values, not over every x value.
+
+    Returns:
+        x_values: The numeric x positions.
+        categories: The mapping from x value to position, or `None`.
+    """
+    if np.issubdtype(x_values_raw.dtype, np.number):
+        return x_values_raw, None
+
+    mapping = {} if categories is None else categories
+    try:
+        uniques, codes = _factorize(x_values_raw)
+    except TypeError:
+        # Values that can't be sorted together, e.g. strings and None
+        for val in x_values_raw:
+            mapping.setdefault(val, len(mapping))
+        return np.array([mapping[val] for val in x_values_raw], dtype=int), mapping
+
+    positions = np.array(
+        [mapping.setdefault(val, len(mapping)) for val in uniques], dtype=int
+    )
+    return positions[codes], mapping
+
+
 def _to_ordinal(n: int) -> str:
     """Convert number to ordinal string (1 -> '1st', 2 -> '2nd', etc.)"""
     if 11 <= n % 100 <= 13:
@@ -0,0 +1,185 @@
+from collections.abc import Iterable
+from typing import Any
+
+import matplotlib as mpl
+from matplotlib.animation import FuncAnimation
+from matplotlib.artist import Artist
+from matplotlib.axes import Axes
+from matplotlib.path import Path
+
+import numpy as np
+
+from narwhals.typing import IntoFrame
+
+from .bezier import bezier_curves, gap_curves
+from ._utils import RankEngine, _encode_x, _rank_matrix
+from .main import (
+    _curve_paths,
+    _draw_artists,
+    _gca,
+    _resolve_kwargs,
+    _set_rank_ticks,
+    _set_x_ticks,
+)
+from .opts import BumpOpts
+
+
+def animate(
+    x: str,
+    y_columns: Iterable[str | tuple[str, BumpOpts]],
+    data: IntoFrame,
+    frames_per_period: int = 10,
+    curve_force: float = 1,
+    invert_y_axis: bool = True,
+    colors: Iterable[str] | None = None,
+    plot_kwargs: dict[str, Any] = {},
+    scatter_kwargs: dict[str, Any] = {},
+    ax: Axes | None = None,
+    ordinal_labels: bool = False,
+    engine: RankEngine = "numpy",
+    interval: float = 50,
+    blit: bool = True,
+    **animation_kwargs: Any,
+) -> FuncAnimation:
+    """
+    Creates an animated bump plot, where the curves grow from one period to
+    the next and the markers travel along them.
+
+    The position of every series at every frame is computed up front, as one
+    NumPy array, from the same Bézier geometry as
+    [`bumplot()`](./bumplot.md). Each frame then only writes into the vertex
+    and offset arrays of the existing artists.
+
+    Args:
+        x: colname of the x-axis variable
+        y_columns: colnames of the y-axis variables and their plotting options.
+        data: A dataframe, eager or lazy.
+        frames_per_period: Number of frames used to go from one x value to
+            the next.
+        curve_force: Smoothing factor controlling curve tightness.
+        invert_y_axis: Whether to invert y axis
+        colors: An optional list of colors
+        plot_kwargs: Additional arguments passed to `patches.PathPatch()`
+        scatter_kwargs: Additional arguments passed to `scatter()`
+        ax: The matplotlib Axes used. Default to `plt.gca()`
+        ordinal_labels: If True, converts y-axis labels to ordinal numbers
+        engine: How ranks are computed, see [`bumplot()`](./bumplot.md).
+        interval: Delay between frames in milliseconds.
+        blit: Whether to use blitting, so only the moving artists are redrawn.
+        animation_kwargs: Additional arguments passed to `FuncAnimation()`
+
+    Returns:
+        The matplotlib `FuncAnimation`.
+    """
+    if frames_per_period < 1:
+        raise ValueError("frames_per_period must be at least 1.")
+
+    _plot_ax: Axes = ax if ax is not None else _gca()
+    colors_iterable = (
+        colors
+        if colors is not None
+        else mpl.rcParams["axes.prop_cycle"].by_key()["color"]
+    )
+    y_bumps: list[tuple[str, BumpOpts]] = [
+        (y, BumpOpts()) if isinstance(y, str) else y for y in y_columns
+    ]
+    names = [name for name, _ in y_bumps]
+
+    x_values_raw, y_matrix = _rank_matrix(data, x=x, y_columns=names, engine=engine)
+    x_values, categories = _encode_x(x_values_raw)
+    if len(x_values) < 2:
+        raise ValueError("At least two x values are needed to animate.")
+    vertices, codes = bezier_curves(x=x_values, y=y_matrix, force=curve_force)
+    segments, partials = _trajectories(vertices, frames_per_period)
+
+    # Drawing the full geometry first sets the data limits of the whole animation
+    plot_kwargs_list, scatter_kwargs_list = _resolve_kwargs(
+        y_bumps, colors_iterable, plot_kwargs, scatter_kwargs
+    )
+    artists = _draw_artists(
+        _plot_ax,
+        names=names,
+        x_values=x_values,
+        y_matrix=y_matrix,
+        paths=_curve_paths(vertices, codes, y_matrix),
+        plot_kwargs_list=plot_kwargs_list,
+        scatter_kwargs_list=scatter_kwargs_list,
+    )
+    _set_rank_ticks(_plot_ax, len(names), invert_y_axis, ordinal_labels)
+    _set_x_ticks(_plot_ax, x_values, categories)
+
+    anchors = np.stack([np.broadcast_to(x_values, y_matrix.shape), y_matrix], axis=-1)
+    work = vertices.copy()
+    paths = [patch.get_path() for patch, _ in artists.values()]
+    gaps = bool(np.isnan(y_matrix).any())
+    moving: list[Artist] = [a for pair in artists.values() for a in pair]
+    state = {"segment": 0}
+
+    def update(frame: int) -> list[Artist]:
+        segment = segments[frame]
+        start = 3 * state["segment"]
+        work[:, start : start + 4] = vertices[:, start : start + 4]
+        work[:, 3 * segment : 3 * segment + 4] = partials[frame]
+        state["segment"] = segment
+
+        n_vertices = 3 * segment + 4
+        if gaps:
+            # Split at missing points like bumplot(), and drop their markers
+            frame_paths = gap_curves(work[:, :n_vertices])
+            for i, (patch, scatter) in enumerate(artists.values()):
+                patch.set_path(Path(*frame_paths[i]))
+                offsets = np.concatenate(
+                    [anchors[i, : segment + 1], partials[frame, i, 3:]]
+                )
+                scatter.set_offsets(offsets[~np.isnan(offsets).any(axis=1)])
+            return moving
+        for i, (path, (_, scatter)) in enumerate(zip(paths, artists.values())):
+            path.vertices = work[i, :n_vertices]
+            path.codes = codes[:n_vertices]
+            scatter.set_offsets(
+                np.concatenate([anchors[i, : segment + 1], partials[frame, i, 3:]])
+            )
+        return moving
+
+    return FuncAnimation(
+        _plot_ax.figure,
+        update,
+        frames=len(segments),
+        init_func=lambda: update(0),
+        interval=interval,
+        blit=blit,
+        **animation_kwargs,
+    )
+
+
+def _trajectories(
+    vertices: np.ndarray, frames_per_period: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Split every Bézier segment at each frame's position along it.
+
+    Args:
+        vertices: Vertices from `bezier_curves()`, shape
+            `(n_series, 3 * (n - 1) + 1, 2)`.
+        frames_per_period: Number of frames per segment.
+
+    Returns:
+        segments: Index of the segment being drawn at each frame.
+        partials: Control points of the drawn part of that segment, shape
+            `(n_frames, n_series, 4, 2)`. The last point is the position of
+            each series at that frame.
+    """
+    n_segments = (vertices.shape[1] - 1) // 3
+    frames = np.arange(n_segments * frames_per_period + 1)
+    segments = np.minimum(frames // frames_per_period, n_segments - 1)
+    t = (frames - segments * frames_per_period) / frames_per_period
+    t = t[:, np.newaxis, np.newaxis]
+
+    # De Casteljau split of each segment at t, for all frames and series at once
+    controls = vertices[:, 3 * segments[:, np.newaxis] + np.arange(4)]
+    p0, p1, p2, p3 = (controls[:, :, k].swapaxes(0, 1) for k in range(4))
+    p01, p12, p23 = p0 + t * (p1 - p0), p1 + t * (p2 - p1), p2 + t * (p3 - p2)
+    p012, p123 = p01 + t * (p12 - p01), p12 + t * (p23 - p12)
+    head = p012 + t * (p123 - p012)
+
+    return segments, np.stack([p0, p01, p012, head], axis=2)
@@ -1,5 +1,61 @@
 from matplotlib.path import Path
 import numpy as np
+from numpy.typing import DTypeLike
+
+
+def bezier_curves(
+    x: np.ndarray,
+    y: np.ndarray,
+    force: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Generate vertices and path codes for many smooth cubic Bézier curves
+    at once, all sharing the same x-coordinates.
+
+    This is the batched, vectorized counterpart of
+    [`bezier_curve()`](./bezier.md): no Python-level loop runs per segment
+    or per series.
+
+    Args:
+        x: X-coordinates of the points, shape `(n,)`.
+        y: Y-coordinates of the points, shape `(n_series, n)` (one row
+            per curve).
+        force: Smoothing factor controlling curve tightness. Higher values
+            increase curvature by moving control points further away
+            from the anchors.
+
+    Returns:
+        vertices: Float array of shape `(n_series, 3 * (n - 1) + 1, 2)`
+            with the anchors and control points of every curve.
+        codes: Path codes of shape `(3 * (n - 1) + 1,)`, shared by all curves.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.atleast_2d(np.asarray(y, dtype=float))
+    n_series, n = y.shape
+    if x.shape != (n,):
+        raise ValueError(
+            f"x has shape {x.shape} but y has {n} points per series; they must match."
+        )
+
+    n_vertices = 3 * (n - 1) + 1
+    vertices = np.empty((n_series, n_vertices, 2), dtype=float)
+
+    dx = np.diff(x) * force
+    vertices[:, 0, 0] = x[0]
+    vertices[:, 0, 1] = y[:, 0]
+
+    # First control point, second control point and end anchor of each segment
+    vertices[:, 1::3, 0] = x[:-1] + dx
+    vertices[:, 1::3, 1] = y[:, :-1]
+    vertices[:, 2::3, 0] = x[1:] - dx
+    vertices[:, 2::3, 1] = y[:, 1:]
+    vertices[:, 3::3, 0] = x[1:]
+    vertices[:, 3::3, 1] = y[:, 1:]
+
+    codes = np.full(n_vertices, Path.CURVE4, dtype=Path.code_type)
+    codes[0] = Path.MOVETO
+
+    return vertices, codes
 
 
 def bezier_curve(
@@ -25,18 +81,179 @@ def bezier_curve(
         vertices: List of (x, y) vertices including control points for the Bézier segments.
         codes: Corresponding matplotlib Path codes for constructing the curve.
     """
-    vertices: list = []
-    codes: list = []
+    vertices, codes = bezier_curves(x=x, y=np.asarray(y)[np.newaxis, :], force=force)
+    return list(map(tuple, vertices[0].tolist())), codes.tolist()
 
-    vertices.append((x[0], y[0]))
-    codes.append(Path.MOVETO)
 
-    for i in range(1, len(x)):
-        x0, y0 = x[i - 1], y[i - 1]
-        x1, y1 = x[i], y[i]
-        dx = (x1 - x0) * force
+def simplify_curves(
+    vertices: np.ndarray,
+    min_width: float = 0.0,
+) -> list[tuple[np.ndarray, np.ndarray]]:
+    """
+    Simplify curves built by [`bezier_curves()`](./bezier.md) so that their
+    size scales with the number of rank changes rather than the number of
+    points.
 
-        vertices.extend([(x0 + dx, y0), (x1 - dx, y1), (x1, y1)])
-        codes.extend([Path.CURVE4, Path.CURVE4, Path.CURVE4])
+    A segment between two equal y values is a straight horizontal line, so
+    each run of such segments is merged into a single `LINETO`. Bézier
+    control points are only kept where y changes. Segments narrower than
+    `min_width` (e.g. one pixel, in data units) are also drawn as straight
+    lines, since their curvature can't be seen.
 
-    return vertices, codes
+    Gaps (NaN y values) are handled like [`gap_curves()`](./bezier.md) does.
+
+    Args:
+        vertices: Vertices of shape `(n_series, 3 * (n - 1) + 1, 2)`, as
+            returned by `bezier_curves()`.
+        min_width: Segments spanning less than this in x are straightened.
+
+    Returns:
+        One `(vertices, codes)` pair per series, with a variable number of
+        vertices.
+    """
+    starts = vertices[:, 0:-1:3]
+    ends = vertices[:, 3::3]
+    flat = starts[..., 1] == ends[..., 1]
+    straight = flat | (np.abs(ends[..., 0] - starts[..., 0]) < min_width)
+    # A flat segment followed by another flat one is merged into the latter
+    merged = flat & np.concatenate(
+        [flat[:, 1:], np.zeros((len(vertices), 1), dtype=bool)], axis=1
+    )
+    return _select_curves(vertices, straight, merged)
+
+
+def gap_curves(vertices: np.ndarray) -> list[tuple[np.ndarray, np.ndarray]]:
+    """
+    Split curves built by [`bezier_curves()`](./bezier.md) at missing
+    points, for series that are absent from some periods.
+
+    A point is missing when its y value is NaN. Every segment touching a
+    missing point is dropped, and the curve restarts with a `MOVETO` at the
+    next present segment. Points with no present neighbor are dropped from
+    the path (they are still drawn as markers by `bumplot()`). All series
+    are processed at once, whatever the number of gaps.
+
+    Args:
+        vertices: Vertices of shape `(n_series, 3 * (n - 1) + 1, 2)`, as
+            returned by `bezier_curves()`.
+
+    Returns:
+        One `(vertices, codes)` pair per series, with a variable number of
+        vertices.
+    """
+    no_segments = np.zeros((len(vertices), (vertices.shape[1] - 1) // 3), dtype=bool)
+    return _select_curves(vertices, straight=no_segments, merged=no_segments)
+
+
+def sample_curves(
+    vertices: np.ndarray,
+    samples: int = 16,
+    dtype: DTypeLike = np.float32,
+) -> np.ndarray:
+    """
+    Sample curves built by [`bezier_curves()`](./bezier.md) into polylines,
+    for consumers that can't draw cubic Bézier segments (GeoJSON-like
+    exports, client charting libraries, hit testing).
+
+    Every segment of every series is evaluated at `samples` evenly spaced
+    parameters with one precomputed Bernstein basis matrix, in a single
+    batched matrix product over the control points. The result uses exactly
+    `n_series * ((n - 1) * samples + 1) * 2` values of `dtype`.
+
+    Segments touching a missing point (NaN y value) get NaN y samples between
+    their anchors, which mark the gaps of the polylines. Present anchors are
+    always kept.
+
+    Args:
+        vertices: Vertices of shape `(n_series, 3 * (n - 1) + 1, 2)`, as
+            returned by `bezier_curves()`.
+        samples: Number of points per segment, its end excluded (it's the
+            first point of the next segment). `1` keeps only the anchors.
+        dtype: Float type of the result.
+
+    Returns:
+        The polylines, of shape `(n_series, (n - 1) * samples + 1, 2)`.
+    """
+    if samples < 1:
+        raise ValueError(f"samples must be at least 1, got {samples}.")
+    vertices = np.asarray(vertices, dtype=float)
+    n_series, n_vertices, _ = vertices.shape
+    n_segments = (n_vertices - 1) // 3
+
+    t = np.arange(samples, dtype=float)[:, np.newaxis] / samples
+    # Cubic Bernstein polynomials, shape (samples, 4)
+    basis = np.array([1, 3, 3, 1]) * t ** np.arange(4) * (1 - t) ** np.arange(3, -1, -1)
+
+    points = np.empty((n_series, n_segments * samples + 1, 2), dtype=dtype)
+    if n_segments:
+        # Overlapping (n_series, n_segments, 4, 2) view of the control points
+        controls = np.lib.stride_tricks.sliding_window_view(vertices, 4, axis=1)[
+            :, ::3
+        ].swapaxes(-1, -2)
+        np.matmul(
+            basis,
+            controls,
+            out=points[:, :-1].reshape(n_series, n_segments, samples, 2),
+            casting="same_kind",
+        )
+    # The anchors are written as is: at t=0, a segment ending at a missing
+    # point would still give NaN (NaN * 0), losing its present start
+    points[:, ::samples] = vertices[:, ::3]
+    return points
+
+
+def _select_curves(
+    vertices: np.ndarray,
+    straight: np.ndarray,
+    merged: np.ndarray,
+) -> list[tuple[np.ndarray, np.ndarray]]:
+    """
+    Keep, for every series at once, the vertices and codes of each segment:
+    none for a segment touching a NaN point, the end anchor for a `straight`
+    one (nothing if `merged` into the next one), all three otherwise. A
+    present segment following a dropped one starts with a `MOVETO`.
+
+    Args:
+        vertices: Vertices of shape `(n_series, 3 * n_segments + 1, 2)`.
+        straight: Segments drawn as a `LINETO`, shape
+            `(n_series, n_segments)`.
+        merged: Straight segments merged into the next one, same shape.
+    """
+    n_series, n_vertices, _ = vertices.shape
+    n_segments = (n_vertices - 1) // 3
+    if n_segments == 0:
+        return [(v, np.array([Path.MOVETO], dtype=Path.code_type)) for v in vertices]
+
+    present = ~np.isnan(vertices[:, ::3, 1])
+    valid = present[:, :-1] & present[:, 1:]
+    previous = np.concatenate([np.zeros((n_series, 1), dtype=bool), valid], axis=1)
+    # Anchors where a run of present segments starts, after a gap or not
+    restart = np.concatenate([valid, np.zeros((n_series, 1), dtype=bool)], axis=1)
+    restart &= ~previous
+
+    # Which of the 3 vertices of each segment are kept: all of them for a
+    # curve, only the end anchor for a straight line, none when missing
+    keep = np.empty((n_series, n_segments, 3), dtype=bool)
+    keep[..., :2] = (valid & ~straight)[..., np.newaxis]
+    keep[..., 2] = (valid & ~merged) | restart[:, 1:]
+    keep_all = np.concatenate([restart[:, :1], keep.reshape(n_series, -1)], axis=1)
+
+    segment_codes = np.full((n_series, n_segments, 3), Path.CURVE4, Path.code_type)
+    segment_codes[..., 2] = np.where(
+        restart[:, 1:], Path.MOVETO, np.where(straight, Path.LINETO, Path.CURVE4)
+    )
+    all_codes = np.concatenate(
+        [
+            np.full((n_series, 1), Path.MOVETO, Path.code_type),
+            segment_codes.reshape(n_series, -1),
+        ],
+        axis=1,
+    )
+
+    split_at = np.cumsum(keep_all.sum(axis=1))[:-1]
+    return list(
+        zip(
+            np.split(vertices[keep_all], split_at),
+            np.split(all_codes[keep_all], split_at),
+        )
+    )
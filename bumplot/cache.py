@@ -0,0 +1,147 @@
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+import hashlib
+import threading
+from typing import Any
+
+import narwhals as nw
+from narwhals.typing import IntoFrame
+import numpy as np
+
+from .bezier import bezier_curves
+from ._utils import RankEngine, _collect, _rank_matrix, _value_matrix
+
+
+class BumpCache:
+    """
+    Least-recently-used cache for the ranking and Bézier geometry computed by
+    [`bumplot()`](./bumplot.md).
+
+    Pass the same instance to several `bumplot(..., cache=cache)` calls: as
+    long as the plotted columns hold the same data, restyling a chart (other
+    colors, `BumpOpts`, kwargs) reuses the rank matrix, and reusing the same
+    `curve_force` also reuses the vertex arrays.
+
+    Ranked matrices are keyed on a fingerprint (a hash of the content) of
+    the `x` and `y_columns` columns, and vertex arrays on a fingerprint of the
+    rank matrix and `curve_force`. Cached arrays are read-only.
+
+    Args:
+        maxsize: Maximum number of cached entries.
+        max_bytes: Maximum total size of the cached arrays, in bytes. Entries
+            larger than this are never cached.
+
+    Attributes:
+        hits: Number of lookups answered from the cache.
+        misses: Number of lookups that had to be computed.
+    """
+
+    def __init__(self, maxsize: int = 128, max_bytes: int = 256 * 2**20):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, tuple[tuple[np.ndarray, ...], int]] = (
+            OrderedDict()
+        )
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        """Total size of the cached arrays, in bytes."""
+        return self._nbytes
+
+    def clear(self) -> None:
+        """Remove every entry and reset the hit and miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def rank_matrix(
+        self,
+        df: IntoFrame,
+        x: str,
+        y_columns: list[str],
+        engine: RankEngine = "numpy",
+        chunk_size: int | None = None,
+        workers: int | None = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Cached version of the ranking done by `bumplot()`."""
+        frame = _collect(nw.from_native(df).select(x, *y_columns))
+        # The y columns are extracted once, as one block that is both
+        # fingerprinted and, on a miss, ranked
+        values = _value_matrix(frame, y_columns)
+        key = (
+            "ranks",
+            engine,
+            _fingerprint(frame.get_column(x).to_numpy(), values),
+            x,
+            tuple(y_columns),
+        )
+        return self._get_or_compute(
+            key,
+            lambda: _rank_matrix(
+                frame,
+                x=x,
+                y_columns=y_columns,
+                engine=engine,
+                chunk_size=chunk_size,
+                workers=workers,
+                values=values,
+            ),
+        )
+
+    def bezier_curves(
+        self, x: np.ndarray, y: np.ndarray, force: float
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Cached version of [`bezier_curves()`](./bezier.md)."""
+        key = ("bezier", float(force), _fingerprint(x, y))
+        return self._get_or_compute(key, lambda: bezier_curves(x=x, y=y, force=force))
+
+    def _get_or_compute(
+        self, key: Hashable, compute: Callable[[], tuple[np.ndarray, ...]]
+    ) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        arrays = compute()
+        for array in arrays:
+            array.flags.writeable = False
+        size = sum(array.nbytes for array in arrays)
+
+        with self._lock:
+            if size <= self.max_bytes and key not in self._entries:
+                self._entries[key] = (arrays, size)
+                self._nbytes += size
+                while (
+                    len(self._entries) > self.maxsize or self._nbytes > self.max_bytes
+                ):
+                    _, (_, evicted_size) = self._entries.popitem(last=False)
+                    self._nbytes -= evicted_size
+        return arrays
+
+
+def _fingerprint(*arrays: np.ndarray) -> bytes:
+    """
+    Hash the dtype, shape and content of arrays. Object arrays (e.g. strings)
+    are hashed through their `repr`, since their raw bytes are pointers.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for array in arrays:
+        digest.update(f"{array.dtype.str}{array.shape}".encode())
+        if array.dtype.kind == "O":
+            digest.update(repr(array.tolist()).encode())
+        else:
+            digest.update(np.ascontiguousarray(array).data)
+    return digest.digest()
@@ -0,0 +1,237 @@
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any
+
+import matplotlib as mpl
+from matplotlib.axes import Axes
+from matplotlib.collections import Collection, PathCollection
+from matplotlib.colors import to_rgba
+from matplotlib.path import Path
+
+import numpy as np
+
+# Options that can vary element by element inside a single collection. Every
+# other option (zorder, clip_on, marker, ...) is shared by a whole collection,
+# so series that disagree on them are drawn in separate collections.
+_PER_PATH_KEYS = ("edgecolor", "alpha", "linestyle", "linewidth")
+_PER_POINT_KEYS = ("facecolor", "edgecolor", "alpha", "s", "linewidth")
+
+
+@dataclass(frozen=True)
+class CollectionView:
+    """
+    Lightweight handle on the elements of one series inside a shared
+    collection, as returned by [`bumplot()`](./bumplot.md) when
+    `collection=True`.
+
+    Attributes:
+        collection: The collection holding the series' elements.
+        index: Position of the series' path (an `int`) or of its markers
+            (a `slice` over the offsets) within `collection`.
+    """
+
+    collection: Collection
+    index: int | slice
+
+    def get_offsets(self) -> np.ndarray:
+        """Return the marker offsets of the series (marker views only)."""
+        if not isinstance(self.index, slice):
+            raise TypeError("Line views do not hold marker offsets.")
+        return self.collection.get_offsets()[self.index]
+
+    def get_path(self) -> Path:
+        """Return the path of the series (line views only)."""
+        if isinstance(self.index, slice):
+            raise TypeError("Marker views do not hold a single path.")
+        return self.collection.get_paths()[self.index]
+
+
+def _unique_kwargs(
+    kwargs_list: list[dict[str, Any]],
+) -> tuple[list[dict[str, Any]], np.ndarray]:
+    """
+    The distinct kwargs dicts of the series, by identity (see the `share`
+    option of `_resolve_kwargs()`), and the position of each series' dict
+    among them. Options are then read once per distinct dict.
+    """
+    unique: list[dict[str, Any]] = []
+    positions: dict[int, int] = {}
+    kinds = np.empty(len(kwargs_list), dtype=int)
+    for i, kwargs in enumerate(kwargs_list):
+        position = positions.setdefault(id(kwargs), len(unique))
+        if position == len(unique):
+            unique.append(kwargs)
+        kinds[i] = position
+    return unique, kinds
+
+
+def _group_by_shared(
+    kwargs_list: list[dict[str, Any]], per_element_keys: tuple[str, ...]
+) -> list[tuple[dict[str, Any], list[int]]]:
+    """
+    Group series whose collection-wide options are equal. Comparison is done
+    with `==` (not hashing) since option values may be unhashable.
+    """
+    groups: list[tuple[dict[str, Any], list[int]]] = []
+    for i, kwargs in enumerate(kwargs_list):
+        shared = {k: v for k, v in kwargs.items() if k not in per_element_keys}
+        for group_shared, members in groups:
+            if group_shared == shared:
+                members.append(i)
+                break
+        else:
+            groups.append((shared, [i]))
+    return groups
+
+
+def _groups(
+    kwargs_list: list[dict[str, Any]], per_element_keys: tuple[str, ...]
+) -> Iterator[tuple[dict[str, Any], np.ndarray, list[dict[str, Any]], np.ndarray]]:
+    """
+    Group series like `_group_by_shared()`, comparing each distinct kwargs
+    dict only once.
+
+    Yields:
+        shared: The collection-wide options of the group.
+        members: The series of the group, in order.
+        unique: The distinct kwargs dicts of all series.
+        kinds: The position in `unique` of each member's kwargs.
+    """
+    unique, kinds = _unique_kwargs(kwargs_list)
+    for shared, positions in _group_by_shared(unique, per_element_keys):
+        members = np.flatnonzero(np.isin(kinds, positions))
+        yield shared, members, unique, kinds[members]
+
+
+def _per_member(values: list[Any], kinds: np.ndarray) -> Any:
+    """
+    The value of each member, given one value per distinct kwargs dict. A
+    single value is returned when all members share it.
+    """
+    if len(kinds) and (kinds == kinds[0]).all():
+        return values[kinds[0]]
+    return [values[kind] for kind in kinds]
+
+
+def _draw_collections(
+    ax: Axes,
+    names: list[str],
+    x_values: np.ndarray,
+    y_matrix: np.ndarray,
+    paths: list[Path],
+    plot_kwargs_list: list[dict[str, Any]],
+    scatter_kwargs_list: list[dict[str, Any]],
+    styles: dict[str, np.ndarray] | None = None,
+) -> dict[str, tuple[CollectionView, CollectionView]]:
+    """
+    Draw all curves and markers with as few collections as possible (usually
+    one of each) and return per-series views into them. Missing (NaN)
+    points get no marker.
+
+    `styles` are resolved `SeriesStyles` arrays, applied to the collections
+    in bulk instead of reading those options from each series' kwargs.
+    Series sharing the same kwargs dicts are handled together.
+    """
+    styles = styles or {}
+    line_views: dict[int, CollectionView] = {}
+    marker_views: dict[int, CollectionView] = {}
+
+    for shared, members, unique, kinds in _groups(plot_kwargs_list, _PER_PATH_KEYS):
+        lines = PathCollection(
+            [paths[i] for i in members],
+            facecolors="none",
+            edgecolors=_rgba(unique, kinds, "edgecolor", members, styles, "line_alpha"),
+            linewidths=(
+                styles["line_width"][members]
+                if "line_width" in styles
+                else _per_member(
+                    [
+                        kw.get("linewidth", mpl.rcParams["patch.linewidth"])
+                        for kw in unique
+                    ],
+                    kinds,
+                )
+            ),
+            linestyles=_per_member(
+                [kw.get("linestyle", "solid") for kw in unique], kinds
+            ),
+            **shared,
+        )
+        ax.add_collection(lines, autolim=True)
+        for position, i in enumerate(members.tolist()):
+            line_views[i] = CollectionView(lines, position)
+
+    for shared, members, unique, kinds in _groups(scatter_kwargs_list, _PER_POINT_KEYS):
+        facecolors = _rgba(unique, kinds, "facecolor", members, styles, "marker_alpha")
+        if "color" in styles:
+            edgecolors = facecolors
+        else:
+            edges = [
+                kw.get("edgecolor", mpl.rcParams["scatter.edgecolors"]) for kw in unique
+            ]
+            face = np.array([isinstance(e, str) and e == "face" for e in edges])
+            edge_rgba = np.array(
+                [
+                    (0, 0, 0, 0) if is_face else to_rgba(edge, kw.get("alpha"))
+                    for edge, is_face, kw in zip(edges, face, unique)
+                ],
+                dtype=float,
+            ).reshape(-1, 4)
+            edgecolors = np.where(face[kinds, np.newaxis], facecolors, edge_rgba[kinds])
+        sizes = (
+            styles["marker_size"][members]
+            if "marker_size" in styles
+            else np.array(
+                [kw.get("s", mpl.rcParams["lines.markersize"] ** 2) for kw in unique],
+                dtype=float,
+            )[kinds]
+        )
+        linewidths = np.array(
+            [kw.get("linewidth", mpl.rcParams["lines.linewidth"]) for kw in unique],
+            dtype=float,
+        )[kinds]
+
+        present = ~np.isnan(y_matrix[members])
+        counts = present.sum(axis=1)
+        markers = ax.scatter(
+            np.broadcast_to(x_values, present.shape)[present],
+            y_matrix[members][present],
+            s=np.repeat(sizes, counts),
+            facecolors=np.repeat(facecolors, counts, axis=0),
+            edgecolors=np.repeat(edgecolors, counts, axis=0),
+            linewidths=np.repeat(linewidths, counts),
+            **shared,
+        )
+        stops = np.cumsum(counts)
+        for position, i in enumerate(members.tolist()):
+            stop = int(stops[position])
+            start = stop - int(counts[position])
+            marker_views[i] = CollectionView(markers, slice(start, stop))
+
+    return {name: (line_views[i], marker_views[i]) for i, name in enumerate(names)}
+
+
+def _rgba(
+    unique: list[dict[str, Any]],
+    kinds: np.ndarray,
+    key: str,
+    members: np.ndarray,
+    styles: dict[str, np.ndarray],
+    alpha_key: str,
+) -> np.ndarray:
+    """
+    RGBA colors of the `members` series, shape `(len(members), 4)`: from
+    the `"color"` and `alpha_key` styles when given, from `key` and
+    `"alpha"` of each series' kwargs (`unique[kinds]`) otherwise.
+    """
+    if "color" in styles:
+        rgba = styles["color"][members]
+        alphas = np.array([kw.get("alpha") for kw in unique], dtype=float)[kinds]
+        rgba[:, 3] = np.where(np.isnan(alphas), rgba[:, 3], alphas)
+    else:
+        rgba = np.array(
+            [to_rgba(kw[key], kw.get("alpha")) for kw in unique], dtype=float
+        ).reshape(-1, 4)[kinds]
+    if alpha_key in styles:
+        rgba[:, 3] = styles[alpha_key][members]
+    return rgba
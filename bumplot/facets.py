@@ -0,0 +1,130 @@
+from collections.abc import Iterable
+import math
+from typing import Any
+
+import matplotlib as mpl
+from matplotlib.axes import Axes
+from matplotlib.figure import Figure
+
+import numpy as np
+
+from narwhals.typing import IntoFrame
+
+from .bezier import bezier_curves
+from .collection import _draw_collections
+from ._utils import RankEngine, _encode_x, _rank_groups
+from .main import (
+    _curve_paths,
+    _draw_artists,
+    _resolve_kwargs,
+    _set_rank_ticks,
+    _set_x_ticks,
+)
+from .opts import BumpOpts
+
+
+def facet(
+    x: str,
+    y_columns: Iterable[str | tuple[str, BumpOpts]],
+    data: IntoFrame,
+    by: str,
+    ncols: int | None = None,
+    curve_force: float = 1,
+    invert_y_axis: bool = True,
+    colors: Iterable[str] | None = None,
+    plot_kwargs: dict[str, Any] = {},
+    scatter_kwargs: dict[str, Any] = {},
+    ordinal_labels: bool = False,
+    collection: bool = False,
+    engine: RankEngine = "numpy",
+    **subplots_kwargs: Any,
+) -> tuple[Figure, dict[Any, tuple[Axes, dict]]]:
+    """
+    Creates a grid of bump plots (small multiples), one per group of `by`.
+
+    All groups are ranked together in a single pass (ranks are computed
+    over each `(by, x)` combination), then each group is drawn like
+    [`bumplot()`](./bumplot.md) on its own Axes. Axes share their x and y
+    axes, so non-numeric x values are placed consistently across groups.
+
+    Args:
+        x: colname of the x-axis variable
+        y_columns: colnames of the y-axis variables and their plotting options.
+        data: A dataframe, eager or lazy, in wide format with a `by` column.
+        by: colname of the grouping variable.
+        ncols: Number of columns of the grid. Default to a square-ish grid.
+        curve_force: Smoothing factor controlling curve tightness.
+        invert_y_axis: Whether to invert y axis
+        colors: An optional list of colors
+        plot_kwargs: Additional arguments passed to `patches.PathPatch()`
+        scatter_kwargs: Additional arguments passed to `scatter()`
+        ordinal_labels: If True, converts y-axis labels to ordinal numbers
+        collection: If True, draws each facet with shared collections, see
+            [`bumplot()`](./bumplot.md).
+        engine: How ranks are computed, see [`bumplot()`](./bumplot.md).
+        subplots_kwargs: Additional arguments passed to `plt.subplots()`
+            (e.g. `figsize`).
+
+    Returns:
+        The Figure, and for each group its Axes and artists (as returned by
+        `bumplot()`).
+    """
+    y_bumps: list[tuple[str, BumpOpts]] = [
+        (y, BumpOpts()) if isinstance(y, str) else y for y in y_columns
+    ]
+    names = [name for name, _ in y_bumps]
+    groups = _rank_groups(data, x=x, y_columns=names, by=by, engine=engine)
+
+    n_cols = ncols or math.ceil(math.sqrt(len(groups)))
+    n_rows = max(math.ceil(len(groups) / n_cols), 1)
+    import matplotlib.pyplot as plt
+
+    fig, axs = plt.subplots(
+        n_rows,
+        n_cols,
+        sharex=True,
+        sharey=True,
+        squeeze=False,
+        **subplots_kwargs,
+    )
+    for ax in axs.flat[len(groups) :]:
+        ax.set_visible(False)
+
+    colors_iterable = (
+        colors
+        if colors is not None
+        else mpl.rcParams["axes.prop_cycle"].by_key()["color"]
+    )
+    plot_kwargs_list, scatter_kwargs_list = _resolve_kwargs(
+        y_bumps, colors_iterable, plot_kwargs, scatter_kwargs
+    )
+    draw = _draw_collections if collection else _draw_artists
+
+    # Encode x over all groups at once so shared axes line up
+    all_x, categories = _encode_x(np.concatenate([g[1] for g in groups]))
+    offsets = np.cumsum([0] + [len(g[1]) for g in groups])
+
+    facets: dict[Any, tuple[Axes, dict]] = {}
+    for (group, _, y_matrix), ax, start, stop in zip(
+        groups, axs.flat, offsets[:-1], offsets[1:]
+    ):
+        x_values = all_x[start:stop]
+        vertices, codes = bezier_curves(x=x_values, y=y_matrix, force=curve_force)
+        artists = draw(
+            ax,
+            names=names,
+            x_values=x_values,
+            y_matrix=y_matrix,
+            paths=_curve_paths(vertices, codes, y_matrix),
+            plot_kwargs_list=plot_kwargs_list,
+            scatter_kwargs_list=scatter_kwargs_list,
+        )
+        ax.set_title(str(group))
+        facets[group] = (ax, artists)
+
+    # The y axes are shared: invert them once rather than once per Axes
+    first_ax = axs.flat[0]
+    _set_rank_ticks(first_ax, len(names), invert_y_axis, ordinal_labels)
+    _set_x_ticks(first_ax, all_x, categories)
+
+    return fig, facets
@@ -0,0 +1,266 @@
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, fields
+import json
+import os
+from typing import Any, Literal
+
+from matplotlib.axes import Axes
+from matplotlib.ticker import Locator
+import numpy as np
+
+from narwhals.typing import IntoFrame
+
+from .bezier import bezier_curves
+from .cache import BumpCache
+from ._utils import RankEngine, _encode_x, _rank_matrix
+from .main import _draw_ranks, _gca, _x_ticks
+from .opts import BumpOpts
+from .raster import RasterizePolicy
+from .styles import SeriesStyles
+
+GeometryFormat = Literal["npz", "arrow"]
+
+_ARROW_SUFFIXES = (".arrow", ".feather", ".ipc")
+
+
+@dataclass(frozen=True, slots=True)
+class BumpGeometry:
+    """
+    Everything needed to draw a bump plot, without any dataframe: the output
+    of [`compute_bump_geometry()`](./geometry.md), drawn with
+    [`render_geometry()`](./geometry.md).
+
+    It can be saved to and loaded from `.npz` or Arrow IPC files, without
+    pickling, to compute charts in one process and render them in another.
+
+    Attributes:
+        names: Name of each series, shape `(n_series,)`.
+        x_values: Numeric x position of each period, shape `(n_periods,)`.
+        x_ticks: Positions of the x ticks.
+        x_tick_labels: Labels of the x ticks, as strings.
+        x_categorical: Whether x is categorical (strings, dates...), as a
+            0-d bool array. `x_values` and `x_ticks` are then integer
+            positions, each labelled by `x_tick_labels`.
+        ranks: The rank matrix, shape `(n_series, n_periods)`. Missing
+            periods are NaN.
+        vertices: Bézier vertices of each series, shape
+            `(n_series, 3 * (n_periods - 1) + 1, 2)`.
+        codes: Path codes shared by all series, shape
+            `(3 * (n_periods - 1) + 1,)`.
+    """
+
+    names: np.ndarray
+    x_values: np.ndarray
+    x_ticks: np.ndarray
+    x_tick_labels: np.ndarray
+    x_categorical: np.ndarray
+    ranks: np.ndarray
+    vertices: np.ndarray
+    codes: np.ndarray
+
+    def save(
+        self, file: str | os.PathLike, format: GeometryFormat | None = None
+    ) -> None:
+        """
+        Save the geometry to a file.
+
+        Args:
+            file: Path of the file.
+            format: `"npz"` or `"arrow"` (Arrow IPC, requires `pyarrow`).
+                Default to `"arrow"` for `.arrow`, `.feather` and `.ipc`
+                files, `"npz"` otherwise.
+        """
+        arrays = {field.name: getattr(self, field.name) for field in fields(self)}
+        if _format(file, format) == "npz":
+            # Through a file object, so numpy doesn't append ".npz" to the path
+            with open(file, "wb") as f:
+                np.savez(f, **arrays)
+            return
+
+        import pyarrow as pa
+
+        shapes = {name: array.shape for name, array in arrays.items()}
+        # One row, each array flattened into a single list value
+        table = pa.table(
+            {
+                name: pa.LargeListArray.from_arrays(
+                    pa.array([0, array.size], pa.int64()), pa.array(array.ravel())
+                )
+                for name, array in arrays.items()
+            },
+            metadata={"bumplot.shapes": json.dumps(shapes)},
+        )
+        with pa.OSFile(os.fspath(file), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+
+    @classmethod
+    def load(
+        cls, file: str | os.PathLike, format: GeometryFormat | None = None
+    ) -> "BumpGeometry":
+        """
+        Load a geometry saved with `save()`.
+
+        Args:
+            file: Path of the file.
+            format: `"npz"` or `"arrow"`, inferred from the file extension
+                like in `save()` by default.
+        """
+        if _format(file, format) == "npz":
+            with np.load(file, allow_pickle=False) as arrays:
+                return cls(**{field.name: arrays[field.name] for field in fields(cls)})
+
+        import pyarrow as pa
+
+        with pa.memory_map(os.fspath(file)) as source:
+            table = pa.ipc.open_file(source).read_all()
+        shapes = json.loads(table.schema.metadata[b"bumplot.shapes"])
+        arrays = {}
+        for field in fields(cls):
+            values = table.column(field.name).combine_chunks().flatten()
+            array = values.to_numpy(zero_copy_only=False)
+            if pa.types.is_string(values.type):
+                array = array.astype(str)
+            arrays[field.name] = array.reshape(shapes[field.name])
+        return cls(**arrays)
+
+
+def compute_bump_geometry(
+    x: str,
+    y_columns: Iterable[str],
+    data: IntoFrame,
+    curve_force: float = 1,
+    engine: RankEngine = "numpy",
+    cache: BumpCache | None = None,
+    chunk_size: int | None = None,
+    workers: int | None = None,
+) -> BumpGeometry:
+    """
+    Rank the data and build the Bézier geometry of a bump plot, without
+    drawing anything, e.g. on a server that doesn't render charts itself.
+
+    This does all the dataframe work of [`bumplot()`](./bumplot.md). The
+    result can be saved, sent elsewhere and drawn with
+    [`render_geometry()`](./geometry.md).
+
+    Args:
+        x: colname of the x-axis variable
+        y_columns: colnames of the y-axis variables.
+        data: A dataframe, eager or lazy.
+        curve_force: Smoothing factor controlling curve tightness.
+        engine: How ranks are computed, see [`bumplot()`](./bumplot.md).
+        cache: An optional `BumpCache`, see [`bumplot()`](./bumplot.md).
+        chunk_size: Rank periods in blocks, see [`bumplot()`](./bumplot.md).
+        workers: Number of threads ranking blocks with `chunk_size`.
+
+    Returns:
+        The `BumpGeometry` of the plot.
+    """
+    names = list(y_columns)
+    x_values_raw, ranks = (_rank_matrix if cache is None else cache.rank_matrix)(
+        data,
+        x=x,
+        y_columns=names,
+        engine=engine,
+        chunk_size=chunk_size,
+        workers=workers,
+    )
+    x_values, categories = _encode_x(x_values_raw)
+    vertices, codes = (bezier_curves if cache is None else cache.bezier_curves)(
+        x=x_values, y=ranks, force=curve_force
+    )
+    x_ticks, x_tick_labels = _x_ticks(x_values, categories)
+    return BumpGeometry(
+        names=np.array(names, dtype=str),
+        x_values=x_values,
+        x_ticks=x_ticks,
+        x_tick_labels=np.asarray(x_tick_labels).astype(str),
+        x_categorical=np.array(categories is not None),
+        ranks=ranks,
+        vertices=vertices,
+        codes=codes,
+    )
+
+
+def render_geometry(
+    ax: Axes | None,
+    geom: BumpGeometry,
+    opts: Mapping[str, BumpOpts] = {},
+    invert_y_axis: bool = True,
+    colors: Iterable[str] | None = None,
+    plot_kwargs: dict[str, Any] = {},
+    scatter_kwargs: dict[str, Any] = {},
+    ordinal_labels: bool = False,
+    collection: bool = False,
+    simplify: bool | Literal["pixels"] = False,
+    rasterize_above: int | RasterizePolicy | None = None,
+    styles: SeriesStyles | None = None,
+    start_labels: bool = False,
+    end_labels: bool = False,
+    x_locator: int | Locator | None = None,
+) -> tuple[Axes, dict]:
+    """
+    Draw a `BumpGeometry` computed by
+    [`compute_bump_geometry()`](./geometry.md).
+
+    The result is the same as [`bumplot()`](./bumplot.md) with the same
+    options, but no ranking or dataframe work happens here.
+
+    Args:
+        ax: The matplotlib Axes used. `None` uses `plt.gca()`.
+        geom: The geometry to draw.
+        opts: Plotting options of some series, by name.
+        invert_y_axis: Whether to invert y axis
+        colors: An optional list of colors
+        plot_kwargs: Additional arguments passed to `patches.PathPatch()`
+        scatter_kwargs: Additional arguments passed to `scatter()`
+        ordinal_labels: If True, converts y-axis labels to ordinal numbers
+        collection: If True, draws all series with shared collections, see
+            [`bumplot()`](./bumplot.md).
+        simplify: Whether to simplify flat runs of the curves, see
+            [`bumplot()`](./bumplot.md).
+        rasterize_above: When to rasterize curves and markers in vector
+            exports, see [`bumplot()`](./bumplot.md).
+        styles: Data-driven styling, see [`bumplot()`](./bumplot.md).
+        start_labels: Whether to label the series at their first rank, see
+            [`bumplot()`](./bumplot.md).
+        end_labels: Whether to label the series at their last rank, see
+            [`bumplot()`](./bumplot.md).
+        x_locator: How the x ticks are thinned, see [`bumplot()`](./bumplot.md).
+
+    Returns:
+        The matplotlib Axes with the bump plot, and the artists of each series.
+    """
+    _plot_ax: Axes = ax if ax is not None else _gca()
+    artists = _draw_ranks(
+        _plot_ax,
+        x_values=geom.x_values,
+        y_matrix=geom.ranks,
+        vertices=geom.vertices,
+        codes=geom.codes,
+        x_ticks=geom.x_ticks,
+        x_tick_labels=geom.x_tick_labels,
+        x_categorical=bool(geom.x_categorical),
+        y_bumps=[(name, opts.get(name, BumpOpts())) for name in geom.names.tolist()],
+        invert_y_axis=invert_y_axis,
+        colors=colors,
+        plot_kwargs=plot_kwargs,
+        scatter_kwargs=scatter_kwargs,
+        ordinal_labels=ordinal_labels,
+        collection=collection,
+        simplify=simplify,
+        rasterize_above=rasterize_above,
+        styles=styles,
+        start_labels=start_labels,
+        end_labels=end_labels,
+        x_locator=x_locator,
+    )
+    return _plot_ax, artists
+
+
+def _format(file: str | os.PathLike, format: GeometryFormat | None) -> str:
+    if format is None:
+        return "arrow" if os.fspath(file).endswith(_ARROW_SUFFIXES) else "npz"
+    if format not in ("npz", "arrow"):
+        raise ValueError(f"format must be either 'npz' or 'arrow', not {format!r}.")
+    return format
@@ -0,0 +1,213 @@
+from collections.abc import Iterable
+from typing import Any
+
+import matplotlib as mpl
+from matplotlib.axes import Axes
+from matplotlib.collections import PathCollection
+from matplotlib.patches import PathPatch
+from matplotlib.path import Path
+
+import numpy as np
+
+from narwhals.typing import IntoFrame
+
+from .bezier import bezier_curves
+from ._utils import RankEngine, _encode_x, _rank_matrix
+from .main import (
+    _curve_paths,
+    _draw_artists,
+    _gca,
+    _resolve_kwargs,
+    _set_rank_ticks,
+    _set_x_ticks,
+)
+from .opts import BumpOpts
+
+
+class BumpPlot:
+    """
+    A bump plot that can be extended in place when new periods arrive.
+
+    It draws exactly like [`bumplot()`](./bumplot.md) (one `PathPatch` and
+    one `scatter()` per series) but keeps its geometry around, so that
+    `append()` only ranks the new x values and extends the existing artists.
+    Since ranks are computed per x value, earlier ranks never change.
+
+    Vertices and markers are stored in buffers that grow geometrically, so
+    the cost of an update scales with the new data rather than with the
+    full history.
+
+    Args:
+        x: colname of the x-axis variable
+        y_columns: colnames of the y-axis variables and their plotting options.
+        data: A dataframe, eager or lazy, with the initial periods.
+        curve_force: Smoothing factor controlling curve tightness.
+        invert_y_axis: Whether to invert y axis
+        colors: An optional list of colors
+        plot_kwargs: Additional arguments passed to `patches.PathPatch()`
+        scatter_kwargs: Additional arguments passed to `scatter()`
+        ax: The matplotlib Axes used. Default to `plt.gca()`
+        ordinal_labels: If True, converts y-axis labels to ordinal numbers
+        engine: How ranks are computed, see [`bumplot()`](./bumplot.md).
+
+    Attributes:
+        ax: The matplotlib Axes with the bump plot.
+        artists: The `(PathPatch, PathCollection)` of each series.
+    """
+
+    def __init__(
+        self,
+        x: str,
+        y_columns: Iterable[str | tuple[str, BumpOpts]],
+        data: IntoFrame,
+        curve_force: float = 1,
+        invert_y_axis: bool = True,
+        colors: Iterable[str] | None = None,
+        plot_kwargs: dict[str, Any] = {},
+        scatter_kwargs: dict[str, Any] = {},
+        ax: Axes | None = None,
+        ordinal_labels: bool = False,
+        engine: RankEngine = "numpy",
+    ):
+        self.ax: Axes = ax if ax is not None else _gca()
+        self.x = x
+        self.curve_force = curve_force
+        self.engine: RankEngine = engine
+
+        y_bumps: list[tuple[str, BumpOpts]] = [
+            (y, BumpOpts()) if isinstance(y, str) else y for y in y_columns
+        ]
+        self.names = [name for name, _ in y_bumps]
+        colors_iterable = (
+            colors
+            if colors is not None
+            else mpl.rcParams["axes.prop_cycle"].by_key()["color"]
+        )
+
+        x_values_raw, y_matrix = _rank_matrix(
+            data, x=x, y_columns=self.names, engine=engine
+        )
+        x_values, self._categories = _encode_x(x_values_raw)
+        self._seen = set(x_values_raw.tolist())
+        vertices, codes = bezier_curves(x=x_values, y=y_matrix, force=curve_force)
+
+        self._n_points = 0
+        self._n_vertices = 0
+        self._x = np.empty((1, 0), dtype=x_values.dtype)
+        self._points = np.empty((len(self.names), 0, 2))
+        self._vertices = np.empty((len(self.names), 0, 2))
+        self._codes = np.empty(0, dtype=Path.code_type)
+        self._store(x_values, y_matrix, vertices, codes)
+
+        plot_kwargs_list, scatter_kwargs_list = _resolve_kwargs(
+            y_bumps, colors_iterable, plot_kwargs, scatter_kwargs
+        )
+        self.artists: dict[str, tuple[PathPatch, PathCollection]] = _draw_artists(
+            self.ax,
+            names=self.names,
+            x_values=x_values,
+            y_matrix=y_matrix,
+            paths=_curve_paths(vertices, codes, y_matrix),
+            plot_kwargs_list=plot_kwargs_list,
+            scatter_kwargs_list=scatter_kwargs_list,
+        )
+        _set_rank_ticks(self.ax, len(self.names), invert_y_axis, ordinal_labels)
+        self._update_x_ticks()
+
+    def append(self, period_rows: IntoFrame) -> None:
+        """
+        Add new periods to the plot.
+
+        Args:
+            period_rows: A dataframe with the same `x` and y columns as the
+                initial data, holding only x values not plotted yet.
+        """
+        x_values_raw, y_matrix = _rank_matrix(
+            period_rows, x=self.x, y_columns=self.names, engine=self.engine
+        )
+        if len(x_values_raw) == 0:
+            return
+        new_x = x_values_raw.tolist()
+        if len(set(new_x)) != len(new_x) or not self._seen.isdisjoint(new_x):
+            raise ValueError(
+                "Appended rows must only hold x values that are not plotted yet."
+            )
+        self._seen.update(new_x)
+        x_values, self._categories = _encode_x(x_values_raw, self._categories)
+
+        # Start the new segments at the current last anchor of each series
+        last = self._points[:, self._n_points - 1]
+        vertices, codes = bezier_curves(
+            x=np.concatenate([last[:1, 0], x_values]),
+            y=np.column_stack([last[:, 1], y_matrix]),
+            force=self.curve_force,
+        )
+        self._store(x_values, y_matrix, vertices[:, 1:], codes[1:])
+
+        points = self._points[:, : self._n_points]
+        paths = _curve_paths(
+            self._vertices[:, : self._n_vertices],
+            self._codes[: self._n_vertices],
+            points[..., 1],
+        )
+        present = ~np.isnan(points[..., 1])
+        for i, (patch, scatter) in enumerate(self.artists.values()):
+            patch.set_path(paths[i])
+            # Missing points get no marker
+            scatter.set_offsets(points[i, present[i]])
+
+        new_points = slice(self._n_points - len(new_x), self._n_points)
+        self.ax.update_datalim(self._points[:, new_points].reshape(-1, 2))
+        self.ax.autoscale_view()
+        self._update_x_ticks()
+
+    def _store(
+        self,
+        x_values: np.ndarray,
+        y_matrix: np.ndarray,
+        vertices: np.ndarray,
+        codes: np.ndarray,
+    ) -> None:
+        """
+        Append anchors and vertices to the buffers, growing them (or
+        promoting the x buffer to a wider dtype) if needed.
+        """
+        n_new_points, n_new_vertices = len(x_values), vertices.shape[1]
+        # e.g. x=2.5 appended to integer periods
+        dtype = np.result_type(self._x, x_values)
+        if dtype != self._x.dtype:
+            self._x = self._x.astype(dtype)
+        self._x = _reserve(self._x, self._n_points + n_new_points)
+        self._points = _reserve(self._points, self._n_points + n_new_points)
+        self._vertices = _reserve(self._vertices, self._n_vertices + n_new_vertices)
+        if len(self._codes) < self._vertices.shape[1]:
+            self._codes = np.resize(self._codes, self._vertices.shape[1])
+
+        points = slice(self._n_points, self._n_points + n_new_points)
+        self._x[0, points] = x_values
+        self._points[:, points, 0] = x_values
+        self._points[:, points, 1] = y_matrix
+        self._n_points += n_new_points
+
+        new_vertices = slice(self._n_vertices, self._n_vertices + n_new_vertices)
+        self._vertices[:, new_vertices] = vertices
+        self._codes[new_vertices] = codes
+        self._n_vertices += n_new_vertices
+
+    def _update_x_ticks(self) -> None:
+        _set_x_ticks(self.ax, self._x[0, : self._n_points], self._categories)
+
+
+def _reserve(buffer: np.ndarray, size: int) -> np.ndarray:
+    """
+    Return `buffer`, or a copy of it with at least twice the capacity if it
+    can't hold `size` elements along its second axis.
+    """
+    capacity = buffer.shape[1]
+    if size <= capacity:
+        return buffer
+    grown = np.empty(
+        (buffer.shape[0], max(size, 2 * capacity), *buffer.shape[2:]), buffer.dtype
+    )
+    grown[:, :capacity] = buffer
+    return grown
@@ -0,0 +1,266 @@
+from collections.abc import Mapping
+from typing import Any
+
+from matplotlib.artist import Artist
+from matplotlib.axes import Axes
+from matplotlib.backend_bases import Event, MouseEvent
+from matplotlib.collections import Collection
+
+import numpy as np
+
+from .collection import CollectionView
+
+# Resolution of the index: curves are resampled so that consecutive points
+# are at most 1 / _RESOLUTION of the plotted extent apart along each axis
+_RESOLUTION = 200
+_MAX_CELLS = 1024
+
+
+class BumpIndex:
+    """
+    Spatial index over the curves and markers of a bump plot, to find the
+    series under the cursor and highlight it without calling `contains()`
+    on every artist.
+
+    It's built once from the artists returned by
+    [`bumplot()`](./bumplot.md) (with or without `collection=True`): curves
+    are flattened and resampled into points, bucketed with the markers into
+    a uniform grid. A lookup only visits the grid cells around the cursor.
+
+    Examples:
+        ```python
+        ax, artists = bumplot.bumplot("x", y_columns, df)
+        index = bumplot.BumpIndex(ax, artists)
+        index.connect()  # highlight the series under the mouse
+        ```
+
+    Args:
+        ax: The Axes the artists were drawn on.
+        artists: The artists of each series, as returned by `bumplot()`.
+        radius: How close to a curve or marker the cursor must be, in pixels.
+        dim_alpha: Opacity of the other series while one is highlighted.
+    """
+
+    def __init__(
+        self,
+        ax: Axes,
+        artists: Mapping[str, tuple[Any, Any]],
+        radius: float = 5.0,
+        dim_alpha: float = 0.2,
+    ):
+        self.ax = ax
+        self.artists = dict(artists)
+        self.radius = radius
+        self.dim_alpha = dim_alpha
+        self.highlighted: str | None = None
+        self._names = list(self.artists)
+        self._cid: int | None = None
+        self._colors: dict[Collection, tuple[np.ndarray, np.ndarray]] = {}
+        self._current: dict[Collection, tuple[np.ndarray, np.ndarray]] = {}
+        self._alphas: dict[Artist, float | None] = {}
+        self._build()
+
+    def _build(self) -> None:
+        polylines: list[np.ndarray] = []
+        owners: list[int] = []
+        for i, (line, markers) in enumerate(self.artists.values()):
+            for polyline in line.get_path().to_polygons(closed_only=False):
+                polylines.append(polyline)
+                owners.append(i)
+            offsets = np.asarray(markers.get_offsets(), dtype=float).reshape(-1, 2)
+            polylines.extend(offsets[:, np.newaxis])
+            owners.extend([i] * len(offsets))
+
+        if not polylines:
+            polylines, owners = [np.empty((0, 2))], [0]
+        points = np.concatenate(polylines)
+        self._origin = points.min(axis=0) if len(points) else np.zeros(2)
+        span = np.ptp(points, axis=0) if len(points) else np.ones(2)
+        self._span = np.where(span > 0, span, 1.0)
+
+        points, series = _resample(
+            [(p - self._origin) / self._span for p in polylines],
+            np.asarray(owners),
+            1 / _RESOLUTION,
+        )
+        self._n_cells = int(np.clip(np.sqrt(len(points) / 4), 1, _MAX_CELLS))
+        cells = self._cells(points)
+        order = np.argsort(cells, kind="stable")
+        self._cell_ids = cells[order]
+        self._points = points[order]
+        self._series = series[order]
+
+    def _cells(self, points: np.ndarray) -> np.ndarray:
+        """Flat grid cell of points in normalized coordinates."""
+        ij = np.clip((points * self._n_cells).astype(int), 0, self._n_cells - 1)
+        return ij[:, 1] * self._n_cells + ij[:, 0]
+
+    def series_at(self, x: float, y: float) -> str | None:
+        """
+        Return the name of the series closest to a point in display
+        coordinates (e.g. `event.x, event.y` of a mouse event), or `None`
+        when no curve or marker is within `radius` pixels.
+        """
+        inverse = self.ax.transData.inverted()
+        (center, corner) = inverse.transform(
+            [(x, y), (x + self.radius, y + self.radius)]
+        )
+        center = (center - self._origin) / self._span
+        # Radius in normalized units along each axis, as the axes may be
+        # stretched, zoomed or inverted since the index was built
+        reach = np.abs(corner - self._origin - center * self._span) / self._span
+        if not np.isfinite(center).all() or not (reach > 0).all():
+            return None
+
+        low = np.clip(((center - reach) * self._n_cells).astype(int), 0, None)
+        high = np.clip(
+            ((center + reach) * self._n_cells).astype(int), None, self._n_cells - 1
+        )
+        if (low > high).any():
+            return None
+        rows = np.arange(low[1], high[1] + 1) * self._n_cells
+        starts = np.searchsorted(self._cell_ids, rows + low[0], side="left")
+        stops = np.searchsorted(self._cell_ids, rows + high[0], side="right")
+        candidates = np.concatenate(
+            [np.arange(start, stop) for start, stop in zip(starts, stops)]
+        )
+        if not len(candidates):
+            return None
+
+        distances = (((self._points[candidates] - center) / reach) ** 2).sum(axis=1)
+        closest = np.argmin(distances)
+        if distances[closest] > 1:
+            return None
+        return self._names[self._series[candidates[closest]]]
+
+    def highlight(self, name: str | None) -> None:
+        """
+        Highlight one series, dimming all the others, or restore all of them
+        with `None`.
+
+        Going from no highlight to one (or back) updates every series once.
+        Moving the highlight from a series to another only updates those
+        two.
+        """
+        if name == self.highlighted:
+            return
+        if name is not None and name not in self.artists:
+            raise KeyError(f"Unknown series {name!r}.")
+
+        if self.highlighted is None:
+            others = [other for other in self._names if other != name]
+            self._set_alpha(others, self.dim_alpha)
+        elif name is None:
+            self._set_alpha(self._names, None)
+        else:
+            self._set_alpha([self.highlighted], self.dim_alpha)
+        if name is not None:
+            self._set_alpha([name], None)
+        self.highlighted = name
+
+    def _set_alpha(self, names: list[str], alpha: float | None) -> None:
+        """Set the opacity of some series, or restore their own with `None`."""
+        touched: set[Collection] = set()
+        for name in names:
+            for artist in self.artists[name]:
+                if isinstance(artist, CollectionView):
+                    self._set_view_alpha(artist, alpha)
+                    touched.add(artist.collection)
+                else:
+                    original = self._alphas.setdefault(artist, artist.get_alpha())
+                    artist.set_alpha(original if alpha is None else alpha)
+        # Shared collections are updated once, whatever the number of series
+        for collection in touched:
+            facecolors, edgecolors = self._current[collection]
+            if len(facecolors):
+                collection.set_facecolor(facecolors)
+            if len(edgecolors):
+                collection.set_edgecolor(edgecolors)
+
+    def _set_view_alpha(self, view: CollectionView, alpha: float | None) -> None:
+        """Set the opacity of the rows of a series in its collection's colors."""
+        collection = view.collection
+        if collection not in self._colors:
+            # Line views index paths, marker views slice offsets
+            n = (
+                len(collection.get_offsets())
+                if isinstance(view.index, slice)
+                else len(collection.get_paths())
+            )
+            original = (
+                _per_element(collection.get_facecolor(), n),
+                _per_element(collection.get_edgecolor(), n),
+            )
+            self._colors[collection] = original
+            self._current[collection] = (original[0].copy(), original[1].copy())
+        for original, current in zip(
+            self._colors[collection], self._current[collection]
+        ):
+            if len(original):
+                current[view.index, 3] = (
+                    original[view.index, 3] if alpha is None else alpha
+                )
+
+    def connect(self, event: str = "motion_notify_event") -> None:
+        """
+        Highlight the series under the mouse as it moves (or on click with
+        `event="button_press_event"`). The figure is redrawn only when the
+        highlighted series changes.
+        """
+        self.disconnect()
+        self._cid = self.ax.figure.canvas.mpl_connect(event, self._on_event)
+
+    def disconnect(self) -> None:
+        """Stop following mouse events, see `connect()`."""
+        if self._cid is not None:
+            self.ax.figure.canvas.mpl_disconnect(self._cid)
+            self._cid = None
+
+    def _on_event(self, event: Event) -> None:
+        if not isinstance(event, MouseEvent):
+            return
+        name = self.series_at(event.x, event.y) if event.inaxes is self.ax else None
+        if name != self.highlighted:
+            self.highlight(name)
+            self.ax.figure.canvas.draw_idle()
+
+
+def _resample(
+    polylines: list[np.ndarray], owners: np.ndarray, step: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Insert points along every polyline so that consecutive points are at most
+    `step` apart along each axis, and return all points with their owner.
+    """
+    lengths = np.array([len(p) for p in polylines])
+    points = np.concatenate(polylines)
+    series = np.repeat(owners, lengths)
+    if len(points) < 2:
+        return points, series
+
+    # Segments between consecutive points of the same polyline
+    ends = np.cumsum(lengths)
+    same = np.ones(len(points) - 1, dtype=bool)
+    same[ends[:-1][ends[:-1] < len(points)] - 1] = False
+    deltas = np.diff(points, axis=0)
+    pieces = np.ceil(np.abs(deltas).max(axis=1) / step).astype(int)
+    pieces = np.where(same, np.maximum(pieces, 1), 1)
+
+    # Each segment is replaced by `pieces` points from its start, not
+    # reaching its end (the next start, or the last point kept below)
+    start = np.repeat(np.arange(len(deltas)), pieces)
+    fraction = np.arange(pieces.sum()) - np.repeat(np.cumsum(pieces) - pieces, pieces)
+    fraction = fraction / pieces[start]
+    resampled = points[start] + deltas[start] * fraction[:, np.newaxis]
+    return (
+        np.concatenate([resampled, points[-1:]]),
+        np.concatenate([series[start], series[-1:]]),
+    )
+
+
+def _per_element(colors: np.ndarray, n: int) -> np.ndarray:
+    """RGBA colors with one row per element of a collection."""
+    colors = np.asarray(colors, dtype=float).reshape(-1, 4)
+    if len(colors) == 1 and n > 1:
+        return np.repeat(colors, n, axis=0)
+    return colors.copy()
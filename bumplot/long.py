@@ -0,0 +1,116 @@
+from collections.abc import Iterable
+from typing import Any, Literal
+
+from matplotlib.axes import Axes
+from matplotlib.ticker import Locator
+
+from narwhals.typing import IntoFrame
+
+from ._utils import RankEngine, _rank_long
+from .main import _gca, _plot_ranks
+from .opts import BumpOpts
+from .raster import RasterizePolicy
+from .styles import SeriesStyles
+
+
+def bumplot_long(
+    x: str,
+    entity: str,
+    value: str,
+    data: IntoFrame,
+    entities: Iterable[str | tuple[str, BumpOpts]] | None = None,
+    curve_force: float = 1,
+    invert_y_axis: bool = True,
+    colors: Iterable[str] | None = None,
+    plot_kwargs: dict[str, Any] = {},
+    scatter_kwargs: dict[str, Any] = {},
+    ax: Axes | None = None,
+    ordinal_labels: bool = False,
+    collection: bool = False,
+    engine: RankEngine = "numpy",
+    simplify: bool | Literal["pixels"] = False,
+    rasterize_above: int | RasterizePolicy | None = None,
+    styles: SeriesStyles | None = None,
+    start_labels: bool = False,
+    end_labels: bool = False,
+    x_locator: int | Locator | None = None,
+) -> tuple[Axes, dict]:
+    """
+    Creates bump plot, or bump chart, from data in long (tidy) format, with
+    one row per period and series.
+
+    This is the long-format counterpart of [`bumplot()`](./bumplot.md): the
+    data is ranked with `rank().over(x)` directly on the long frame, and the
+    rank matrix is filled with a single scatter into a preallocated array,
+    so no wide frame is ever built.
+
+    Args:
+        x: colname of the x-axis variable
+        entity: colname identifying each series (one line per entity).
+        value: colname of the values to rank.
+        data: A dataframe, eager or lazy, in long format.
+        entities: The entities to plot and their plotting options. Only
+            these entities are ranked. Default to all entities, in order
+            of first appearance.
+        curve_force: Smoothing factor controlling curve tightness.
+        invert_y_axis: Whether to invert y axis
+        colors: An optional list of colors
+        plot_kwargs: Additional arguments passed to `patches.PathPatch()`
+        scatter_kwargs: Additional arguments passed to `scatter()`
+        ax: The matplotlib Axes used. Default to `plt.gca()`
+        ordinal_labels: If True, converts y-axis labels to ordinal numbers
+        collection: If True, draws all series with shared collections, see
+            [`bumplot()`](./bumplot.md).
+        engine: How ranks are computed, see [`bumplot()`](./bumplot.md).
+        simplify: Whether to simplify flat runs of the curves, see
+            [`bumplot()`](./bumplot.md).
+        rasterize_above: When to rasterize curves and markers in vector
+            exports, see [`bumplot()`](./bumplot.md).
+        styles: Data-driven styling with one value per entity (in the order
+            of `entities`), see [`bumplot()`](./bumplot.md).
+        start_labels: Whether to label the series at their first rank, see
+            [`bumplot()`](./bumplot.md).
+        end_labels: Whether to label the series at their last rank, see
+            [`bumplot()`](./bumplot.md).
+        x_locator: How the x ticks are thinned, see [`bumplot()`](./bumplot.md).
+
+    Returns:
+        The matplotlib Axes with the bump plot, and the artists of each entity.
+    """
+    _plot_ax: Axes = ax if ax is not None else _gca()
+
+    entity_bumps: list[tuple[str, BumpOpts]] | None = (
+        None
+        if entities is None
+        else [(e, BumpOpts()) if isinstance(e, str) else e for e in entities]
+    )
+    x_values_raw, names, y_matrix = _rank_long(
+        data,
+        x=x,
+        entity=entity,
+        value=value,
+        entities=None if entity_bumps is None else [e for e, _ in entity_bumps],
+        engine=engine,
+    )
+
+    artists = _plot_ranks(
+        _plot_ax,
+        x_values_raw=x_values_raw,
+        y_matrix=y_matrix,
+        y_bumps=entity_bumps or [(name, BumpOpts()) for name in names],
+        curve_force=curve_force,
+        invert_y_axis=invert_y_axis,
+        colors=colors,
+        plot_kwargs=plot_kwargs,
+        scatter_kwargs=scatter_kwargs,
+        ordinal_labels=ordinal_labels,
+        collection=collection,
+        cache=None,
+        simplify=simplify,
+        rasterize_above=rasterize_above,
+        styles=styles,
+        start_labels=start_labels,
+        end_labels=end_labels,
+        x_locator=x_locator,
+    )
+    return _plot_ax, artists
@@ -1,29 +1,38 @@
 from collections import ChainMap
-from itertools import cycle
+from functools import partial
+from itertools import cycle, repeat
 
-import matplotlib.pyplot as plt
+import matplotlib as mpl
 from matplotlib.axes import Axes
 from matplotlib.path import Path
 import matplotlib.patches as patches
 from matplotlib.cbook import normalize_kwargs
 from matplotlib.collections import PathCollection
 from matplotlib.patches import PathPatch
+from matplotlib.ticker import FuncFormatter, Locator
 
 import numpy as np
 
-from narwhals.typing import IntoDataFrame
+from narwhals.typing import IntoFrame
 
-from .bezier import bezier_curve
-from ._utils import _ranked_df, _to_ordinal
+from .bezier import bezier_curves, gap_curves, simplify_curves
+from .cache import BumpCache
+from .collection import CollectionView, _draw_collections
+from ._utils import RankEngine, _encode_x, _rank_matrix, _to_ordinal
 from .opts import BumpOpts, _get_plot_kwargs, _get_scatter_kwargs
+from .profiling import _stage
+from .raster import RasterizePolicy, _rasterize, _should_rasterize
+from .styles import SeriesStyles, _apply_styles, _resolve_styles
 
-from typing import Any, Iterable, Tuple
+from typing import Any, Iterable, Literal, Tuple
+
+_MAX_X_TICKS = 20
 
 
 def bumplot(
     x: str,
     y_columns: Iterable[str | tuple[str, BumpOpts]],
-    data: IntoDataFrame,
+    data: IntoFrame,
     curve_force: float = 1,
     invert_y_axis: bool = True,
     colors: Iterable[str] | None = None,
@@ -31,7 +40,22 @@ def bumplot(
     scatter_kwargs: dict[str, Any] = {},
     ax: Axes | None = None,
     ordinal_labels: bool = False,
-) -> Tuple[Axes, dict[str, Tuple[PathPatch, PathCollection]]]:
+    collection: bool = False,
+    engine: RankEngine = "numpy",
+    cache: BumpCache | None = None,
+    simplify: bool | Literal["pixels"] = False,
+    rasterize_above: int | RasterizePolicy | None = None,
+    styles: SeriesStyles | None = None,
+    chunk_size: int | None = None,
+    workers: int | None = None,
+    start_labels: bool = False,
+    end_labels: bool = False,
+    x_locator: int | Locator | None = None,
+) -> Tuple[
+    Axes,
+    dict[str, Tuple[PathPatch, PathCollection]]
+    | dict[str, Tuple[CollectionView, CollectionView]],
+]:
     """
     Creates bump plot, or bump chart, from multiple numerical
     columns.
@@ -42,7 +66,11 @@ def bumplot(
     Args:
         x: colname of the x-axis variable
         y_columns: colnames of the y-axis variables and their plotting options.
-        data: A dataframe
+        data: A dataframe, eager or lazy (e.g. a Polars `LazyFrame` or a
+            DuckDB relation). Lazy frames are collected once, with only the
+            `x` and `y_columns` columns selected. Missing values (nulls or
+            NaN) are not ranked: the curve of that series is interrupted
+            around them, and they get no marker.
         curve_force: Smoothing factor controlling curve tightness. Higher
             values increase curvature by moving control points further away
             from the anchors.
@@ -52,80 +80,512 @@ def bumplot(
         scatter_kwargs: Additional arguments passed to `scatter()`
         ax: The matplotlib Axes used. Default to `plt.gca()`
         ordinal_labels: If True, converts y-axis labels to ordinal numbers (1st, 2nd, 3rd, etc.)
+        collection: If True, draws all curves as one `PathCollection` and all
+            markers as one `scatter()` instead of one artist per series (series
+            that differ in options such as `zorder` or `marker` are split into
+            separate collections). Much faster with thousands of series. The
+            returned artists are then `CollectionView` handles into the shared
+            collections, and markers carry no legend label.
+        engine: How ranks are computed: `"numpy"` ranks a single 2D array
+            with a stable argsort, `"narwhals"` runs the ranking in the
+            dataframe backend. Both give the same ordinal ranks, with nulls
+            and NaN values as missing points, and `"numpy"` falls back to
+            `"narwhals"` for non-numeric columns.
+        cache: An optional `BumpCache`. When the same data is plotted again
+            through the same cache, the ranking and (for the same
+            `curve_force`) the Bézier geometry are reused.
+        simplify: If True, each run of periods where a series keeps the same
+            rank is drawn as one straight segment, and Bézier control points
+            are only emitted where the rank changes, so paths (and vector
+            exports) scale with the number of rank changes. With `"pixels"`,
+            segments narrower than one pixel of `ax` are straightened too.
+        rasterize_above: When to rasterize curves and markers in vector
+            exports, keeping axes, ticks and labels vector: either a number
+            of series, or a `RasterizePolicy` with `series` and/or
+            `vertices` thresholds. Keeps PDF/SVG size and export time
+            bounded on large data. The raster resolution is set with
+            `savefig(dpi=...)`.
+        styles: Data-driven styling of many series at once: a
+            `SeriesStyles` with per-series arrays (or a colormap and one
+            value per series) for colors, line widths, alphas and marker
+            sizes. Resolved once into arrays, and applied in bulk to the
+            collections with `collection=True`. Takes precedence over
+            `colors`, `BumpOpts` and the kwargs.
+        chunk_size: If given, periods are ranked in blocks of that many rows,
+            concurrently, and written into a preallocated rank matrix, so the
+            memory used by ranking is bounded by `chunk_size` rather than by
+            the number of periods. Meant for very long histories in wide
+            format (one row per x value).
+        workers: Number of threads ranking blocks with `chunk_size`. Default
+            to the number of CPUs.
+        start_labels: If True, the y tick labels on the left show the name of
+            the series starting at each rank, in its color, instead of the
+            rank numbers.
+        end_labels: If True, the names of the series ending at each rank are
+            shown on the right, in their color, as the tick labels of a
+            secondary y axis. Labels are placed from the rank matrix: one tick
+            per rank, so they never overlap and no text extent is measured.
+        x_locator: How the x ticks are thinned, so the number of tick labels
+            stays bounded with many periods: at most this many evenly spaced
+            periods get a tick (default 20), or a matplotlib `Locator` places
+            the ticks, with categorical x values (strings, dates) labelled
+            at their integer positions.
     Returns:
         The matplotlib Axes with the bump plot
     """
-    _plot_ax: Axes = ax if ax is not None else plt.gca()
-    colors_iterable = (
-        colors
-        if colors is not None
-        else plt.rcParams["axes.prop_cycle"].by_key()["color"]
-    )
+    _plot_ax: Axes = ax if ax is not None else _gca()
 
     y_bumps: list[tuple[str, BumpOpts]] = [
         (y, BumpOpts()) if isinstance(y, str) else y for y in y_columns
     ]
-    ranked: IntoDataFrame = _ranked_df(data, x=x, y_columns=[y for y, _ in y_bumps])
-    x_values_raw: np.ndarray = np.ravel(ranked.select(x).to_numpy())
+    x_values_raw, y_matrix = (_rank_matrix if cache is None else cache.rank_matrix)(
+        data,
+        x=x,
+        y_columns=[y for y, _ in y_bumps],
+        engine=engine,
+        chunk_size=chunk_size,
+        workers=workers,
+    )
 
-    if np.issubdtype(x_values_raw.dtype, np.number):
-        x_values = x_values_raw
-        x_labels = x_values_raw
-    else:
-        uniques = list(dict.fromkeys(x_values_raw))  # preserves order
-        mapping = {val: i for i, val in enumerate(uniques)}
-        x_values = np.array([mapping[val] for val in x_values_raw], dtype=int)
-        x_labels = x_values_raw
+    artists = _plot_ranks(
+        _plot_ax,
+        x_values_raw=x_values_raw,
+        y_matrix=y_matrix,
+        y_bumps=y_bumps,
+        curve_force=curve_force,
+        invert_y_axis=invert_y_axis,
+        colors=colors,
+        plot_kwargs=plot_kwargs,
+        scatter_kwargs=scatter_kwargs,
+        ordinal_labels=ordinal_labels,
+        collection=collection,
+        cache=cache,
+        simplify=simplify,
+        rasterize_above=rasterize_above,
+        styles=styles,
+        start_labels=start_labels,
+        end_labels=end_labels,
+        x_locator=x_locator,
+    )
+    return _plot_ax, artists
 
-    artists = {}
-    for (name, bump_opts), color in zip(y_bumps, cycle(colors_iterable)):
-        y_values: np.ndarray = np.ravel(ranked.select(name).to_numpy())
-        vertices, codes = bezier_curve(
-            x=x_values,
-            y=y_values,
-            force=curve_force,
+
+def _gca() -> Axes:
+    """`plt.gca()`, importing pyplot (and its GUI backend) only when needed."""
+    import matplotlib.pyplot as plt
+
+    return plt.gca()
+
+
+def _plot_ranks(
+    ax: Axes,
+    x_values_raw: np.ndarray,
+    y_matrix: np.ndarray,
+    y_bumps: list[tuple[str, BumpOpts]],
+    curve_force: float,
+    invert_y_axis: bool,
+    colors: Iterable[str] | None,
+    plot_kwargs: dict[str, Any],
+    scatter_kwargs: dict[str, Any],
+    ordinal_labels: bool,
+    collection: bool,
+    cache: BumpCache | None,
+    simplify: bool | Literal["pixels"] = False,
+    rasterize_above: int | RasterizePolicy | None = None,
+    styles: SeriesStyles | None = None,
+    start_labels: bool = False,
+    end_labels: bool = False,
+    x_locator: int | Locator | None = None,
+) -> dict:
+    """
+    Draw an already ranked `(n_series, n_periods)` matrix on `ax`, with the
+    options of `bumplot()`, and return the artists of each series.
+    """
+    with _stage("encode_x"):
+        x_values, categories = _encode_x(x_values_raw)
+    with _stage("geometry") as stage:
+        vertices, codes = (bezier_curves if cache is None else cache.bezier_curves)(
+            x=x_values, y=y_matrix, force=curve_force
         )
+        stage.size = vertices.size
+
+    x_ticks, x_tick_labels = _x_ticks(x_values, categories)
+    return _draw_ranks(
+        ax,
+        x_values=x_values,
+        y_matrix=y_matrix,
+        vertices=vertices,
+        codes=codes,
+        x_ticks=x_ticks,
+        x_tick_labels=x_tick_labels,
+        x_categorical=categories is not None,
+        y_bumps=y_bumps,
+        invert_y_axis=invert_y_axis,
+        colors=colors,
+        plot_kwargs=plot_kwargs,
+        scatter_kwargs=scatter_kwargs,
+        ordinal_labels=ordinal_labels,
+        collection=collection,
+        simplify=simplify,
+        rasterize_above=rasterize_above,
+        styles=styles,
+        start_labels=start_labels,
+        end_labels=end_labels,
+        x_locator=x_locator,
+    )
+
+
+def _draw_ranks(
+    ax: Axes,
+    x_values: np.ndarray,
+    y_matrix: np.ndarray,
+    vertices: np.ndarray,
+    codes: np.ndarray,
+    x_ticks: np.ndarray,
+    x_tick_labels: np.ndarray,
+    x_categorical: bool,
+    y_bumps: list[tuple[str, BumpOpts]],
+    invert_y_axis: bool,
+    colors: Iterable[str] | None,
+    plot_kwargs: dict[str, Any],
+    scatter_kwargs: dict[str, Any],
+    ordinal_labels: bool,
+    collection: bool,
+    simplify: bool | Literal["pixels"] = False,
+    rasterize_above: int | RasterizePolicy | None = None,
+    styles: SeriesStyles | None = None,
+    start_labels: bool = False,
+    end_labels: bool = False,
+    x_locator: int | Locator | None = None,
+) -> dict:
+    """
+    Draw the precomputed geometry of a bump plot (numeric x positions, rank
+    matrix and Bézier vertices) on `ax`, and return the artists of each
+    series. No dataframe work happens here.
+    """
+    colors_iterable = (
+        colors
+        if colors is not None
+        else mpl.rcParams["axes.prop_cycle"].by_key()["color"]
+    )
 
-        path: Path = Path(vertices=vertices, codes=codes)
-        patch: PathPatch = patches.PathPatch(
-            path=path,
-            facecolor="none",
-            **ChainMap(
-                _get_plot_kwargs(bump_opts),
-                normalize_kwargs(plot_kwargs, PathPatch),
-                {"edgecolor": color},
-            ),
+    with _stage("paths") as stage:
+        if simplify:
+            min_width = _pixel_width(ax, x_values) if simplify == "pixels" else 0.0
+            paths = [Path(v, c) for v, c in simplify_curves(vertices, min_width)]
+        else:
+            paths = _curve_paths(vertices, codes, y_matrix)
+        stage.size = len(paths)
+    with _stage("styles") as stage:
+        resolved = _resolve_styles(styles, len(y_bumps)) if styles else None
+        # Collections read the styles in bulk: their kwargs don't need the
+        # colors styles replace, and are shared between similar series
+        plot_kwargs_list, scatter_kwargs_list = _resolve_kwargs(
+            y_bumps,
+            None
+            if collection and resolved and "color" in resolved
+            else colors_iterable,
+            plot_kwargs,
+            scatter_kwargs,
+            share=collection,
         )
-        _plot_ax.add_patch(patch)
-
-        scatter = _plot_ax.scatter(
-            x_values,
-            y_values,
-            label=name,
-            **ChainMap(
-                _get_scatter_kwargs(bump_opts),
-                normalize_kwargs(scatter_kwargs, PathCollection),
-                {"facecolor": color},
-            ),
+        if resolved and not collection:
+            _apply_styles(plot_kwargs_list, scatter_kwargs_list, resolved)
+        stage.size = len(plot_kwargs_list)
+
+    with _stage("artists") as stage:
+        draw_kwargs: dict[str, Any] = dict(
+            names=[name for name, _ in y_bumps],
+            x_values=x_values,
+            y_matrix=y_matrix,
+            paths=paths,
+            plot_kwargs_list=plot_kwargs_list,
+            scatter_kwargs_list=scatter_kwargs_list,
         )
+        if collection:
+            artists = _draw_collections(ax, styles=resolved, **draw_kwargs)
+        else:
+            artists = _draw_artists(ax, **draw_kwargs)
+        stage.size = len(artists)
+
+    if rasterize_above is not None and _should_rasterize(
+        rasterize_above,
+        n_series=len(paths),
+        n_vertices=sum(len(path.vertices) for path in paths),
+    ):
+        with _stage("rasterize"):
+            _rasterize(artists)
+
+    with _stage("ticks"):
+        _set_rank_ticks(ax, len(y_bumps), invert_y_axis, ordinal_labels)
+        _apply_x_ticks(ax, x_ticks, x_tick_labels, x_categorical, x_locator)
+
+    if start_labels or end_labels:
+        with _stage("labels"):
+            names = [name for name, _ in y_bumps]
+            label_colors = (
+                list(resolved["color"])
+                if resolved and "color" in resolved
+                else [kw.get("edgecolor", kw.get("color")) for kw in plot_kwargs_list]
+            )
+            if start_labels:
+                _set_series_labels(ax, names, y_matrix, label_colors, end=False)
+            if end_labels:
+                labels_ax = ax.secondary_yaxis("right")
+                _set_series_labels(labels_ax, names, y_matrix, label_colors, end=True)
+
+    return artists
+
+
+def _curve_paths(
+    vertices: np.ndarray, codes: np.ndarray, y_matrix: np.ndarray
+) -> list[Path]:
+    """
+    One `Path` per series from the output of `bezier_curves()`, split at
+    missing (NaN) points with `gap_curves()` when there are any.
+    """
+    if np.isnan(y_matrix).any():
+        return [Path(v, c) for v, c in gap_curves(vertices)]
+    return [Path(v, codes) for v in vertices]
+
+
+def _pixel_width(ax: Axes, x_values: np.ndarray) -> float:
+    """Approximate width of one pixel of `ax`, in x data units."""
+    if len(x_values) == 0:
+        return 0.0
+    return float(np.ptp(x_values)) / max(ax.get_window_extent().width, 1.0)
+
+
+def _resolve_kwargs(
+    y_bumps: list[tuple[str, BumpOpts]],
+    colors: Iterable[str] | None,
+    plot_kwargs: dict[str, Any],
+    scatter_kwargs: dict[str, Any],
+    share: bool = False,
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """
+    Merge the per-series `BumpOpts`, the global kwargs and the series color
+    into Matplotlib keyword arguments for each line and each scatter.
+
+    With `colors=None`, no color is set (e.g. when styles set it). With
+    `share`, series without `BumpOpts` and with the same color get the same
+    dicts, which must then not be modified: without any `BumpOpts`, there
+    are only as many distinct dicts as colors.
+    """
+    # The global kwargs are the same for every series: normalize them once
+    plot_kwargs = normalize_kwargs(plot_kwargs, PathPatch)
+    scatter_kwargs = normalize_kwargs(scatter_kwargs, PathCollection)
+
+    shared: dict[int, tuple[dict[str, Any], dict[str, Any]]] = {}
+    plot_kwargs_list: list[dict[str, Any]] = []
+    scatter_kwargs_list: list[dict[str, Any]] = []
+    for (_, bump_opts), color in zip(
+        y_bumps, repeat(None) if colors is None else cycle(colors)
+    ):
+        # Colors repeat as the same objects, so they are told apart by id
+        if share and not bump_opts and id(color) in shared:
+            line_kw, scatter_kw = shared[id(color)]
+        else:
+            line_kw = dict(
+                ChainMap(
+                    _get_plot_kwargs(bump_opts),
+                    plot_kwargs,
+                    {} if color is None else {"edgecolor": color},
+                )
+            )
+            scatter_kw = dict(
+                ChainMap(
+                    _get_scatter_kwargs(bump_opts),
+                    scatter_kwargs,
+                    {} if color is None else {"facecolor": color},
+                )
+            )
+            if share and not bump_opts:
+                shared[id(color)] = (line_kw, scatter_kw)
+        plot_kwargs_list.append(line_kw)
+        scatter_kwargs_list.append(scatter_kw)
+    return plot_kwargs_list, scatter_kwargs_list
+
+
+def _draw_artists(
+    ax: Axes,
+    names: list[str],
+    x_values: np.ndarray,
+    y_matrix: np.ndarray,
+    paths: list[Path],
+    plot_kwargs_list: list[dict[str, Any]],
+    scatter_kwargs_list: list[dict[str, Any]],
+) -> dict[str, Tuple[PathPatch, PathCollection]]:
+    """
+    Draw one `PathPatch` and one `scatter()` per series. Missing (NaN)
+    points get no marker.
+    """
+    present = ~np.isnan(y_matrix)
+    gaps = not present.all()
+
+    artists = {}
+    for name, y_values, path, line_kw, scatter_kw, mask in zip(
+        names, y_matrix, paths, plot_kwargs_list, scatter_kwargs_list, present
+    ):
+        patch: PathPatch = patches.PathPatch(path=path, facecolor="none", **line_kw)
+        ax.add_patch(patch)
+
+        if gaps:
+            scatter = ax.scatter(
+                x_values[mask], y_values[mask], label=name, **scatter_kw
+            )
+        else:
+            scatter = ax.scatter(x_values, y_values, label=name, **scatter_kw)
         artists[name] = (patch, scatter)
+    return artists
+
 
-    ticks: list[int] = list(range(1, len(y_bumps) + 1))
+def _set_rank_ticks(
+    ax: Axes, n_series: int, invert_y_axis: bool, ordinal_labels: bool
+) -> None:
+    """
+    Put one y tick per rank, labelled with plain or ordinal numbers.
+    """
+    ticks: list[int] = list(range(1, n_series + 1))
 
     if invert_y_axis:
-        _plot_ax.invert_yaxis()
+        ax.invert_yaxis()
     else:
         ticks: list[int] = list(reversed(ticks))
 
-    _plot_ax.set_yticks(ticks=ticks)
+    ax.set_yticks(ticks=ticks)
 
     labels = (
         [_to_ordinal(tick) for tick in ticks]
         if ordinal_labels
         else [str(tick) for tick in ticks]
     )
-    _plot_ax.set_yticklabels(labels)
+    ax.set_yticklabels(labels)
 
-    _plot_ax.set_xticks(ticks=np.unique(x_values), labels=np.unique(x_labels))
 
-    return _plot_ax, artists
+def _set_series_labels(
+    ax: Axes,
+    names: list[str],
+    y_matrix: np.ndarray,
+    colors: list[Any],
+    end: bool,
+) -> None:
+    """
+    Put one y tick per rank of the first (or last) period of each series,
+    labelled with its name and colored like it.
+
+    Series missing from the first (or last) period are labelled at their
+    first (or last) rank. Series sharing that rank share its label.
+    """
+    present = ~np.isnan(y_matrix)
+    if end:
+        periods = y_matrix.shape[1] - 1 - np.argmax(present[:, ::-1], axis=1)
+    else:
+        periods = np.argmax(present, axis=1)
+    ranks = y_matrix[np.arange(len(y_matrix)), periods]
+
+    series_at: dict[int, list[int]] = {}
+    for i in np.flatnonzero(present.any(axis=1)).tolist():
+        series_at.setdefault(int(ranks[i]), []).append(i)
+    ticks = sorted(series_at)
+
+    ax.set_yticks(
+        ticks=ticks,
+        labels=[", ".join(names[i] for i in series_at[tick]) for tick in ticks],
+    )
+    for tick, label in zip(ticks, ax.get_yticklabels()):
+        series = series_at[tick]
+        if len(series) == 1 and colors[series[0]] is not None:
+            label.set_color(colors[series[0]])
+
+
+def _x_ticks(
+    x_values: np.ndarray, categories: dict[Any, int] | None
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    One x tick per period, labelled with the original x values. Dates and
+    datetimes are written in ISO format, at the coarsest unit that doesn't
+    lose information (e.g. `2024-01` for monthly data).
+
+    Returns:
+        ticks: The tick positions.
+        labels: The tick labels.
+    """
+    if categories is None:
+        ticks = np.unique(x_values)
+        return ticks, ticks
+    labels = np.empty(len(categories), dtype=object)
+    labels[:] = list(categories)
+    if len(labels) and all(isinstance(label, np.datetime64) for label in labels):
+        labels[:] = _format_dates(np.array(list(categories)))
+    return np.array(list(categories.values()), dtype=int), labels
+
+
+def _format_dates(values: np.ndarray) -> np.ndarray:
+    """Format datetime64 values as ISO strings, at the coarsest exact unit."""
+    for unit in ("Y", "M", "D", "m", "s", "ms", "us"):
+        if (values.astype(f"datetime64[{unit}]") == values).all():
+            return np.datetime_as_string(values, unit=unit)
+    return np.datetime_as_string(values)
+
+
+def _set_x_ticks(
+    ax: Axes,
+    x_values: np.ndarray,
+    categories: dict[Any, int] | None,
+    x_locator: int | Locator | None = None,
+) -> None:
+    """
+    Put one x tick per period, labelled with the original x values, thinned
+    by `x_locator`.
+    """
+    ticks, labels = _x_ticks(x_values, categories)
+    _apply_x_ticks(ax, ticks, labels, categories is not None, x_locator)
+
+
+def _apply_x_ticks(
+    ax: Axes,
+    ticks: np.ndarray,
+    labels: np.ndarray,
+    categorical: bool,
+    x_locator: int | Locator | None = None,
+) -> None:
+    """
+    Set the x ticks of `ax` from the ticks of every period, keeping the number
+    of tick artists bounded however many periods there are.
+
+    With a `Locator`, it places the ticks and `categorical` x values (whose
+    ticks are integer positions) are looked up at those positions. Otherwise,
+    at most `x_locator` (default 20) evenly spaced periods get a tick.
+    """
+    if isinstance(x_locator, Locator):
+        ax.xaxis.set_major_locator(x_locator)
+        if categorical:
+            ax.xaxis.set_major_formatter(
+                FuncFormatter(partial(_category_label, labels))
+            )
+        return
+
+    ticks, labels = _thin_ticks(ticks, labels, x_locator)
+    ax.set_xticks(ticks=ticks, labels=labels)
+
+
+def _thin_ticks(
+    ticks: np.ndarray, labels: np.ndarray, max_ticks: int | None = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """Keep every n-th tick, so that there are at most `max_ticks` of them."""
+    max_ticks = _MAX_X_TICKS if max_ticks is None else max_ticks
+    if max_ticks < 1:
+        raise ValueError(f"x_locator must be at least 1, got {max_ticks}.")
+    step = -(-len(ticks) // max_ticks)
+    if step <= 1:
+        return ticks, labels
+    return ticks[::step], labels[::step]
+
+
+def _category_label(labels: np.ndarray, position: float, _: Any = None) -> str:
+    """The label of a categorical x position, empty between categories."""
+    index = round(position)
+    if index != position or not 0 <= index < len(labels):
+        return ""
+    return str(labels[index])
@@ -0,0 +1,155 @@
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+import threading
+import time
+
+
+@dataclass
+class StageStats:
+    """
+    Accumulated measurements of one internal stage, see
+    [`profile()`](./profile.md).
+
+    Attributes:
+        calls: Number of times the stage ran.
+        seconds: Total wall time spent in the stage.
+        size: Total size of what the stage produced (number of array
+            elements for arrays, number of series for artists), or 0 if the
+            stage doesn't report one.
+    """
+
+    calls: int = 0
+    seconds: float = 0.0
+    size: int = 0
+
+
+@dataclass
+class Profile:
+    """
+    Measurements collected by [`profile()`](./profile.md).
+
+    Attributes:
+        stages: Measurements of each stage, by name, in the order the stages
+            first ran.
+    """
+
+    stages: dict[str, StageStats] = field(default_factory=dict)
+    _on_stage: Callable[[str, float, int], None] | None = field(
+        default=None, repr=False
+    )
+    # Stages of chunked ranking are recorded from several threads
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @property
+    def seconds(self) -> float:
+        """Total wall time spent in all stages."""
+        return sum(stats.seconds for stats in self.stages.values())
+
+    def _record(self, name: str, seconds: float, size: int) -> None:
+        with self._lock:
+            stats = self.stages.get(name)
+            if stats is None:
+                stats = self.stages[name] = StageStats()
+            stats.calls += 1
+            stats.seconds += seconds
+            stats.size += size
+        if self._on_stage is not None:
+            self._on_stage(name, seconds, size)
+
+
+# Profiles active in the current context. Empty when profiling is disabled,
+# in which case stages cost a single lookup.
+_active: ContextVar[tuple[Profile, ...]] = ContextVar("bumplot_profiles", default=())
+
+
+@contextmanager
+def profile(
+    on_stage: Callable[[str, float, int], None] | None = None,
+) -> Iterator[Profile]:
+    """
+    Measure the internal stages of the bump plots drawn in this block.
+
+    Every stage run inside the `with` block (ranking, conversion to NumPy,
+    Bézier geometry, artist creation, tick layout, ...) reports its wall
+    time, and the size of what it produced. Outside of a `profile()` block,
+    stages are not timed at all.
+
+    Profiling is scoped to the current thread (and `asyncio` task), and
+    blocks can be nested: each active profile sees every stage. The worker
+    threads of chunked ranking (`chunk_size`) report their stages to the
+    profiles of the calling thread: the `collect`, `to_numpy` and `rank` of
+    every block, inside the overall `rank_chunks` stage. Since blocks run
+    concurrently, their times can add up to more than its wall time.
+
+    ```python
+    with bumplot.profile() as prof:
+        bumplot.bumplot("x", ["A", "B"], df)
+
+    for name, stats in prof.stages.items():
+        print(name, stats.calls, stats.seconds, stats.size)
+    ```
+
+    Args:
+        on_stage: An optional callback, called as
+            `on_stage(name, seconds, size)` each time a stage ends, e.g. to
+            forward timings to service logs.
+
+    Returns:
+        A `Profile`, filled as stages run.
+    """
+    prof = Profile(_on_stage=on_stage)
+    token = _active.set((*_active.get(), prof))
+    try:
+        yield prof
+    finally:
+        _active.reset(token)
+
+
+class _Stage:
+    """Times one run of a stage. Set `size` before the block ends."""
+
+    __slots__ = ("name", "size", "_profiles", "_start")
+
+    def __init__(self, name: str, profiles: tuple[Profile, ...]):
+        self.name = name
+        self.size = 0
+        self._profiles = profiles
+
+    def __enter__(self) -> "_Stage":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        seconds = time.perf_counter() - self._start
+        for prof in self._profiles:
+            prof._record(self.name, seconds, int(self.size))
+
+
+class _NullStage:
+    """Stand-in for `_Stage` when profiling is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullStage":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+    def __setattr__(self, name: str, value) -> None:
+        pass
+
+
+_NULL_STAGE = _NullStage()
+
+
+def _stage(name: str) -> _Stage | _NullStage:
+    """
+    Context manager timing the stage `name` for the active profiles, if any.
+    """
+    profiles = _active.get()
+    if not profiles:
+        return _NULL_STAGE
+    return _Stage(name, profiles)
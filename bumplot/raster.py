@@ -0,0 +1,46 @@
+from typing import TypedDict
+
+from matplotlib.artist import Artist
+
+
+class RasterizePolicy(TypedDict, total=False):
+    """
+    Typed dictionary describing when [`bumplot()`](./bumplot.md) draws its
+    curves and markers as a raster image in vector exports (PDF, SVG, ...).
+
+    Rasterization kicks in as soon as one of the given thresholds is
+    exceeded. Axes, ticks and labels always stay vector. The resolution of
+    the raster image is set when exporting, with `savefig(dpi=...)`.
+
+    Keys:
+        series: Maximum number of series kept as vector data.
+        vertices: Maximum total number of path vertices kept as vector data.
+    """
+
+    series: int
+    vertices: int
+
+
+def _should_rasterize(
+    policy: int | RasterizePolicy, n_series: int, n_vertices: int
+) -> bool:
+    """Whether the policy (an `int` is a series threshold) is exceeded."""
+    if isinstance(policy, int):
+        policy = RasterizePolicy(series=policy)
+    return n_series > policy.get("series", n_series) or n_vertices > policy.get(
+        "vertices", n_vertices
+    )
+
+
+def _rasterize(artists: dict) -> None:
+    """
+    Rasterize every curve and marker artist in `artists` (per-series artists
+    or `CollectionView`s), leaving the rest of `ax` vector.
+    """
+    rasterized: dict[int, Artist] = {}
+    for pair in artists.values():
+        for handle in pair:
+            artist = getattr(handle, "collection", handle)
+            rasterized[id(artist)] = artist
+    for artist in rasterized.values():
+        artist.set_rasterized(True)
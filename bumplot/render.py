@@ -0,0 +1,145 @@
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from itertools import islice
+import os
+from pathlib import Path
+import traceback
+from typing import Any, NamedTuple
+
+import matplotlib
+from matplotlib.axes import Axes
+from matplotlib.figure import Figure
+
+from .main import bumplot
+
+
+class RenderResult(NamedTuple):
+    """
+    Outcome of rendering one chart with [`render_many()`](./render.md).
+
+    Attributes:
+        name: The `name` of the chart spec.
+        path: The written file, or `None` if rendering failed.
+        error: The formatted traceback if rendering failed, `None` otherwise.
+    """
+
+    name: str
+    path: Path | None
+    error: str | None
+
+
+# One Figure and Axes per worker process, reused from one chart to the next
+_worker_axes: Axes | None = None
+
+
+def render_many(
+    specs: Iterable[dict[str, Any]],
+    out_dir: str | os.PathLike,
+    workers: int | None = None,
+    format: str = "png",
+    savefig_kwargs: dict[str, Any] = {},
+    max_charts_per_worker: int | None = 500,
+) -> Iterator[RenderResult]:
+    """
+    Render many bump charts to image files, in parallel.
+
+    Each spec is a dict of [`bumplot()`](./bumplot.md) keyword arguments
+    (so it must hold `x`, `y_columns` and a picklable `data`), plus:
+
+    - `name` (required): file name of the chart, without extension.
+    - `figsize` (optional): size of the figure in inches.
+    - `title` (optional): title of the Axes.
+
+    Charts are rendered on a process pool with the non-interactive Agg
+    backend. Each worker reuses a single Figure and Axes, and only a bounded
+    number of specs is in flight at once. To keep the memory of workers
+    bounded, the whole pool is replaced once it has rendered
+    `max_charts_per_worker` charts per worker on average. Workers are
+    started with the platform's default method, so on Linux a plain script
+    doesn't need an `if __name__ == "__main__":` guard.
+
+    Results are yielded as soon as each chart is done, in completion order.
+    A failing chart doesn't stop the others: its result holds the error.
+    Nothing is rendered until the returned iterator is consumed.
+
+    Args:
+        specs: The chart specs.
+        out_dir: Directory where files are written. Created if needed.
+        workers: Number of worker processes. Default to the number of CPUs.
+        format: Image format passed to `savefig()` (e.g. `"png"`, `"svg"`).
+        savefig_kwargs: Additional arguments passed to `savefig()`.
+        max_charts_per_worker: Number of charts per worker after which the
+            worker processes are replaced. `None` keeps them for the whole
+            run.
+
+    Returns:
+        An iterator of `RenderResult`, one per spec.
+    """
+    if max_charts_per_worker is not None and max_charts_per_worker < 1:
+        raise ValueError("max_charts_per_worker must be at least 1.")
+    out_path = Path(out_dir)
+    out_path.mkdir(parents=True, exist_ok=True)
+    n_workers = workers or os.cpu_count() or 1
+    charts_per_pool = (
+        None if max_charts_per_worker is None else max_charts_per_worker * n_workers
+    )
+
+    # Workers are recycled by replacing the pool rather than with
+    # `max_tasks_per_child`, which forces the "spawn" start method
+    remaining = iter(specs)
+    exhausted = False
+    while not exhausted:
+        with ProcessPoolExecutor(
+            max_workers=n_workers, initializer=_init_worker
+        ) as executor:
+            pending: set[Future[RenderResult]] = set()
+            n_submitted = 0
+            for spec in islice(remaining, charts_per_pool):
+                if "name" not in spec:
+                    raise ValueError("Every chart spec needs a 'name'.")
+                if len(pending) >= 2 * n_workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    yield from (future.result() for future in done)
+                pending.add(
+                    executor.submit(_render_one, spec, out_path, format, savefig_kwargs)
+                )
+                n_submitted += 1
+            exhausted = charts_per_pool is None or n_submitted < charts_per_pool
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                yield from (future.result() for future in done)
+
+
+def _init_worker() -> None:
+    matplotlib.use("Agg")
+
+
+def _render_one(
+    spec: dict[str, Any],
+    out_dir: Path,
+    format: str,
+    savefig_kwargs: dict[str, Any],
+) -> RenderResult:
+    """Render one spec on the worker's reusable Axes."""
+    global _worker_axes
+
+    spec = dict(spec)
+    name = str(spec.pop("name"))
+    figsize = spec.pop("figsize", matplotlib.rcParams["figure.figsize"])
+    title = spec.pop("title", None)
+
+    if _worker_axes is None:
+        _worker_axes = Figure().add_subplot()
+    ax = _worker_axes
+    ax.clear()
+    ax.figure.set_size_inches(figsize)
+
+    try:
+        bumplot(ax=ax, **spec)
+        if title is not None:
+            ax.set_title(title)
+        path = out_dir / f"{name}.{format}"
+        ax.figure.savefig(path, format=format, **savefig_kwargs)
+    except Exception:
+        return RenderResult(name=name, path=None, error=traceback.format_exc())
+    return RenderResult(name=name, path=path, error=None)
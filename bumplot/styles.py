@@ -0,0 +1,117 @@
+from typing import Any, TypedDict
+
+import matplotlib as mpl
+from matplotlib.colors import Colormap, Normalize, to_rgba_array
+from numpy.typing import ArrayLike
+import numpy as np
+
+
+class SeriesStyles(TypedDict, total=False):
+    """
+    Columnar, data-driven styling of many series at once, see
+    [`bumplot()`](./bumplot.md).
+
+    Each field holds either one value per series (in the order of
+    `y_columns`) or a single value shared by all series. Fields are resolved
+    once into NumPy arrays (RGBA colors, widths, sizes), and take precedence
+    over `colors`, `BumpOpts` and the plotting kwargs.
+
+    Attributes:
+        color: One color per series, applied to its line and markers.
+        values: One number per series, mapped to a color through `cmap`
+            (instead of `color`).
+        cmap: The colormap (or its name) used with `values`. Default to
+            `rcParams["image.cmap"]`.
+        vmin: Value mapped to the lowest color. Default to `min(values)`.
+        vmax: Value mapped to the highest color. Default to `max(values)`.
+        line_width: Width of the lines.
+        line_alpha: Opacity of the lines.
+        marker_size: Size of the markers, in points ** 2.
+        marker_alpha: Opacity of the markers.
+    """
+
+    color: ArrayLike
+    values: ArrayLike
+    cmap: str | Colormap
+    vmin: float
+    vmax: float
+    line_width: ArrayLike
+    line_alpha: ArrayLike
+    marker_size: ArrayLike
+    marker_alpha: ArrayLike
+
+
+_NUMERIC_KEYS = ("line_width", "line_alpha", "marker_size", "marker_alpha")
+
+
+def _resolve_styles(styles: SeriesStyles, n_series: int) -> dict[str, np.ndarray]:
+    """
+    Resolve `SeriesStyles` into arrays with one row per series: `"color"`
+    as RGBA of shape `(n_series, 4)`, the others of shape `(n_series,)`.
+    """
+    unsupported_keys = styles.keys() - SeriesStyles.__annotations__
+    if unsupported_keys:
+        unsupported_repr = ", ".join(map(repr, sorted(unsupported_keys)))
+        raise TypeError(f"SeriesStyles got unexpected key(s): {unsupported_repr}")
+    if "color" in styles and "values" in styles:
+        raise ValueError("Pass either 'color' or 'values' in styles, not both.")
+
+    resolved: dict[str, np.ndarray] = {}
+    if "color" in styles:
+        colors = styles["color"]
+        rgba = to_rgba_array([colors] if isinstance(colors, str) else colors)
+        resolved["color"] = _per_series(rgba, n_series, "color")
+    elif "values" in styles:
+        values = np.asarray(styles["values"], dtype=float)
+        cmap = mpl.colormaps.get_cmap(styles.get("cmap"))
+        norm = Normalize(vmin=styles.get("vmin"), vmax=styles.get("vmax"))
+        resolved["color"] = _per_series(cmap(norm(values)), n_series, "values")
+
+    for key in _NUMERIC_KEYS:
+        if key in styles:
+            values = np.asarray(styles[key], dtype=float)  # type: ignore[literal-required]
+            resolved[key] = _per_series(values, n_series, key)
+    return resolved
+
+
+def _per_series(values: np.ndarray, n_series: int, key: str) -> np.ndarray:
+    """Broadcast a single value to all series, or check there's one per series."""
+    if values.ndim == 0:
+        return np.full(n_series, values)
+    if len(values) == 1:
+        return np.repeat(values, n_series, axis=0)
+    if len(values) != n_series:
+        raise ValueError(
+            f"styles[{key!r}] has {len(values)} values but there are {n_series} series."
+        )
+    return values
+
+
+def _apply_styles(
+    plot_kwargs_list: list[dict[str, Any]],
+    scatter_kwargs_list: list[dict[str, Any]],
+    resolved: dict[str, np.ndarray],
+) -> None:
+    """
+    Write resolved styles into the per-series kwargs (in place), for
+    renderers that draw one artist per series.
+    """
+    color = resolved.get("color")
+    line_width = resolved.get("line_width")
+    line_alpha = resolved.get("line_alpha")
+    marker_size = resolved.get("marker_size")
+    marker_alpha = resolved.get("marker_alpha")
+    for i, (line_kw, scatter_kw) in enumerate(
+        zip(plot_kwargs_list, scatter_kwargs_list)
+    ):
+        if color is not None:
+            line_kw["edgecolor"] = scatter_kw["facecolor"] = color[i]
+            scatter_kw["edgecolor"] = "face"
+        if line_width is not None:
+            line_kw["linewidth"] = line_width[i]
+        if line_alpha is not None:
+            line_kw["alpha"] = line_alpha[i]
+        if marker_size is not None:
+            scatter_kw["s"] = marker_size[i]
+        if marker_alpha is not None:
+            scatter_kw["alpha"] = marker_alpha[i]
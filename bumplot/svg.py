@@ -0,0 +1,373 @@
+from collections.abc import Iterable, Mapping
+from itertools import cycle
+import json
+from typing import Any
+from xml.sax.saxutils import escape, quoteattr
+
+import matplotlib as mpl
+from matplotlib.colors import to_hex, to_rgba
+from matplotlib.path import Path
+import numpy as np
+
+from .bezier import gap_curves, simplify_curves
+from .geometry import BumpGeometry
+from .main import _thin_ticks
+from .opts import BumpOpts
+from .styles import SeriesStyles, _resolve_styles
+from ._utils import _to_ordinal
+
+# Dash patterns of Matplotlib's named line styles, in line widths
+_DASHES = {
+    "--": (3.7, 1.6),
+    "dashed": (3.7, 1.6),
+    ":": (1.0, 1.65),
+    "dotted": (1.0, 1.65),
+    "-.": (6.4, 1.6, 1.0, 1.6),
+    "dashdot": (6.4, 1.6, 1.0, 1.6),
+}
+
+
+def to_svg(
+    geom: BumpGeometry,
+    width: float = 640,
+    height: float = 480,
+    opts: Mapping[str, BumpOpts] = {},
+    colors: Iterable[str] | None = None,
+    styles: SeriesStyles | None = None,
+    invert_y_axis: bool = True,
+    ordinal_labels: bool = False,
+    simplify: bool = False,
+    margin: float = 40,
+    precision: int = 1,
+    x_locator: int | None = None,
+) -> str:
+    """
+    Write a bump plot directly as an SVG document, without Matplotlib
+    figures or artists, e.g. to serve charts from a web endpoint.
+
+    Each series is one `<path>` for its curve and one `<path>` for all its
+    markers, drawn from the vertices of a
+    [`BumpGeometry`](./geometry.md). Colors, widths, alphas, line styles,
+    marker sizes and `zorder` follow the same `BumpOpts`, `colors` and
+    `styles` as [`bumplot()`](./bumplot.md). Line widths and marker sizes
+    are in SVG user units, like points in Matplotlib.
+
+    Args:
+        geom: The geometry to draw, from
+            [`compute_bump_geometry()`](./geometry.md).
+        width: Width of the SVG.
+        height: Height of the SVG.
+        opts: Plotting options of some series, by name.
+        colors: An optional list of colors
+        styles: Data-driven styling, see [`bumplot()`](./bumplot.md).
+        invert_y_axis: Whether the first rank is at the top.
+        ordinal_labels: If True, rank labels are ordinal numbers (1st, 2nd...)
+        simplify: Whether to simplify flat runs of the curves, see
+            [`bumplot()`](./bumplot.md).
+        margin: Space around the plot area, holding the tick labels.
+        precision: Number of decimals of the coordinates.
+        x_locator: At most this many evenly spaced periods get an x tick
+            label (default 20), see [`bumplot()`](./bumplot.md).
+
+    Returns:
+        The SVG document.
+    """
+    chart = _layout(
+        geom, width, height, opts, colors, styles, invert_y_axis, simplify, margin
+    )
+    number = f"{{:.{precision}f}}"
+    templates: dict[bytes, str] = {}
+
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" '
+        f'height="{height}" viewBox="0 0 {width} {height}">',
+        '<g font-family="sans-serif" font-size="10" fill="#333">',
+    ]
+    x_ticks, x_tick_labels = _thin_ticks(
+        chart["x_ticks"], geom.x_tick_labels, x_locator
+    )
+    for x, label in zip(x_ticks, x_tick_labels.tolist()):
+        parts.append(
+            f'<text x="{number.format(x)}" y="{number.format(height - margin / 2)}" '
+            f'text-anchor="middle">{escape(label)}</text>'
+        )
+    for rank, y in enumerate(chart["y_ticks"], start=1):
+        label = _to_ordinal(rank) if ordinal_labels else str(rank)
+        parts.append(
+            f'<text x="{number.format(margin / 2)}" y="{number.format(y)}" '
+            f'text-anchor="middle" dominant-baseline="central">{label}</text>'
+        )
+    parts.append('</g><g fill="none" stroke-linecap="round">')
+
+    for series in chart["series"]:
+        line, marker = series["line"], series["marker"]
+        parts.append(f"<g><title>{escape(series['name'])}</title>")
+        if len(series["vertices"]):
+            attrs = _attrs(
+                stroke=line["color"],
+                stroke_width=line["width"],
+                stroke_opacity=line["alpha"],
+                stroke_dasharray=line["dasharray"],
+            )
+            d = _path_data(series["vertices"], series["codes"], number, templates)
+            parts.append(f'<path d="{d}"{attrs}/>')
+        if len(series["points"]):
+            d = _marker_data(series["points"], number)
+            if marker["edgecolor"] is not None:
+                attrs = _attrs(
+                    stroke=marker["edgecolor"],
+                    stroke_width=marker["size"] + marker["edgewidth"],
+                    stroke_opacity=marker["alpha"],
+                )
+                parts.append(f'<path d="{d}"{attrs}/>')
+            attrs = _attrs(
+                stroke=marker["color"],
+                stroke_width=marker["size"]
+                - (marker["edgewidth"] if marker["edgecolor"] is not None else 0),
+                stroke_opacity=marker["alpha"],
+            )
+            parts.append(f'<path d="{d}"{attrs}/>')
+        parts.append("</g>")
+
+    parts.append("</g></svg>")
+    return "".join(parts)
+
+
+def to_json(
+    geom: BumpGeometry,
+    width: float = 640,
+    height: float = 480,
+    opts: Mapping[str, BumpOpts] = {},
+    colors: Iterable[str] | None = None,
+    styles: SeriesStyles | None = None,
+    invert_y_axis: bool = True,
+    simplify: bool = False,
+    margin: float = 40,
+    precision: int = 1,
+) -> str:
+    """
+    Write a bump plot as compact JSON, for client-side rendering.
+
+    The JSON holds, in SVG user units, the size of the chart, the tick
+    positions and labels, and for each series its name, style (CSS colors,
+    widths, alphas, marker size), SVG path data (`"d"`) and marker
+    positions. See [`to_svg()`](./svg.md) for the arguments.
+
+    Returns:
+        The JSON document.
+    """
+    chart = _layout(
+        geom, width, height, opts, colors, styles, invert_y_axis, simplify, margin
+    )
+    number = f"{{:.{precision}f}}"
+    templates: dict[bytes, str] = {}
+    document = {
+        "width": width,
+        "height": height,
+        "x_ticks": np.round(chart["x_ticks"], precision).tolist(),
+        "x_tick_labels": geom.x_tick_labels.tolist(),
+        "y_ticks": np.round(chart["y_ticks"], precision).tolist(),
+        "series": [
+            {
+                "name": series["name"],
+                "line": series["line"],
+                "marker": series["marker"],
+                "d": _path_data(series["vertices"], series["codes"], number, templates),
+                "points": np.round(series["points"], precision).tolist(),
+            }
+            for series in chart["series"]
+        ],
+    }
+    return json.dumps(document, separators=(",", ":"))
+
+
+def _layout(
+    geom: BumpGeometry,
+    width: float,
+    height: float,
+    opts: Mapping[str, BumpOpts],
+    colors: Iterable[str] | None,
+    styles: SeriesStyles | None,
+    invert_y_axis: bool,
+    simplify: bool,
+    margin: float,
+) -> dict[str, Any]:
+    """
+    Map the geometry to SVG coordinates, all series at once, and resolve
+    the style of each series. Series are sorted by `zorder`.
+    """
+    n_series = len(geom.names)
+    x_min, x_max = (
+        (geom.x_values.min(), geom.x_values.max()) if geom.x_values.size else (0, 0)
+    )
+    x_scale = (width - 2 * margin) / ((x_max - x_min) or 1)
+    # Ranks span half a rank beyond 1 and n_series, like Matplotlib's margins
+    y_scale = (height - 2 * margin) / max(n_series, 1)
+    y_first = margin + y_scale / 2
+
+    def to_x(x: np.ndarray) -> np.ndarray:
+        return margin + (x - x_min) * x_scale
+
+    def to_y(rank: np.ndarray) -> np.ndarray:
+        offset = (rank - 1) * y_scale
+        return y_first + offset if invert_y_axis else height - y_first - offset
+
+    vertices = np.empty(geom.vertices.shape, dtype=float)
+    vertices[..., 0] = to_x(geom.vertices[..., 0])
+    vertices[..., 1] = to_y(geom.vertices[..., 1])
+    if simplify:
+        paths = simplify_curves(vertices)
+    elif np.isnan(geom.ranks).any():
+        paths = gap_curves(vertices)
+    else:
+        paths = [(v, geom.codes) for v in vertices]
+    points = np.stack(
+        [np.broadcast_to(to_x(geom.x_values), geom.ranks.shape), to_y(geom.ranks)],
+        axis=-1,
+    )
+
+    resolved = _resolve_styles(styles, n_series) if styles else {}
+    colors_iterable = (
+        colors
+        if colors is not None
+        else mpl.rcParams["axes.prop_cycle"].by_key()["color"]
+    )
+    series = []
+    for i, (name, color, (path_vertices, path_codes)) in enumerate(
+        zip(geom.names.tolist(), cycle(colors_iterable), paths)
+    ):
+        bump_opts = opts.get(name, BumpOpts())
+        present = ~np.isnan(points[i, :, 1])
+        series.append(
+            {
+                "name": name,
+                "zorder": bump_opts.get("zorder", 0),
+                "line": _line_style(bump_opts, color, resolved, i),
+                "marker": _marker_style(bump_opts, color, resolved, i),
+                "vertices": path_vertices,
+                "codes": path_codes,
+                "points": points[i, present],
+            }
+        )
+    series.sort(key=lambda s: s["zorder"])
+
+    return {
+        "x_ticks": to_x(geom.x_ticks.astype(float)),
+        "y_ticks": to_y(np.arange(1, n_series + 1, dtype=float)),
+        "series": series,
+    }
+
+
+def _line_style(
+    bump_opts: BumpOpts, color: Any, resolved: dict[str, np.ndarray], i: int
+) -> dict[str, Any]:
+    """CSS style of the curve of one series."""
+    rgba = to_rgba(
+        resolved["color"][i]
+        if "color" in resolved
+        else bump_opts.get("line_color", color)
+    )
+    width = float(
+        resolved["line_width"][i]
+        if "line_width" in resolved
+        else bump_opts.get("line_width", mpl.rcParams["patch.linewidth"])
+    )
+    alpha = (
+        resolved["line_alpha"][i]
+        if "line_alpha" in resolved
+        else bump_opts.get("line_alpha", rgba[3])
+    )
+    dashes = _DASHES.get(bump_opts.get("line_style", "solid"))
+    return {
+        "color": to_hex(rgba),
+        "width": width,
+        "alpha": float(alpha),
+        "dasharray": None if dashes is None else [d * width for d in dashes],
+    }
+
+
+def _marker_style(
+    bump_opts: BumpOpts, color: Any, resolved: dict[str, np.ndarray], i: int
+) -> dict[str, Any]:
+    """CSS style of the markers of one series."""
+    if "color" in resolved:
+        facecolor = edgecolor = resolved["color"][i]
+    else:
+        facecolor = bump_opts.get("marker_facecolor", color)
+        edgecolor = bump_opts.get("marker_edgecolor")
+    rgba = to_rgba(facecolor)
+    size = (
+        resolved["marker_size"][i]
+        if "marker_size" in resolved
+        else bump_opts.get("marker_size", mpl.rcParams["lines.markersize"] ** 2)
+    )
+    alpha = (
+        resolved["marker_alpha"][i]
+        if "marker_alpha" in resolved
+        else bump_opts.get("marker_alpha", rgba[3])
+    )
+    has_edge = edgecolor is not None and to_hex(edgecolor) != to_hex(rgba)
+    return {
+        "color": to_hex(rgba),
+        "size": float(np.sqrt(size)),
+        "alpha": float(alpha),
+        "edgecolor": to_hex(edgecolor) if has_edge else None,
+        "edgewidth": float(
+            bump_opts.get("marker_edgewidth", mpl.rcParams["lines.linewidth"])
+        ),
+    }
+
+
+def _path_data(
+    vertices: np.ndarray, codes: np.ndarray, number: str, templates: dict[bytes, str]
+) -> str:
+    """
+    SVG path data of a Matplotlib path made of `MOVETO`, `LINETO` and
+    `CURVE4` codes. The whole string is formatted with a single template,
+    built once per distinct `codes` and kept in `templates`.
+    """
+    if len(vertices) == 0:
+        return ""
+    key = codes.tobytes()
+    template = templates.get(key)
+    if template is None:
+        template = templates[key] = _path_template(codes, number)
+    return template.format(*vertices.ravel().tolist())
+
+
+def _path_template(codes: np.ndarray, number: str) -> str:
+    is_curve = codes == Path.CURVE4
+    positions = np.arange(len(codes))
+    run_starts = np.maximum.accumulate(
+        np.where(is_curve & ~np.r_[False, is_curve[:-1]], positions, 0)
+    )
+    # Each run of CURVE4 codes is a sequence of (control, control, end) triples
+    starts_curve = is_curve & ((positions - run_starts) % 3 == 0)
+    commands = np.select(
+        [codes == Path.MOVETO, codes == Path.LINETO, starts_curve, is_curve],
+        ["M", "L", "C", " "],
+        default="L",
+    )
+    return "".join(f"{command}{number},{number}" for command in commands.tolist())
+
+
+def _marker_data(points: np.ndarray, number: str) -> str:
+    """
+    SVG path data drawing round markers as zero-length segments with round
+    caps, so that all the markers of a series are a single element.
+    """
+    return (f"M{number},{number}h0" * len(points)).format(*points.ravel().tolist())
+
+
+def _attrs(**attributes: Any) -> str:
+    """SVG presentation attributes, skipping `None` values and default opacity."""
+    parts = []
+    for key, value in attributes.items():
+        if value is None or (key.endswith("opacity") and value == 1):
+            continue
+        if isinstance(value, list):
+            value = " ".join(f"{v:g}" for v in value)
+        elif isinstance(value, float):
+            value = f"{value:g}"
+        parts.append(f" {key.replace('_', '-')}={quoteattr(str(value))}")
+    return "".join(parts)
@@ -0,0 +1,88 @@
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import pytest
+from matplotlib.animation import FuncAnimation
+
+import bumplot
+from bumplot.animation import _trajectories
+from bumplot.bezier import bezier_curves
+
+DATA = {
+    "x": [1, 2, 3, 4],
+    "y1": [7, 2, 2, 5],
+    "y2": [3, 2, 1, 10],
+    "y3": [5, 4, 10, 1],
+}
+
+
+def test_trajectories_hit_anchors_at_period_boundaries():
+    x = np.array([0, 1, 3])
+    y = np.array([[1, 2, 1], [2, 1, 2]])
+    vertices, _ = bezier_curves(x=x, y=y, force=0.5)
+
+    segments, partials = _trajectories(vertices, frames_per_period=4)
+
+    assert partials.shape == (9, 2, 4, 2)
+    assert segments.tolist() == [0, 0, 0, 0, 1, 1, 1, 1, 1]
+    heads = partials[:, :, 3]
+    np.testing.assert_allclose(heads[::4, :, 0], np.tile(x, (2, 1)).T)
+    np.testing.assert_allclose(heads[::4, :, 1], y.T)
+    # a full segment is the original segment
+    np.testing.assert_allclose(partials[-1], vertices[:, 3:7])
+
+
+def test_animate_updates_existing_artists():
+    _, ax = plt.subplots()
+    anim = bumplot.animate(
+        x="x",
+        y_columns=["y1", "y2", "y3"],
+        data=pd.DataFrame(DATA),
+        frames_per_period=5,
+        ax=ax,
+    )
+    assert isinstance(anim, FuncAnimation)
+
+    n_patches = len(ax.patches)
+    anim._func(7)
+    assert len(ax.patches) == n_patches
+    path = ax.patches[0].get_path()
+    assert len(path.vertices) == len(path.codes) == 3 * 1 + 4
+    assert len(ax.collections[0].get_offsets()) == 3
+
+    anim._func(15)
+    assert len(ax.patches[0].get_path().vertices) == 3 * 3 + 1
+
+    plt.close("all")
+
+
+def test_animate_needs_two_periods():
+    with pytest.raises(ValueError, match="two x values"):
+        bumplot.animate(x="x", y_columns=["y1"], data=pd.DataFrame(DATA)[:1])
+    plt.close("all")
+
+
+def test_animate_splits_curves_at_gaps():
+    _, ax = plt.subplots()
+    anim = bumplot.animate(
+        x="x",
+        y_columns=["y1", "y2", "y3"],
+        data=pd.DataFrame(DATA | {"y1": [7, None, 2, 5]}),
+        frames_per_period=5,
+        ax=ax,
+    )
+
+    for frame in range(16):
+        anim._func(frame)
+        for patch in ax.patches:
+            assert not np.isnan(patch.get_path().vertices).any()
+        for collection in ax.collections:
+            assert not np.isnan(collection.get_offsets()).any()
+
+    # y1 restarts after its missing point, at the third period
+    path = ax.patches[0].get_path()
+    assert path.codes.tolist().count(path.MOVETO) == 1
+    np.testing.assert_allclose(path.vertices[0], [3, 2])
+    assert len(ax.collections[0].get_offsets()) == 3
+
+    plt.close("all")
@@ -0,0 +1,167 @@
+import numpy as np
+import pytest
+from matplotlib.path import Path
+
+from bumplot.bezier import (
+    bezier_curve,
+    bezier_curves,
+    gap_curves,
+    sample_curves,
+    simplify_curves,
+)
+
+
+@pytest.mark.parametrize("force", [0, 0.5, 1, 5])
+def test_bezier_curves_matches_single_curve(force):
+    x = np.array([1, 2, 4, 7])
+    y = np.array([[1, 3, 2, 1], [2, 1, 3, 3], [3, 2, 1, 2]])
+
+    vertices, codes = bezier_curves(x=x, y=y, force=force)
+
+    assert vertices.shape == (3, 3 * (len(x) - 1) + 1, 2)
+    assert codes.shape == (3 * (len(x) - 1) + 1,)
+    for row, series_vertices in zip(y, vertices):
+        single_vertices, single_codes = bezier_curve(x=x, y=row, force=force)
+        np.testing.assert_allclose(series_vertices, np.array(single_vertices))
+        assert codes.tolist() == single_codes
+
+
+def test_bezier_curve_returns_lists():
+    vertices, codes = bezier_curve(x=np.array([0, 1]), y=np.array([1, 2]), force=1)
+
+    assert vertices == [(0.0, 1.0), (1.0, 1.0), (0.0, 2.0), (1.0, 2.0)]
+    assert codes == [Path.MOVETO, Path.CURVE4, Path.CURVE4, Path.CURVE4]
+
+
+def test_bezier_curves_shape_mismatch():
+    with pytest.raises(ValueError, match="must match"):
+        bezier_curves(x=np.arange(3), y=np.ones((2, 4)), force=1)
+
+
+def test_simplify_curves_merges_flat_runs():
+    x = np.arange(6)
+    y = np.array([[1, 1, 1, 2, 2, 1], [1, 2, 3, 4, 5, 6], [3, 3, 3, 3, 3, 3]])
+    vertices, codes = bezier_curves(x=x, y=y, force=0.5)
+
+    simplified = simplify_curves(vertices)
+
+    # flat run, curve, flat, curve
+    v, c = simplified[0]
+    assert c.tolist() == [
+        Path.MOVETO,
+        Path.LINETO,
+        *[Path.CURVE4] * 3,
+        Path.LINETO,
+        *[Path.CURVE4] * 3,
+    ]
+    assert v[[0, 1, 4, 5, 8]].tolist() == [[0, 1], [2, 1], [3, 2], [4, 2], [5, 1]]
+
+    # no flat segment: unchanged
+    np.testing.assert_array_equal(simplified[1][0], vertices[1])
+    assert simplified[1][1].tolist() == codes.tolist()
+
+    # fully flat: a single line
+    assert simplified[2][0].tolist() == [[0, 3], [5, 3]]
+
+
+def test_simplify_curves_same_extents():
+    x = np.array([0, 1, 2, 3])
+    y = np.array([[2, 2, 1, 1]])
+    vertices, codes = bezier_curves(x=x, y=y, force=1)
+    ((v, c),) = simplify_curves(vertices)
+
+    np.testing.assert_allclose(
+        Path(v, c).get_extents().bounds, Path(vertices[0], codes).get_extents().bounds
+    )
+
+
+def test_simplify_curves_min_width():
+    vertices, _ = bezier_curves(
+        x=np.array([0, 0.1, 5]), y=np.array([[1, 2, 3]]), force=1
+    )
+
+    ((_, c),) = simplify_curves(vertices, min_width=1)
+
+    assert c.tolist() == [Path.MOVETO, Path.LINETO, *[Path.CURVE4] * 3]
+
+
+def test_gap_curves():
+    x = np.arange(6)
+    y = np.array(
+        [
+            [1, 2, np.nan, 3, 4, np.nan],
+            [np.nan, 1, np.nan, 2, np.nan, np.nan],
+            [1, 1, 1, np.nan, 2, 2],
+        ]
+    )
+    vertices, _ = bezier_curves(x=x, y=y, force=1)
+
+    (v0, c0), (v1, c1), (v2, c2) = gap_curves(vertices)
+
+    # two runs of one segment each, the second one restarting with MOVETO
+    assert c0.tolist() == [Path.MOVETO, *[Path.CURVE4] * 3] * 2
+    assert v0[[0, 3, 4, 7]].tolist() == [[0, 1], [1, 2], [3, 3], [4, 4]]
+    # isolated points: no path at all
+    assert len(v1) == len(c1) == 0
+    # with simplification, flat runs across a gap stay apart
+    assert not np.isnan(v2).any()
+    ((v, c),) = simplify_curves(vertices[2:])
+    assert c.tolist() == [Path.MOVETO, Path.LINETO, Path.MOVETO, Path.LINETO]
+    assert v.tolist() == [[0, 1], [2, 1], [4, 2], [5, 2]]
+
+
+def test_gap_curves_without_gaps():
+    vertices, codes = bezier_curves(x=np.arange(3), y=np.array([[1, 2, 1]]), force=1)
+
+    ((v, c),) = gap_curves(vertices)
+
+    np.testing.assert_array_equal(v, vertices[0])
+    assert c.tolist() == codes.tolist()
+
+
+@pytest.mark.parametrize("samples", [1, 4, 10])
+def test_sample_curves(samples):
+    x = np.arange(4)
+    y = np.array([[1, 3, 2, 2], [2, 1, np.nan, 1]])
+    vertices, codes = bezier_curves(x=x, y=y, force=1)
+
+    points = sample_curves(vertices, samples)
+
+    assert points.shape == (2, 3 * samples + 1, 2)
+    assert points.dtype == np.float32
+    # anchors are kept, samples lie on the curves
+    np.testing.assert_allclose(points[0, ::samples], vertices[0, ::3])
+    t = np.linspace(0, 1, samples, endpoint=False)
+    # the first item of iter_bezier() is the MOVETO point
+    segments = list(Path(vertices[0], codes).iter_bezier())[1:]
+    for i, (bezier, _) in enumerate(segments):
+        np.testing.assert_allclose(
+            points[0, i * samples : (i + 1) * samples], bezier(t), rtol=1e-6
+        )
+    # segments touching the missing point are NaN, except their present anchor
+    assert points[1, samples].tolist() == [1, 1]
+    assert np.isnan(points[1, samples + 1 : 3 * samples, 1]).all()
+    assert not np.isnan(points[1, :samples]).any()
+
+
+@pytest.mark.parametrize("samples", [1, 5])
+def test_sample_curves_keeps_anchors_next_to_gaps(samples):
+    vertices, _ = bezier_curves(
+        x=np.arange(4), y=np.array([[2, 1, np.nan, 2]]), force=1
+    )
+
+    points = sample_curves(vertices, samples)
+
+    np.testing.assert_array_equal(
+        points[0, ::samples], [[0, 2], [1, 1], [2, np.nan], [3, 2]]
+    )
+    assert not np.isnan(points[0, :samples]).any()
+    assert np.isnan(points[0, samples + 1 : 3 * samples, 1]).all()
+
+
+def test_sample_curves_errors():
+    vertices, _ = bezier_curves(x=np.arange(2), y=np.array([[1, 2]]), force=1)
+
+    assert sample_curves(vertices, dtype=np.float64).dtype == np.float64
+    with pytest.raises(ValueError, match="at least 1"):
+        sample_curves(vertices, 0)
@@ -0,0 +1,95 @@
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import polars as pl
+import pytest
+
+import bumplot
+from bumplot._utils import _rank_matrix
+from bumplot.cache import BumpCache
+
+DATA = {
+    "x": ["a", "b", "c", "d"],
+    "y1": [7, 2, 2, 5],
+    "y2": [3, 2, 1, 10],
+    "y3": [5, 4, 10, 1],
+}
+
+
+@pytest.mark.parametrize("backend", [pd, pl])
+def test_cache_reused_when_restyling(backend):
+    df = backend.DataFrame(DATA)
+    cache = BumpCache()
+
+    _, ax = plt.subplots()
+    _, artists = bumplot.bumplot("x", ["y1", "y2", "y3"], df, ax=ax, cache=cache)
+    assert (cache.hits, cache.misses) == (0, 2)
+
+    _, ax = plt.subplots()
+    _, cached_artists = bumplot.bumplot(
+        "x", ["y1", "y2", "y3"], df, ax=ax, cache=cache, colors=["red"]
+    )
+    assert (cache.hits, cache.misses) == (2, 2)
+
+    bumplot.bumplot("x", ["y1", "y2", "y3"], df, cache=cache, curve_force=0.5)
+    assert (cache.hits, cache.misses) == (3, 3)
+
+    for name, (patch, _) in artists.items():
+        np.testing.assert_array_equal(
+            patch.get_path().vertices, cached_artists[name][0].get_path().vertices
+        )
+
+    plt.close("all")
+
+
+def test_cache_misses_on_changed_data():
+    cache = BumpCache()
+    df = pd.DataFrame(DATA)
+    cache.rank_matrix(df, "x", ["y1", "y2"])
+    cache.rank_matrix(df.assign(y1=[1, 1, 1, 1]), "x", ["y1", "y2"])
+    cache.rank_matrix(df, "x", ["y2", "y1"])
+
+    assert (cache.hits, cache.misses) == (0, 3)
+
+
+def test_cache_eviction_and_clear():
+    cache = BumpCache(maxsize=2)
+    x = np.arange(3)
+    for force in (0, 0.5, 1):
+        cache.bezier_curves(x, np.ones((2, 3)), force)
+    assert len(cache) == 2
+
+    cache.bezier_curves(x, np.ones((2, 3)), 0)
+    assert cache.misses == 4
+
+    vertices, _ = cache.bezier_curves(x, np.ones((2, 3)), 0)
+    assert cache.hits == 1
+    assert not vertices.flags.writeable
+
+    cache.clear()
+    assert len(cache) == cache.nbytes == cache.hits == cache.misses == 0
+
+
+def test_cache_memory_cap():
+    cache = BumpCache(max_bytes=1000)
+    cache.bezier_curves(np.arange(3), np.ones((2, 3)), 1)
+    assert 0 < cache.nbytes <= 1000
+
+    cache.bezier_curves(np.arange(300), np.ones((2, 300)), 1)
+    assert len(cache) == 1
+
+
+@pytest.mark.parametrize("backend", [pd, pl])
+def test_cache_extracts_columns_once(backend):
+    df = backend.DataFrame(DATA)
+    cache = BumpCache()
+
+    with bumplot.profile() as prof:
+        x_values, ranks = cache.rank_matrix(df, "x", ["y1", "y2", "y3"])
+    expected_x, expected = _rank_matrix(df, "x", ["y1", "y2", "y3"])
+
+    # The block fingerprinted by the cache is the one that gets ranked
+    assert "to_numpy" not in prof.stages
+    assert prof.stages["rank"].calls == 1
+    assert x_values.tolist() == expected_x.tolist()
+    np.testing.assert_array_equal(ranks, expected)
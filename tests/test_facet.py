@@ -0,0 +1,69 @@
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import polars as pl
+import pytest
+
+import bumplot
+
+DATA = {
+    "region": ["north"] * 4 + ["south"] * 3,
+    "x": ["q1", "q2", "q3", "q4", "q2", "q3", "q4"],
+    "y1": [7, 2, 2, 5, 1, 2, 3],
+    "y2": [3, 2, 1, 10, 3, 2, 1],
+    "y3": [5, 4, 10, 1, 2, 3, 2],
+}
+
+
+@pytest.mark.parametrize("backend", [pd, pl])
+@pytest.mark.parametrize("engine", ["numpy", "narwhals"])
+def test_facet_matches_bumplot_per_group(backend, engine):
+    df = backend.DataFrame(DATA)
+    y_columns = ["y1", "y2", "y3"]
+
+    fig, facets = bumplot.facet(
+        x="x", y_columns=y_columns, data=df, by="region", ncols=1, engine=engine
+    )
+
+    assert list(facets) == ["north", "south"]
+    assert facets["north"][0].yaxis_inverted()
+    assert facets["south"][0].yaxis_inverted()
+    assert [t.get_text() for t in facets["south"][0].get_xticklabels()] == [
+        "q1",
+        "q2",
+        "q3",
+        "q4",
+    ]
+
+    pandas_df = pd.DataFrame(DATA)
+    for region, (ax, artists) in facets.items():
+        assert ax.get_title() == region
+        _, expected = bumplot.bumplot(
+            x="x",
+            y_columns=y_columns,
+            data=pandas_df[pandas_df["region"] == region],
+            ax=plt.figure().gca(),
+        )
+        for name, (_, scatter) in artists.items():
+            np.testing.assert_array_equal(
+                scatter.get_offsets()[:, 1], expected[name][1].get_offsets()[:, 1]
+            )
+
+    # "south" has no "q1", so its x positions follow the shared axis
+    assert facets["south"][1]["y1"][1].get_offsets()[:, 0].tolist() == [1, 2, 3]
+
+    plt.close("all")
+
+
+def test_facet_splits_curves_at_gaps():
+    df = pd.DataFrame(DATA | {"y1": [7, None, 2, 5, 1, 2, 3]})
+
+    _, facets = bumplot.facet(x="x", y_columns=["y1", "y2"], data=df, by="region")
+
+    patch, scatter = facets["north"][1]["y1"]
+    path = patch.get_path()
+    assert not np.isnan(path.vertices).any()
+    assert path.codes.tolist() == [path.MOVETO] + [path.CURVE4] * 3
+    assert scatter.get_offsets()[:, 0].tolist() == [0, 2, 3]
+
+    plt.close("all")
@@ -0,0 +1,102 @@
+import matplotlib.pyplot as plt
+from matplotlib.ticker import MaxNLocator
+import numpy as np
+import pandas as pd
+import polars as pl
+import pytest
+
+import bumplot
+from bumplot.geometry import BumpGeometry
+
+DATA = {
+    "x": ["a", "b", "c", "d"],
+    "y1": [7.0, 2.0, None, 5.0],
+    "y2": [3.0, 2.0, 1.0, 10.0],
+    "y3": [5.0, 4.0, 10.0, 1.0],
+}
+
+
+def _assert_same_geometry(geom, other):
+    for name in BumpGeometry.__slots__:
+        left, right = getattr(geom, name), getattr(other, name)
+        assert left.dtype == right.dtype
+        np.testing.assert_array_equal(left, right)
+
+
+@pytest.mark.parametrize("backend", [pd, pl])
+def test_render_geometry_matches_bumplot(backend):
+    df = backend.DataFrame(DATA)
+
+    geom = bumplot.compute_bump_geometry("x", ["y1", "y2", "y3"], df)
+    _, ax = plt.subplots()
+    _, artists = bumplot.render_geometry(
+        ax, geom, opts={"y2": bumplot.opts(line_color="red")}
+    )
+    _, expected_ax = plt.subplots()
+    _, expected = bumplot.bumplot(
+        "x", ["y1", ("y2", bumplot.opts(line_color="red")), "y3"], df, ax=expected_ax
+    )
+
+    assert geom.ranks.shape == (3, 4)
+    assert geom.x_tick_labels.tolist() == ["a", "b", "c", "d"]
+    assert [t.get_text() for t in ax.get_xticklabels()] == ["a", "b", "c", "d"]
+    for name, (patch, scatter) in artists.items():
+        expected_patch, expected_scatter = expected[name]
+        np.testing.assert_array_equal(
+            patch.get_path().vertices, expected_patch.get_path().vertices
+        )
+        assert patch.get_edgecolor() == expected_patch.get_edgecolor()
+        np.testing.assert_array_equal(
+            scatter.get_offsets(), expected_scatter.get_offsets()
+        )
+
+    plt.close("all")
+
+
+@pytest.mark.parametrize("suffix", [".npz", ".arrow"])
+def test_geometry_round_trip(tmp_path, suffix):
+    if suffix == ".arrow":
+        pytest.importorskip("pyarrow")
+    geom = bumplot.compute_bump_geometry(
+        "x", ["y1", "y2", "y3"], pd.DataFrame(DATA), curve_force=0.5
+    )
+
+    geom.save(tmp_path / f"geom{suffix}")
+    loaded = BumpGeometry.load(tmp_path / f"geom{suffix}")
+
+    _assert_same_geometry(geom, loaded)
+    assert np.isnan(loaded.ranks[0, 2])
+
+
+def test_geometry_explicit_format(tmp_path):
+    geom = bumplot.compute_bump_geometry("x", ["y1", "y2"], pd.DataFrame(DATA))
+
+    geom.save(tmp_path / "geom.bin", format="npz")
+    _assert_same_geometry(geom, BumpGeometry.load(tmp_path / "geom.bin"))
+
+    with pytest.raises(ValueError, match="format must be"):
+        geom.save(tmp_path / "geom.bin", format="pickle")
+
+
+@pytest.mark.parametrize("x", [[2000, 2001, 2002, 2003], ["a", "b", "c", "d"]])
+def test_render_geometry_x_locator(x):
+    df = pd.DataFrame(DATA | {"x": x})
+    geom = bumplot.compute_bump_geometry("x", ["y1", "y2"], df)
+
+    labels = []
+    for draw in (
+        lambda ax: bumplot.render_geometry(ax, geom, x_locator=MaxNLocator(4)),
+        lambda ax: bumplot.bumplot(
+            "x", ["y1", "y2"], df, ax=ax, x_locator=MaxNLocator(4)
+        ),
+    ):
+        fig, ax = plt.subplots()
+        draw(ax)
+        fig.canvas.draw()
+        labels.append([t.get_text() for t in ax.get_xticklabels()])
+
+    assert labels[0] == labels[1]
+    assert set(map(str, x)) <= set(labels[0])
+    assert bool(geom.x_categorical) is isinstance(x[0], str)
+
+    plt.close("all")
@@ -0,0 +1,57 @@
+import subprocess
+import sys
+
+import pytest
+
+import bumplot
+
+
+def _loaded_modules(code: str) -> set[str]:
+    """Modules loaded by running `code` in a fresh interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-c", f"{code}\nimport sys\nprint(*sys.modules)"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(result.stdout.split())
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "import bumplot",
+        "from bumplot.bezier import bezier_curve, bezier_curves",
+        "import bumplot; bumplot.opts(line_color='red')",
+    ],
+)
+def test_import_skips_pyplot_and_narwhals(code):
+    modules = _loaded_modules(code)
+    assert "matplotlib.pyplot" not in modules
+    assert "narwhals" not in modules
+
+
+def test_plotting_import_skips_pyplot():
+    modules = _loaded_modules("from bumplot import bumplot, BumpCache, facet")
+    assert "matplotlib.pyplot" not in modules
+    assert "narwhals" in modules
+
+
+def test_lazy_attributes():
+    for name in bumplot.__all__:
+        assert callable(getattr(bumplot, name))
+    assert set(bumplot.__all__) <= set(dir(bumplot))
+    with pytest.raises(AttributeError, match="no attribute 'missing'"):
+        bumplot.missing
+
+
+def test_lazy_attributes_are_not_shadowed_by_submodules():
+    # A submodule imported first would be bound to `bumplot.<name>`, and
+    # `__getattr__` would never run for a public name of the same name
+    from bumplot import _submodules
+    from bumplot.facets import facet
+
+    assert not set(_submodules) & {
+        module.lstrip(".") for module in _submodules.values()
+    }
+    assert bumplot.facet is facet
@@ -0,0 +1,93 @@
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import polars as pl
+import pytest
+
+import bumplot
+
+DATA = {
+    "x": [1, 2, 3, 4, 5, 6],
+    "y1": [7, 2, 2, 5, 5, 6],
+    "y2": [3, 2, 1, 10, 4, 8],
+    "y3": [5, 4, 10, 1, 3, 6],
+}
+
+
+@pytest.mark.parametrize("backend", [pd, pl])
+@pytest.mark.parametrize("x", [DATA["x"], list("abcdef")])
+def test_bump_plot_append_matches_bumplot(backend, x):
+    data = DATA | {"x": x}
+    df = backend.DataFrame(data)
+    y_columns = ["y1", "y2", "y3"]
+
+    _, ax_full = plt.subplots()
+    _, full_artists = bumplot.bumplot(x="x", y_columns=y_columns, data=df, ax=ax_full)
+
+    _, ax = plt.subplots()
+    plot = bumplot.BumpPlot(x="x", y_columns=y_columns, data=df[:2], ax=ax)
+    plot.append(df[2:3])
+    plot.append(df[3:])
+
+    for name, (patch, scatter) in plot.artists.items():
+        full_patch, full_scatter = full_artists[name]
+        np.testing.assert_allclose(
+            patch.get_path().vertices, full_patch.get_path().vertices
+        )
+        assert patch.get_path().codes.tolist() == full_patch.get_path().codes.tolist()
+        np.testing.assert_allclose(scatter.get_offsets(), full_scatter.get_offsets())
+
+    assert [t.get_text() for t in ax.get_xticklabels()] == [
+        t.get_text() for t in ax_full.get_xticklabels()
+    ]
+    assert ax.get_xlim() == pytest.approx(ax_full.get_xlim())
+    assert ax.yaxis_inverted()
+
+    plt.close("all")
+
+
+def test_bump_plot_append_rejects_known_x():
+    df = pd.DataFrame(DATA)
+    plot = bumplot.BumpPlot(x="x", y_columns=["y1", "y2"], data=df[:3])
+
+    with pytest.raises(ValueError, match="not plotted yet"):
+        plot.append(df[2:4])
+
+    plt.close("all")
+
+
+def test_bump_plot_append_splits_curves_at_gaps():
+    df = pd.DataFrame(DATA | {"y1": [7, None, 2, 5, None, 6]})
+    y_columns = ["y1", "y2", "y3"]
+
+    _, ax_full = plt.subplots()
+    _, full_artists = bumplot.bumplot(x="x", y_columns=y_columns, data=df, ax=ax_full)
+
+    _, ax = plt.subplots()
+    plot = bumplot.BumpPlot(x="x", y_columns=y_columns, data=df[:3], ax=ax)
+    plot.append(df[3:5])
+    plot.append(df[5:])
+
+    for name, (patch, scatter) in plot.artists.items():
+        full_patch, full_scatter = full_artists[name]
+        path = patch.get_path()
+        assert not np.isnan(path.vertices).any()
+        np.testing.assert_allclose(path.vertices, full_patch.get_path().vertices)
+        assert path.codes.tolist() == full_patch.get_path().codes.tolist()
+        np.testing.assert_allclose(scatter.get_offsets(), full_scatter.get_offsets())
+    assert len(plot.artists["y1"][1].get_offsets()) == 4
+
+    plt.close("all")
+
+
+def test_bump_plot_append_promotes_x_dtype():
+    df = pd.DataFrame({"x": [1, 2], "y1": [1, 2], "y2": [2, 1]})
+    _, ax = plt.subplots()
+    plot = bumplot.BumpPlot(x="x", y_columns=["y1", "y2"], data=df, ax=ax)
+
+    plot.append(pd.DataFrame({"x": [2.5], "y1": [3], "y2": [1]}))
+
+    assert ax.get_xticks().tolist() == [1, 2, 2.5]
+    assert plot.artists["y1"][1].get_offsets()[:, 0].tolist() == [1, 2, 2.5]
+
+    plt.close("all")
@@ -0,0 +1,88 @@
+from matplotlib.backend_bases import MouseEvent
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import pytest
+
+import bumplot
+
+DATA = pd.DataFrame(
+    {
+        "x": [1, 2, 3, 4],
+        "y1": [1.0, 3.0, None, 2.0],
+        "y2": [2.0, 1.0, 3.0, 1.0],
+        "y3": [3.0, 2.0, 1.0, 3.0],
+    }
+)
+
+
+def alphas(artists, name):
+    """Opacity of the line and the markers of a series."""
+    result = []
+    for artist in artists[name]:
+        if hasattr(artist, "collection"):
+            colors = artist.collection.get_edgecolor()
+            result.append(colors[artist.index][..., 3].max())
+        else:
+            result.append(artist.get_alpha())
+    return result
+
+
+@pytest.mark.parametrize("collection", [False, True])
+def test_bump_index(collection):
+    fig, ax = plt.subplots()
+    _, artists = bumplot.bumplot(
+        x="x", y_columns=["y1", "y2", "y3"], data=DATA, ax=ax, collection=collection
+    )
+    index = bumplot.BumpIndex(ax, artists, dim_alpha=0.1)
+
+    def at(x, y):
+        return index.series_at(*ax.transData.transform((x, y)))
+
+    # markers, including the last one of a series after a gap
+    assert at(1, 3) == "y1"
+    assert at(3, 1) == "y2"
+    assert at(4, 2) == "y1"
+    # along a curve, between markers
+    assert at(1.244, 1.028) == "y3"
+    # away from every curve, and in the gap of y1
+    assert at(1.5, 0.5) is None
+    assert at(3, 1.5) is None
+
+    index.highlight("y2")
+    assert alphas(artists, "y1") == pytest.approx([0.1, 0.1])
+    assert alphas(artists, "y2") != pytest.approx([0.1, 0.1])
+    index.highlight("y3")
+    assert alphas(artists, "y2") == pytest.approx([0.1, 0.1])
+    assert alphas(artists, "y3") != pytest.approx([0.1, 0.1])
+    index.highlight(None)
+    assert index.highlighted is None
+    for name in ["y1", "y2", "y3"]:
+        assert alphas(artists, name) != pytest.approx([0.1, 0.1])
+
+    with pytest.raises(KeyError, match="y4"):
+        index.highlight("y4")
+
+    plt.close("all")
+
+
+def test_bump_index_connect():
+    fig, ax = plt.subplots()
+    _, artists = bumplot.bumplot(x="x", y_columns=["y1", "y2", "y3"], data=DATA, ax=ax)
+    fig.canvas.draw()
+    index = bumplot.BumpIndex(ax, artists)
+    index.connect()
+
+    x, y = ax.transData.transform((2, 1))
+    MouseEvent("motion_notify_event", fig.canvas, x, y)._process()
+    assert index.highlighted == "y1"
+
+    MouseEvent("motion_notify_event", fig.canvas, 0, 0)._process()
+    assert index.highlighted is None
+    assert np.isclose(artists["y1"][0].get_alpha() or 1, 1)
+
+    index.disconnect()
+    MouseEvent("motion_notify_event", fig.canvas, x, y)._process()
+    assert index.highlighted is None
+
+    plt.close("all")
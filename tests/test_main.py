@@ -1,8 +1,15 @@
+import base64
+import io
+import re
+
 import matplotlib.pyplot as plt
 from matplotlib.colors import to_rgb
 from matplotlib.patches import PathPatch
 from matplotlib.collections import PathCollection
+from matplotlib.path import Path
+from matplotlib.ticker import MaxNLocator
 
+import numpy as np
 import pandas as pd
 import polars as pl
 
@@ -10,6 +17,8 @@ import pytest
 from typing import Any
 
 import bumplot
+from bumplot.collection import CollectionView
+from bumplot.main import _resolve_kwargs
 from bumplot.opts import BumpOpts, _get_plot_kwargs, _get_scatter_kwargs
 
 
@@ -50,7 +59,7 @@ def test_version():
         ["a", "b", "c", "d", "e", "f", "g", "h", "i", "j"],
     ],
 )
-@pytest.mark.parametrize("backend", [pd, pl])
+@pytest.mark.parametrize("backend", [pd, pl, pl.LazyFrame])
 @pytest.mark.parametrize("curve_force", [0, 0.5, 1, 5])
 def test_bumplot(x, backend, curve_force):
     data = {
@@ -59,7 +68,7 @@ def test_bumplot(x, backend, curve_force):
         "y2": [3, 2, 1, 10, 4, 8, 7, 2, 4, 2],
         "y3": [5, 4, 10, 1, 3, 6, 5, 2, 3, 7],
     }
-    df = backend.DataFrame(data)
+    df = backend(data) if backend is pl.LazyFrame else backend.DataFrame(data)
 
     y_columns = ["y1", "y2", "y3"]
     _, in_ax = plt.subplots(figsize=(6, 4))
@@ -194,3 +203,387 @@ def test_bumplot_ordinal_labels(ordinal_labels):
         )
 
     plt.close("all")
+
+
+@pytest.mark.parametrize("backend", [pd, pl])
+def test_bumplot_collection(backend):
+    df = backend.DataFrame(
+        {
+            "x": [1, 2, 3, 4],
+            "y1": [7, 2, 2, 5],
+            "y2": [3, 2, 1, 10],
+            "y3": [5, 4, 10, 1],
+        }
+    )
+
+    _, ax = plt.subplots()
+    _, bump_artists = bumplot.bumplot(
+        x="x",
+        y_columns=["y1", "y2", ("y3", bumplot.opts(zorder=5, line_color="red"))],
+        data=df,
+        ax=ax,
+        collection=True,
+    )
+
+    # y1 and y2 share one collection, y3 has a different zorder
+    assert len(ax.collections) == 4
+    assert len(ax.patches) == 0
+
+    line_view, marker_view = bump_artists["y1"]
+    assert isinstance(line_view, CollectionView)
+    assert line_view.collection is bump_artists["y2"][0].collection
+    assert bump_artists["y3"][0].collection.get_zorder() == 5
+    assert bump_artists["y3"][0].collection.get_edgecolor()[0, :3] == pytest.approx(
+        to_rgb("red")
+    )
+
+    assert marker_view.get_offsets()[:, 1].tolist() == [1, 2, 2, 2]
+    assert len(line_view.get_path().vertices) == 3 * 3 + 1
+
+    plt.close("all")
+
+
+@pytest.mark.parametrize("backend", [pd, pl])
+def test_bumplot_long(backend):
+    long = backend.DataFrame(
+        {
+            "x": [1, 1, 2, 2],
+            "entity": ["a", "b", "a", "b"],
+            "value": [1, 2, 4, 3],
+        }
+    )
+
+    _, ax = plt.subplots()
+    out_ax, bump_artists = bumplot.bumplot_long(
+        x="x",
+        entity="entity",
+        value="value",
+        data=long,
+        entities=["a", ("b", bumplot.opts(line_color="red"))],
+        ax=ax,
+    )
+
+    assert out_ax is ax
+    assert list(bump_artists) == ["a", "b"]
+    assert bump_artists["a"][1].get_offsets()[:, 1].tolist() == [2, 1]
+    assert bump_artists["b"][0].get_edgecolor()[:3] == to_rgb("red")
+
+    plt.close("all")
+
+
+@pytest.mark.parametrize("simplify", [True, "pixels"])
+@pytest.mark.parametrize("collection", [False, True])
+def test_bumplot_simplify(simplify, collection):
+    df = pd.DataFrame(
+        {
+            "x": range(8),
+            "y1": [1, 1, 1, 1, 2, 2, 2, 2],
+            "y2": [2, 2, 2, 2, 1, 1, 1, 1],
+        }
+    )
+
+    _, ax = plt.subplots()
+    _, bump_artists = bumplot.bumplot(
+        x="x",
+        y_columns=["y1", "y2"],
+        data=df,
+        ax=ax,
+        simplify=simplify,
+        collection=collection,
+    )
+
+    line, markers = bump_artists["y1"]
+    # a flat run, one curve, another flat run
+    assert len(line.get_path().vertices) == 1 + 1 + 3 + 1
+    assert len(markers.get_offsets()) == 8
+
+    plt.close("all")
+
+
+@pytest.mark.parametrize("backend", [pd, pl])
+@pytest.mark.parametrize("collection", [False, True])
+def test_bumplot_missing_periods(backend, collection):
+    df = backend.DataFrame(
+        {
+            "x": [1, 2, 3, 4],
+            "y1": [3.0, None, 1.0, 2.0],
+            "y2": [2.0, 2.0, None, 3.0],
+            "y3": [1.0, 3.0, 2.0, 1.0],
+        }
+    )
+
+    _, ax = plt.subplots()
+    _, bump_artists = bumplot.bumplot(
+        x="x", y_columns=["y1", "y2", "y3"], data=df, ax=ax, collection=collection
+    )
+
+    line, markers = bump_artists["y1"]
+    path = line.get_path()
+    assert not np.isnan(path.vertices).any()
+    assert path.codes.tolist() == [Path.MOVETO, *[Path.CURVE4] * 3]
+    assert markers.get_offsets().tolist() == [[1, 1], [3, 2], [4, 2]]
+
+    line, markers = bump_artists["y2"]
+    assert line.get_path().codes.tolist() == [Path.MOVETO, *[Path.CURVE4] * 3]
+    assert len(markers.get_offsets()) == 3
+    assert len(bump_artists["y3"][1].get_offsets()) == 4
+
+    plt.close("all")
+
+
+@pytest.mark.parametrize(
+    "rasterize_above, expected",
+    [
+        (None, False),
+        (3, False),
+        (2, True),
+        ({"vertices": 1000}, False),
+        ({"vertices": 10}, True),
+        ({"series": 10, "vertices": 10}, True),
+    ],
+)
+@pytest.mark.parametrize("collection", [False, True])
+def test_bumplot_rasterize_above(rasterize_above, expected, collection):
+    df = pd.DataFrame(
+        {
+            "x": [1, 2, 3],
+            "y1": [1, 2, 3],
+            "y2": [3, 1, 2],
+            "y3": [2, 3, 1],
+        }
+    )
+
+    fig, ax = plt.subplots()
+    _, bump_artists = bumplot.bumplot(
+        x="x",
+        y_columns=["y1", "y2", "y3"],
+        data=df,
+        ax=ax,
+        collection=collection,
+        rasterize_above=rasterize_above,
+    )
+
+    for line, markers in bump_artists.values():
+        assert getattr(line, "collection", line).get_rasterized() is expected
+        assert getattr(markers, "collection", markers).get_rasterized() is expected
+    assert not ax.xaxis.get_rasterized()
+
+    svg = io.StringIO()
+    fig.savefig(svg, format="svg")
+    assert ("<image" in svg.getvalue()) is expected
+
+    plt.close("all")
+
+
+def test_bumplot_rasterize_above_dpi():
+    df = pd.DataFrame({"x": [1, 2, 3], "y1": [1, 2, 3], "y2": [3, 1, 2]})
+
+    fig, ax = plt.subplots()
+    bumplot.bumplot("x", ["y1", "y2"], df, ax=ax, rasterize_above=1)
+    dpi = fig.dpi
+
+    # The embedded raster follows the export resolution, the figure is unchanged
+    widths = []
+    for export_dpi in [72, 144]:
+        svg = io.StringIO()
+        fig.savefig(svg, format="svg", dpi=export_dpi)
+        data = re.search(r'xlink:href="data:image/png;base64,([^"]+)"', svg.getvalue())
+        png = base64.b64decode(data.group(1))
+        widths.append(int.from_bytes(png[16:20], "big"))
+    assert widths[1] == pytest.approx(2 * widths[0], abs=2)
+    assert fig.dpi == dpi
+
+    plt.close("all")
+
+
+@pytest.mark.parametrize("collection", [False, True])
+def test_bumplot_styles(collection):
+    df = pd.DataFrame({"x": [1, 2], "y1": [1, 2], "y2": [2, 1], "y3": [3, 3]})
+
+    _, ax = plt.subplots()
+    _, bump_artists = bumplot.bumplot(
+        x="x",
+        y_columns=["y1", "y2", "y3"],
+        data=df,
+        ax=ax,
+        collection=collection,
+        styles={
+            "values": [0, 1, 2],
+            "cmap": "viridis",
+            "line_width": [1, 2, 3],
+            "marker_size": 50,
+            "marker_alpha": 0.5,
+        },
+    )
+
+    viridis = plt.get_cmap("viridis")
+    for i, name in enumerate(["y1", "y2", "y3"]):
+        line, markers = bump_artists[name]
+        artist = line.collection if collection else line
+        index = line.index if collection else 0
+        color = np.asarray(artist.get_edgecolor())
+        color = color[index] if color.ndim == 2 else color
+        assert tuple(color) == pytest.approx(viridis(i / 2))
+        linewidths = np.atleast_1d(artist.get_linewidth())
+        assert linewidths[index % len(linewidths)] == i + 1
+
+        points = markers.collection if collection else markers
+        assert np.all(points.get_sizes() == 50)
+        assert points.get_facecolor()[0][3] == 0.5
+
+    plt.close("all")
+
+
+def test_resolve_kwargs_shares_dicts():
+    y_bumps = [(f"y{i}", bumplot.opts()) for i in range(5)]
+    y_bumps[3] = ("y3", bumplot.opts(zorder=3))
+
+    plot_kwargs_list, scatter_kwargs_list = _resolve_kwargs(
+        y_bumps, ["red", "blue"], {"lw": 2}, {}, share=True
+    )
+    assert [kw["edgecolor"] for kw in plot_kwargs_list] == ["red", "blue"] * 2 + ["red"]
+    assert plot_kwargs_list[0] is plot_kwargs_list[2] is plot_kwargs_list[4]
+    assert plot_kwargs_list[1] is not plot_kwargs_list[3]
+    assert plot_kwargs_list[3] == {"zorder": 3, "linewidth": 2, "edgecolor": "blue"}
+    assert len({id(kw) for kw in scatter_kwargs_list}) == 3
+
+    # Without colors (set by styles), series without options share one dict
+    plot_kwargs_list, _ = _resolve_kwargs(y_bumps, None, {}, {}, share=True)
+    assert len({id(kw) for kw in plot_kwargs_list}) == 2
+    assert "edgecolor" not in plot_kwargs_list[0]
+
+    # Per-series renderers modify their dicts, which are never shared
+    plot_kwargs_list, _ = _resolve_kwargs(y_bumps, ["red"], {}, {})
+    assert len({id(kw) for kw in plot_kwargs_list}) == 5
+
+
+@pytest.mark.parametrize("styles", [None, {"color": "green", "line_width": 3}])
+def test_bumplot_collection_shared_kwargs(styles):
+    n = 12
+    df = pd.DataFrame({"x": [1, 2], **{f"y{i}": [i, n - i] for i in range(n)}})
+    y_columns = [f"y{i}" for i in range(n)]
+    y_columns[5] = ("y5", bumplot.opts(line_style="--", marker_edgecolor="black"))
+
+    artists = {}
+    for collection in (False, True):
+        _, ax = plt.subplots()
+        _, artists[collection] = bumplot.bumplot(
+            "x", y_columns, df, ax=ax, collection=collection, styles=styles
+        )
+
+    # The default color cycle wraps around, and one series has its own options
+    assert len(ax.collections) == 2
+    for name, (patch, scatter) in artists[False].items():
+        line, markers = artists[True][name]
+        assert tuple(line.collection.get_edgecolor()[line.index]) == pytest.approx(
+            patch.get_edgecolor()
+        )
+        assert line.collection.get_linewidth()[line.index] == patch.get_linewidth()
+        points = markers.index.start
+        assert tuple(markers.collection.get_facecolor()[points]) == pytest.approx(
+            tuple(scatter.get_facecolor()[0])
+        )
+        assert tuple(markers.collection.get_edgecolor()[points]) == pytest.approx(
+            tuple(scatter.get_edgecolor()[0])
+        )
+
+    plt.close("all")
+
+
+def test_bumplot_styles_errors():
+    df = pd.DataFrame({"x": [1, 2], "y1": [1, 2], "y2": [2, 1]})
+
+    with pytest.raises(ValueError, match="2 series"):
+        bumplot.bumplot("x", ["y1", "y2"], df, styles={"line_width": [1, 2, 3]})
+    with pytest.raises(ValueError, match="not both"):
+        bumplot.bumplot("x", ["y1", "y2"], df, styles={"color": "red", "values": [1]})
+    with pytest.raises(TypeError, match="'width'"):
+        bumplot.bumplot("x", ["y1", "y2"], df, styles={"width": 1})
+
+    plt.close("all")
+
+
+@pytest.mark.parametrize("collection", [False, True])
+def test_bumplot_series_labels(collection):
+    df = pd.DataFrame(
+        {
+            "x": [1, 2, 3],
+            "y1": [3.0, 1.0, None],
+            "y2": [2.0, 3.0, 1.0],
+            "y3": [1.0, 2.0, 2.0],
+        }
+    )
+
+    fig, ax = plt.subplots()
+    bumplot.bumplot(
+        x="x",
+        y_columns=["y1", "y2", "y3"],
+        data=df,
+        ax=ax,
+        colors=["red", "lime", "blue"],
+        collection=collection,
+        start_labels=True,
+        end_labels=True,
+    )
+
+    assert ax.get_yticks().tolist() == [1, 2, 3]
+    labels = ax.get_yticklabels()
+    assert [label.get_text() for label in labels] == ["y1", "y2", "y3"]
+    assert [to_rgb(label.get_color()) for label in labels] == [
+        (1, 0, 0),
+        (0, 1, 0),
+        (0, 0, 1),
+    ]
+
+    (labels_ax,) = ax.child_axes
+    labels = labels_ax.get_yticklabels()
+    # y1 is missing from the last period: it's labelled at its last rank
+    assert labels_ax.get_yticks().tolist() == [1, 2, 3]
+    assert [label.get_text() for label in labels] == ["y3", "y2", "y1"]
+    assert to_rgb(labels[0].get_color()) == (0, 0, 1)
+
+    fig.savefig(io.BytesIO(), format="png")
+    plt.close("all")
+
+
+@pytest.mark.parametrize("backend", [pd, pl])
+def test_bumplot_x_locator(backend):
+    n_periods = 1000
+    rng = np.random.default_rng(0)
+    df = backend.DataFrame(
+        {
+            "x": pd.date_range("2020-01-01", periods=n_periods, freq="D"),
+            "y1": rng.random(n_periods),
+            "y2": rng.random(n_periods),
+        }
+    )
+
+    _, ax = plt.subplots()
+    bumplot.bumplot(x="x", y_columns=["y1", "y2"], data=df, ax=ax)
+    ticks = ax.get_xticks()
+    assert len(ticks) == 20
+    assert ticks[:2].tolist() == [0, 50]
+    labels = [label.get_text() for label in ax.get_xticklabels()]
+    assert labels[:2] == ["2020-01-01", "2020-02-20"]
+
+    _, ax = plt.subplots()
+    bumplot.bumplot(x="x", y_columns=["y1", "y2"], data=df, ax=ax, x_locator=5)
+    assert len(ax.get_xticks()) == 5
+
+    _, ax = plt.subplots()
+    bumplot.bumplot(
+        x="x",
+        y_columns=["y1", "y2"],
+        data=df,
+        ax=ax,
+        x_locator=MaxNLocator(4, integer=True),
+    )
+    formatter = ax.xaxis.get_major_formatter()
+    assert len(ax.xaxis.get_major_locator()()) <= 6
+    assert formatter(31) == "2020-02-01"
+    assert formatter(0.5) == ""
+
+    with pytest.raises(ValueError, match="at least 1"):
+        bumplot.bumplot(x="x", y_columns=["y1", "y2"], data=df, x_locator=0)
+
+    plt.close("all")
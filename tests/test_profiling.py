@@ -0,0 +1,71 @@
+import matplotlib.pyplot as plt
+import pandas as pd
+import polars as pl
+import pytest
+
+import bumplot
+from bumplot.profiling import _NULL_STAGE, _stage
+
+DATA = {
+    "x": [1, 2, 3, 4],
+    "y1": [7, 2, 2, 5],
+    "y2": [3, 2, 1, 10],
+    "y3": [5, 4, 10, 1],
+}
+
+
+@pytest.mark.parametrize("backend", [pd, pl])
+def test_profile_reports_every_stage(backend):
+    events = []
+    with bumplot.profile(on_stage=lambda *event: events.append(event)) as prof:
+        _, ax = plt.subplots()
+        bumplot.bumplot("x", ["y1", "y2", "y3"], backend.DataFrame(DATA), ax=ax)
+
+    assert list(prof.stages) == [
+        "collect",
+        "to_numpy",
+        "rank",
+        "encode_x",
+        "geometry",
+        "paths",
+        "styles",
+        "artists",
+        "ticks",
+    ]
+    assert prof.stages["rank"].size == 3 * 4
+    assert prof.stages["geometry"].size == 3 * (3 * 3 + 1) * 2
+    assert prof.stages["artists"].size == 3
+    assert all(stats.calls == 1 for stats in prof.stages.values())
+    assert [name for name, _, _ in events] == list(prof.stages)
+    assert prof.seconds == pytest.approx(sum(seconds for _, seconds, _ in events))
+
+
+def test_profile_accumulates_and_nests():
+    df = pd.DataFrame(DATA)
+    with bumplot.profile() as outer:
+        bumplot.bumplot("x", ["y1", "y2"], df)
+        with bumplot.profile() as inner:
+            bumplot.bumplot("x", ["y1", "y2"], df)
+
+    assert outer.stages["geometry"].calls == 2
+    assert inner.stages["geometry"].calls == 1
+
+
+def test_profile_chunked_ranking():
+    df = pd.DataFrame(DATA)
+    with bumplot.profile() as prof:
+        bumplot.bumplot("x", ["y1", "y2", "y3"], df, chunk_size=3, workers=2)
+
+    # two blocks, ranked on worker threads
+    assert prof.stages["to_numpy"].calls == 2
+    assert prof.stages["rank"].calls == 2
+    assert prof.stages["rank"].size == 12
+    assert prof.stages["rank_chunks"].calls == 1
+
+    plt.close("all")
+
+
+def test_stages_disabled_outside_profile():
+    with _stage("rank") as stage:
+        stage.size = 10
+    assert stage is _NULL_STAGE
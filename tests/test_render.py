@@ -0,0 +1,90 @@
+import os
+from pathlib import Path
+import subprocess
+import sys
+import textwrap
+
+import pandas as pd
+import pytest
+
+import bumplot
+
+DATA = pd.DataFrame(
+    {
+        "x": [1, 2, 3, 4],
+        "y1": [7, 2, 2, 5],
+        "y2": [3, 2, 1, 10],
+    }
+)
+
+
+def test_render_many(tmp_path):
+    specs = [
+        {"name": f"chart-{i}", "x": "x", "y_columns": ["y1", "y2"], "data": DATA}
+        for i in range(5)
+    ]
+    specs.append({"name": "broken", "x": "x", "y_columns": ["nope"], "data": DATA})
+
+    results = {
+        result.name: result
+        for result in bumplot.render_many(specs[1:], tmp_path / "out", workers=2)
+    }
+
+    assert results.keys() == {spec["name"] for spec in specs[1:]}
+    for i in range(1, 5):
+        result = results[f"chart-{i}"]
+        assert result.error is None
+        assert result.path == tmp_path / "out" / f"chart-{i}.png"
+        assert result.path.read_bytes().startswith(b"\x89PNG")
+
+    assert results["broken"].path is None
+    assert "nope" in results["broken"].error
+
+
+def test_render_many_requires_name(tmp_path):
+    with pytest.raises(ValueError, match="needs a 'name'"):
+        list(bumplot.render_many([{"x": "x"}], tmp_path, workers=1))
+
+
+def test_render_many_from_script(tmp_path):
+    # A plain script, without `if __name__ == "__main__":`, where workers are
+    # replaced after each chart
+    script = tmp_path / "script.py"
+    script.write_text(
+        textwrap.dedent(
+            f"""
+            import pandas as pd
+            import bumplot
+
+            data = pd.DataFrame({{"x": [1, 2], "y1": [1, 2], "y2": [2, 1]}})
+            specs = [
+                {{"name": f"chart-{{i}}", "x": "x", "y_columns": ["y1", "y2"],
+                  "data": data}}
+                for i in range(5)
+            ]
+            results = bumplot.render_many(
+                specs, {str(tmp_path / "out")!r}, workers=2, max_charts_per_worker=1
+            )
+            print(sorted(result.name for result in results if result.error is None))
+            """
+        )
+    )
+    root = Path(__file__).resolve().parents[1]
+    env = {**os.environ, "PYTHONPATH": str(root)}
+
+    completed = subprocess.run(
+        [sys.executable, str(script)],
+        capture_output=True,
+        text=True,
+        env=env,
+        timeout=120,
+    )
+
+    assert completed.returncode == 0, completed.stderr
+    assert completed.stdout.split("\n")[0] == str([f"chart-{i}" for i in range(5)])
+    assert len(list((tmp_path / "out").iterdir())) == 5
+
+
+def test_render_many_invalid_max_charts(tmp_path):
+    with pytest.raises(ValueError, match="max_charts_per_worker"):
+        list(bumplot.render_many([], tmp_path, max_charts_per_worker=0))
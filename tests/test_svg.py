@@ -0,0 +1,74 @@
+import json
+import xml.etree.ElementTree as ET
+
+import matplotlib.pyplot as plt
+import pandas as pd
+import pytest
+
+import bumplot
+
+SVG = "{http://www.w3.org/2000/svg}"
+DATA = {
+    "x": ["a", "b", "c", "d"],
+    "y1": [7.0, 2.0, None, 5.0],
+    "y2": [3.0, 2.0, 1.0, 10.0],
+    "y3": [5.0, 4.0, 10.0, 1.0],
+}
+
+
+@pytest.fixture
+def geom():
+    return bumplot.compute_bump_geometry("x", ["y1", "y2", "y3"], pd.DataFrame(DATA))
+
+
+def test_to_svg(geom):
+    plt.close("all")
+    svg = bumplot.to_svg(
+        geom,
+        opts={
+            "y2": bumplot.opts(
+                line_color="red", line_width=3, line_alpha=0.5, zorder=1
+            ),
+            "y3": bumplot.opts(marker_size=100, marker_edgecolor="black"),
+        },
+        colors=["blue"],
+    )
+
+    assert plt.get_fignums() == []
+    root = ET.fromstring(svg)
+    texts = [text.text for text in root.iter(f"{SVG}text")]
+    assert texts == ["a", "b", "c", "d", "1", "2", "3"]
+
+    groups = {
+        group.find(f"{SVG}title").text: group.findall(f"{SVG}path")
+        for group in root.iter(f"{SVG}g")
+        if group.find(f"{SVG}title") is not None
+    }
+    # series with a higher zorder are drawn last
+    assert list(groups) == ["y1", "y3", "y2"]
+
+    line, markers = groups["y1"]
+    assert line.get("stroke") == "#0000ff"
+    # the missing period splits the curve and has no marker
+    assert line.get("d").count("M") == 1 and line.get("d").count("C") == 1
+    assert markers.get("d").count("M") == 3
+
+    line, markers = groups["y2"]
+    assert line.get("stroke") == "#ff0000"
+    assert line.get("stroke-width") == "3"
+    assert line.get("stroke-opacity") == "0.5"
+    assert line.get("d").count("C") == 3
+
+    _, edges, faces = groups["y3"]
+    assert edges.get("stroke") == "#000000"
+    assert float(edges.get("stroke-width")) > float(faces.get("stroke-width"))
+
+
+def test_to_json(geom):
+    document = json.loads(bumplot.to_json(geom, styles={"line_width": [1, 2, 3]}))
+
+    assert document["x_tick_labels"] == ["a", "b", "c", "d"]
+    assert [series["name"] for series in document["series"]] == ["y1", "y2", "y3"]
+    assert [series["line"]["width"] for series in document["series"]] == [1, 2, 3]
+    assert len(document["series"][0]["points"]) == 3
+    assert document["series"][1]["d"].startswith("M")
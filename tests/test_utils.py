@@ -0,0 +1,272 @@
+import narwhals as nw
+import numpy as np
+import pandas as pd
+import polars as pl
+import pytest
+
+from bumplot._utils import (
+    _encode_x,
+    _rank_long,
+    _rank_matrix,
+    _rank_periods,
+    _to_matrix,
+)
+
+
+@pytest.mark.parametrize("backend", [pd, pl])
+@pytest.mark.parametrize(
+    "x",
+    [[3, 1, 2, 5, 4], ["b", "a", "e", "d", "c"]],
+)
+def test_rank_matrix_engines_match(backend, x):
+    df = backend.DataFrame(
+        {
+            "x": x,
+            "y1": [7, 2, 2, 5, 5],
+            "y2": [3, 2, 1, 5, 4],
+            "y3": [5.0, 2.0, 10.0, 5.0, 3.5],
+        }
+    )
+    y_columns = ["y1", "y2", "y3"]
+
+    x_numpy, ranks_numpy = _rank_matrix(df, "x", y_columns, engine="numpy")
+    x_narwhals, ranks_narwhals = _rank_matrix(df, "x", y_columns, engine="narwhals")
+
+    if isinstance(x[0], str):
+        # Categorical periods keep their order, except that the pandas pivot
+        # sorts them, so align both results on x first
+        assert x_numpy.tolist() == x
+        order_numpy, order_narwhals = np.argsort(x_numpy), np.argsort(x_narwhals)
+        x_numpy, ranks_numpy = x_numpy[order_numpy], ranks_numpy[:, order_numpy]
+        x_narwhals = x_narwhals[order_narwhals]
+        ranks_narwhals = ranks_narwhals[:, order_narwhals]
+    else:
+        assert x_numpy.tolist() == sorted(x)
+        assert ranks_numpy.flags.c_contiguous
+    assert x_numpy.tolist() == x_narwhals.tolist()
+    np.testing.assert_array_equal(ranks_numpy, ranks_narwhals)
+
+
+@pytest.mark.parametrize("backend", [pd, pl])
+@pytest.mark.parametrize("engine", ["numpy", "narwhals"])
+@pytest.mark.parametrize("chunk_size", [None, 2])
+def test_rank_matrix_sorts_numeric_periods(backend, engine, chunk_size):
+    df = backend.DataFrame({"x": [3, 1, 2], "y1": [1, 2, 3], "y2": [3, 1, 2]})
+
+    x_values, ranks = _rank_matrix(
+        df, "x", ["y1", "y2"], engine=engine, chunk_size=chunk_size
+    )
+
+    assert x_values.tolist() == [1, 2, 3]
+    assert ranks.tolist() == [[1, 1, 2], [2, 2, 1]]
+
+
+@pytest.mark.parametrize("x", [[1, 2, 1], ["a", "b", "a"]])
+@pytest.mark.parametrize("chunk_size", [None, 2])
+def test_rank_matrix_duplicated_x(x, chunk_size):
+    df = pd.DataFrame({"x": x, "y1": [1, 2, 3], "y2": [3, 1, 2]})
+
+    with pytest.raises(ValueError, match="at most once"):
+        _rank_matrix(df, "x", ["y1", "y2"], chunk_size=chunk_size)
+
+
+def test_rank_periods_ties_follow_series_order():
+    values = np.array([[2, 2, 2], [1, 3, 3], [0.5, -1, 0.5]]).T
+
+    assert _rank_periods(values).T.tolist() == [[1, 2, 3], [3, 1, 2], [1, 3, 2]]
+
+
+@pytest.mark.parametrize("backend", [pd, pl])
+@pytest.mark.parametrize("engine", ["numpy", "narwhals"])
+@pytest.mark.parametrize("missing", [None, np.nan])
+def test_rank_matrix_missing_values(backend, engine, missing):
+    df = backend.DataFrame(
+        {"x": [1, 2], "y1": [1.0, missing], "y2": [2.0, 1.0], "y3": [0.0, 3.0]},
+        **({"nan_to_null": False} if backend is pl else {}),
+    )
+
+    x_values, ranks = _rank_matrix(df, "x", ["y1", "y2", "y3"], engine=engine)
+
+    assert x_values.tolist() == [1, 2]
+    assert ranks[:, 0].tolist() == [2, 1, 3]
+    assert np.isnan(ranks[0, 1].astype(float))
+    assert ranks[1:, 1].tolist() == [2, 1]
+
+
+def test_rank_matrix_unknown_engine():
+    with pytest.raises(ValueError, match="engine must be"):
+        _rank_matrix(pd.DataFrame({"x": [1], "y": [1]}), "x", ["y"], engine="foo")
+
+
+@pytest.mark.parametrize("engine", ["numpy", "narwhals"])
+def test_rank_matrix_lazy_frame(engine):
+    data = {
+        "x": [1, 2, 3],
+        "y1": [7, 2, 2],
+        "y2": [3, 2, 1],
+        "unused": ["a", "b", "c"],
+    }
+
+    x_lazy, ranks_lazy = _rank_matrix(pl.LazyFrame(data), "x", ["y1", "y2"], engine)
+    x_eager, ranks_eager = _rank_matrix(pl.DataFrame(data), "x", ["y1", "y2"], engine)
+
+    assert x_lazy.tolist() == x_eager.tolist() == [1, 2, 3]
+    np.testing.assert_array_equal(ranks_lazy, ranks_eager)
+
+
+@pytest.mark.parametrize("engine", ["numpy", "narwhals"])
+@pytest.mark.parametrize("chunk_size", [None, 2])
+def test_rank_matrix_duckdb(engine, chunk_size):
+    duckdb = pytest.importorskip("duckdb")
+    # Literals such as 3.0 are DECIMAL columns in DuckDB
+    relation = duckdb.sql(
+        "select * from (values (1, 7.0, 3.0), (2, 2.0, 2.5), (3, 1.0, 4.0))"
+        " t(x, y1, y2) order by x"
+    )
+
+    x_values, ranks = _rank_matrix(
+        relation, "x", ["y1", "y2"], engine=engine, chunk_size=chunk_size
+    )
+
+    order = np.argsort(x_values)
+    assert x_values[order].tolist() == [1, 2, 3]
+    assert ranks[:, order].tolist() == [[1, 2, 2], [2, 1, 1]]
+
+
+@pytest.mark.parametrize("engine", ["numpy", "narwhals"])
+def test_rank_long_duckdb(engine):
+    duckdb = pytest.importorskip("duckdb")
+    relation = duckdb.sql(
+        "select * from (values (1, 'a', 7.0), (1, 'b', 3.0), (2, 'a', 2.0),"
+        " (2, 'b', 2.5)) t(x, entity, value)"
+    )
+
+    x_values, entities, ranks = _rank_long(
+        relation, "x", "entity", "value", entities=["a", "b"], engine=engine
+    )
+
+    assert x_values.tolist() == [1, 2]
+    assert ranks.tolist() == [[1, 2], [2, 1]]
+
+
+@pytest.mark.parametrize("backend", [pd, pl])
+@pytest.mark.parametrize("engine", ["numpy", "narwhals"])
+@pytest.mark.parametrize("chunk_size", [1, 3, 64])
+def test_rank_matrix_chunked(backend, engine, chunk_size):
+    rng = np.random.default_rng(0)
+    data = {"x": np.arange(20), **{f"y{i}": rng.random(20) for i in range(5)}}
+    data["y2"][7] = np.nan
+    df = backend.DataFrame(data)
+    names = [f"y{i}" for i in range(5)]
+
+    x_values, ranks = _rank_matrix(df, "x", names, engine="numpy")
+    x_chunked, ranks_chunked = _rank_matrix(
+        df, "x", names, engine=engine, chunk_size=chunk_size, workers=2
+    )
+
+    assert x_chunked.tolist() == x_values.tolist()
+    assert ranks_chunked.flags.c_contiguous
+    np.testing.assert_array_equal(ranks_chunked, ranks)
+
+
+def test_rank_matrix_chunked_invalid_size():
+    with pytest.raises(ValueError, match="chunk_size"):
+        _rank_matrix(pd.DataFrame({"x": [1], "y": [1]}), "x", ["y"], chunk_size=0)
+
+
+@pytest.mark.parametrize("backend", [pd, pl])
+def test_to_matrix_rows_are_contiguous_views(backend):
+    df = nw.from_native(
+        backend.DataFrame({"y1": [1.0, 2.0, 3.0], "y2": [4.0, 5.0, 6.0]}),
+        eager_only=True,
+    )
+
+    matrix = _to_matrix(df, ["y1", "y2"])
+
+    assert matrix.flags.c_contiguous
+    assert matrix.tolist() == [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]
+
+
+def test_to_matrix_zero_copy_pandas_block():
+    native = pd.DataFrame(np.arange(6.0).reshape(2, 3).T, columns=["y1", "y2"])
+
+    matrix = _to_matrix(nw.from_native(native, eager_only=True), ["y1", "y2"])
+
+    assert np.shares_memory(matrix, native.to_numpy())
+
+
+@pytest.mark.parametrize("backend", [pd, pl])
+@pytest.mark.parametrize("engine", ["numpy", "narwhals"])
+def test_rank_long_matches_wide(backend, engine):
+    wide = {
+        "x": [3, 1, 2],
+        "y1": [7, 2, 2],
+        "y2": [3, 2, 1],
+        "y3": [5, 4, 10],
+    }
+    long = backend.DataFrame(
+        {
+            "x": [x for x in wide["x"] for _ in range(3)],
+            "entity": ["y1", "y2", "y3"] * 3,
+            "value": [wide[e][i] for i in range(3) for e in ["y1", "y2", "y3"]],
+        }
+    )
+
+    x_values, entities, ranks = _rank_long(long, "x", "entity", "value", engine=engine)
+    x_wide, ranks_wide = _rank_matrix(pd.DataFrame(wide), "x", ["y1", "y2", "y3"])
+
+    assert entities == ["y1", "y2", "y3"]
+    assert x_values.tolist() == [1, 2, 3]
+    np.testing.assert_array_equal(ranks, ranks_wide[:, np.argsort(x_wide)])
+
+
+def test_rank_long_missing_cells_and_subset():
+    long = pd.DataFrame(
+        {
+            "x": ["a", "a", "a", "b", "b"],
+            "entity": ["u", "v", "w", "v", "w"],
+            "value": [1, 2, 3, 5, 4],
+        }
+    )
+
+    x_values, entities, ranks = _rank_long(
+        long, "x", "entity", "value", entities=["w", "u"]
+    )
+
+    assert x_values.tolist() == ["a", "b"]
+    assert entities == ["w", "u"]
+    assert ranks[0].tolist() == [1, 1]
+    assert ranks[1, 0] == 2
+    assert np.isnan(ranks[1, 1])
+
+
+def test_rank_long_duplicated_pairs():
+    long = pd.DataFrame({"x": [1, 1], "entity": ["u", "u"], "value": [1, 2]})
+
+    with pytest.raises(ValueError, match="at most once"):
+        _rank_long(long, "x", "entity", "value")
+
+
+def test_encode_x():
+    x_values, categories = _encode_x(np.array(["b", "a", "b", "c"]))
+    assert x_values.tolist() == [0, 1, 0, 2]
+    assert list(categories) == ["b", "a", "c"]
+
+    # Extending the categories of a previous call
+    x_values, categories = _encode_x(np.array(["d", "a"]), categories)
+    assert x_values.tolist() == [3, 1]
+    assert list(categories) == ["b", "a", "c", "d"]
+
+    dates = np.array(["2024-01-02", "2024-01-01", "2024-01-02"], dtype="M8[ns]")
+    x_values, categories = _encode_x(dates)
+    assert x_values.tolist() == [0, 1, 0]
+    assert list(categories) == [dates[0], dates[1]]
+
+    # Values that can't be sorted together
+    x_values, categories = _encode_x(np.array(["a", None, "a"], dtype=object))
+    assert x_values.tolist() == [0, 1, 0]
+    assert list(categories) == ["a", None]
+
+    x_values, categories = _encode_x(np.array([3, 1, 2]))
+    assert x_values.tolist() == [3, 1, 2]
+    assert categories is None